@@ -29,26 +29,20 @@ def _design_mode_enabled() -> bool:
     ss_flag = bool(st.session_state.get("dev_design_mode"))
     return qp_flag or env_flag or ss_flag
 
+# Span timings for this rerun (design mode only; see senior_nav/runtime/profiler.py)
+from senior_nav.runtime import profiler
+profiler.begin_rerun(_design_mode_enabled())
+
 # ==========================================
 # Guard: exactly one active ./pages directory
 # ==========================================
-# in app.py, replace _enforce_single_pages_dir with this version:
-
-
 def _enforce_single_pages_dir() -> None:
-    from pathlib import Path
-    roots = []
-    for d in Path(".").glob("**/pages"):
-        sd = str(d.resolve()).replace("\\","/").lower()
-        if not d.is_dir(): 
-            continue
-        if ("_graveyard" in sd) or ("/.venv/" in sd) or ("/.git/" in sd):
-            continue
-        if not any(d.rglob("*.py")):
-            continue
-        roots.append(d)
+    # Process-level index: pruned walk at startup, rebuilt only when a pages
+    # directory's mtime changes (see senior_nav/runtime/layout.py).
+    from senior_nav.runtime.layout import project_layout
+    roots = list(project_layout().pages_dirs)
     expected = (Path.cwd() / "pages").resolve()
-    if len(roots) != 1 or roots[0].resolve() != expected:
+    if len(roots) != 1 or roots[0] != expected:
         raise RuntimeError(f"❌ Invalid pages directories detected: {roots}\n"
                            f"Expected exactly one at {expected}")
 _enforce_single_pages_dir()
@@ -91,73 +85,147 @@ if _debug_enabled():
 # Theme import with safe fallback
 # ===============================
 try:
-    from ui.theme import inject_theme  # preferred path
+    from ui.theme import theme_css  # preferred path
 except Exception:
-    def inject_theme() -> None:
-        st.markdown(
-            """
+    def theme_css() -> str:
+        return """
             <style>
               .block-container{max-width:1160px;padding-top:8px;}
               header[data-testid="stHeader"]{background:transparent;}
               footer{visibility:hidden;}
             </style>
-            """,
-            unsafe_allow_html=True,
-        )
+            """
 
 # ==========================================
 # Global CSS injection (theme comes in last)
 # ==========================================
 def _inject_global_css() -> None:
-    css_path = Path("static/style.css")
-    if css_path.exists():
-        try:
-            extra = css_path.read_text(encoding="utf-8").strip()
-        except Exception:
-            extra = css_path.read_bytes().decode(errors="ignore").strip()
-        v = int(css_path.stat().st_mtime)
-        st.markdown(f"<style>{extra}</style><!-- v:{v} -->", unsafe_allow_html=True)
-    inject_theme()
+    # static/style.css + theme as one minified block, cached per process and
+    # invalidated on mtime; pages re-injecting the theme become no-ops.
+    from senior_nav.runtime import styles
+    styles.begin_rerun()
+    styles.inject_stylesheet(styles.global_bundle([theme_css()]))
 _inject_global_css()
 
 # ==========================================
 # Pre-flight syntax check for page modules
 # (kept: catches bad edits before navigation)
 # ==========================================
+@profiler.profiled("_syntax_preflight")
 def _syntax_preflight(paths=("pages",), stop_on_error=True):
-    import pathlib, io, tokenize
-    errors = []
-    for root in paths:
-        for p in pathlib.Path(root).rglob("*.py"):
-            try:
-                src = p.read_text(encoding="utf-8")
-            except Exception as e:
-                errors.append((p, 0, 0, f"read error: {e}", ""))
-                continue
-            try:
-                tokenize.generate_tokens(io.StringIO(src).readline)
-                compile(src, str(p), "exec", dont_inherit=True)
-            except SyntaxError as e:
-                errors.append((p, e.lineno or 0, e.offset or 0, e.msg, e.text or ""))
-            except Exception as e:
-                errors.append((p, 0, 0, f"{type(e).__name__}: {e}", ""))
-    if errors:
+    # Verdicts are cached per file (mtime/size/hash) for the whole process and
+    # persisted in .sn_cache/, so only new or edited pages get compiled.
+    from senior_nav.runtime.layout import project_layout
+    from senior_nav.runtime.preflight import syntax_preflight
+    files = project_layout().sorted_page_files() if tuple(paths) == ("pages",) else None
+    report = syntax_preflight(paths, files)
+    st.session_state["_preflight_report"] = report
+    if report.errors:
         st.error("Syntax/parse error(s) found. Fix these before running pages.")
-        for p, line, col, msg, txt in errors:
-            pointer = " " * (max((col or 1) - 1, 0)) + "^" if txt else ""
-            st.write(f"**{p}**")
-            st.code(f"line {line}, col {col}: {msg}\n{(txt or '').rstrip()}\n{pointer}")
+        for err in report.errors:
+            pointer = " " * (max((err.col or 1) - 1, 0)) + "^" if err.text else ""
+            st.write(f"**{err.path}**")
+            st.code(f"line {err.line}, col {err.col}: {err.msg}\n{(err.text or '').rstrip()}\n{pointer}")
             st.markdown("---")
         if stop_on_error:
             st.stop()
 _syntax_preflight()
 
+# ==========================================
+# GCP outcome cube (see guided_care_plan/cube.py)
+# ==========================================
+@st.cache_resource(show_spinner=False)
+def _gcp_cube_builder():
+    # The cube is a build artifact in .sn_cache/. One background thread per
+    # process builds it if a deploy step did not; lookups use the engine until
+    # it is ready.
+    import threading
+
+    def build() -> None:
+        from guided_care_plan.cube import ensure_cube
+        ensure_cube()
+
+    thread = threading.Thread(target=build, name="gcp-cube-build", daemon=True)
+    thread.start()
+    return thread
+_gcp_cube_builder()
+
 # ==========================================
 # Session bootstrap (prototype auth flag)
 # ==========================================
 if "is_authenticated" not in st.session_state:
     st.session_state.is_authenticated = False
 
+# ==========================================
+# Session persistence (see senior_nav/runtime/sessions.py)
+# ==========================================
+import re
+import secrets
+from senior_nav.runtime import sessions
+
+_SID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+
+
+def _session_token() -> str:
+    """This session's token; the first call restores any state saved under it.
+
+    An ``sn_sid`` cookie is reused only when the store already holds state
+    for it, so a planted or guessed token never becomes the session's key.
+    Otherwise a new token is minted. The token never goes in the URL.
+    """
+    token = st.session_state.get("_sid")
+    if token:
+        return token
+    try:
+        cookie = st.context.cookies.get("sn_sid")
+    except Exception:
+        cookie = None
+    store = sessions.default_store()
+    if cookie and store is not None and _SID_PATTERN.match(str(cookie)):
+        data = store.load(str(cookie))
+        if data:
+            sessions.restore(st.session_state, data)
+            token = str(cookie)
+    st.session_state["_sid"] = token = token or secrets.token_urlsafe(32)
+    return token
+
+
+def _rotate_session_token() -> None:
+    """New token on sign-in/out; the old one's saved state is dropped."""
+    store = sessions.default_store()
+    old = st.session_state.pop("_sid", None)
+    if store is not None and old:
+        store.discard(old)
+    st.session_state["_sid"] = secrets.token_urlsafe(32)
+    st.session_state.pop("_sid_cookie", None)
+
+
+def _set_session_cookie(token: str) -> None:
+    """Write the ``sn_sid`` cookie from the browser (once per token)."""
+    if st.session_state.get("_sid_cookie") == token:
+        return
+    st.iframe(
+        "<script>const d = window.parent.document;"
+        f"d.cookie = 'sn_sid={token}; Path=/; Max-Age={sessions.TTL_DAYS * 86400}; SameSite=Strict'"
+        " + (window.parent.location.protocol === 'https:' ? '; Secure' : '');</script>",
+        height=1,
+    )
+    st.session_state["_sid_cookie"] = token
+
+
+def _persist_session() -> None:
+    """Queue this session's namespaces for the write-behind store."""
+    store = sessions.default_store()
+    if store is None:
+        return
+    token = _session_token()
+    store.save(token, sessions.snapshot(st.session_state))
+    _set_session_cookie(token)
+
+
+if sessions.default_store() is not None:
+    _session_token()
+
 # ==========================================
 # Design mode helpers
 # ==========================================
@@ -177,18 +245,6 @@ def _force_welcome_once() -> None:
             pass
     st.rerun()
 
-# ==========================================
-# Page registration helpers
-# ==========================================
-def ensure_page(path: str, title: str, icon: str, default: bool = False):
-    p = Path(path)
-    if not p.exists():
-        return None
-    return (
-        st.Page(path, title=title, icon=icon, default=True)
-        if default else st.Page(path, title=title, icon=icon)
-    )
-
 # ==========================================
 # Pages to register (controls nav order)
 # ==========================================
@@ -240,12 +296,10 @@ INTENDED = [
     ("pages/my_account.py", "My Account", "👤", False),
 ]
 
-# Build the Page objects (ignore missing silently)
-pages = []
-for path, title, icon, default in INTENDED:
-    page = ensure_page(path, title, icon, default)
-    if page:
-        pages.append(page)
+# Resolved once per process (missing files dropped silently); each rerun only
+# builds fresh Page objects from the cached specs.
+from senior_nav.runtime.registry import page_registry
+pages = page_registry(INTENDED).st_pages()
 
 # Kick the session back to Welcome on first load (disabled in design mode)
 _force_welcome_once()
@@ -253,7 +307,11 @@ _force_welcome_once()
 # Render navigation (always sidebar, expanded)
 if pages:
     pg = st.navigation(pages, position="sidebar", expanded=True)
-    pg.run()
+    with profiler.span(f"pg.run {pg.title}"), profiler.sampled_profile(pg.title):
+        try:
+            pg.run()
+        finally:  # also when the page ends the run with st.rerun / st.switch_page
+            _persist_session()
 else:
     st.error("No pages available. Check file paths in app.py.")
 
@@ -276,6 +334,39 @@ with st.sidebar:
         help="Prints a line in the terminal whenever a /pages/ module is imported.",
         disabled=True,  # state is controlled by query param/env for reproducibility
     )
+    if _design_mode_enabled():
+        report = st.session_state.get("_preflight_report")
+        if report is not None:
+            st.caption(
+                f"Preflight: {report.elapsed_ms:.1f} ms this rerun "
+                f"({report.compiled} of {report.checked} files compiled)"
+            )
+        from senior_nav.runtime.styles import rerun_stats
+        css = rerun_stats()
+        if css:
+            st.caption(
+                f"CSS: {css['emitted_bytes']:,} bytes in {css['blocks']} block(s), "
+                f"{css['saved_bytes']:,} bytes saved this rerun"
+            )
+        store = sessions.default_store()
+        if store is not None:
+            saved = store.stats
+            st.caption(
+                f"Sessions: {saved.saves:,} saves, {saved.unchanged:,} unchanged, "
+                f"{saved.rows_written:,} rows in {saved.transactions:,} writes"
+            )
+        spans = profiler.summary()
+        if spans:
+            with st.expander("Profiler (p50 / p95 per span)"):
+                st.dataframe(spans, hide_index=True)
+                captures = profiler.profiles()
+                if captures:
+                    last = captures[-1]
+                    st.caption(
+                        f"cProfile, rerun {last.rerun} ({last.label}, {last.elapsed_ms:.0f} ms); "
+                        f"sampled every {profiler.SAMPLE_EVERY} profiled reruns"
+                    )
+                    st.code(last.stats, language="text")
     st.markdown("---")
     # Prototype auth toggle
     st.caption("Authentication")
@@ -283,9 +374,13 @@ with st.sidebar:
         st.success("Signed in")
         if st.button("Log out", key="sidebar_logout"):
             st.session_state.is_authenticated = False
+            if sessions.default_store() is not None:
+                _rotate_session_token()
             st.rerun()
     else:
         st.info("Not signed in")
         if st.button("Log in", key="sidebar_login"):
             st.session_state.is_authenticated = True
+            if sessions.default_store() is not None:
+                _rotate_session_token()
             st.rerun()
@@ -3,18 +3,28 @@ cp_state.py — shared state + helpers for Cost Planner v2
 
 - Stores everything under st.session_state["cp"] (single namespace).
 - Path-based getters/setters: cp_get("income.income_total"), cp_set("benefits.benefits_total", 1200)
-- Numeric coercion with currency-safe parsing (_to_num)
+- Numeric coercion with currency-safe parsing (_to_num, from senior_nav.core.cp_derive)
+- Typed per-module state generated from contracts/cost_planner_v2_contract.json
+  (__slots__ dataclasses that behave like dicts, numbers coerced on write;
+  None and blank input stay None so "not entered" differs from 0)
 - Derived values: monthly_all_in, gap, runway_months
 - Lightweight validation flags for Expert Review
 
 This is intentionally dependency-light so pages can import it directly:
     from cost_planner_v2.cp_state import *
 """
-
 from __future__ import annotations
-from typing import Any, Dict, Tuple
+from collections.abc import Mapping, MutableMapping
+from dataclasses import field, make_dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+import json
 import math
 
+from senior_nav.core.cp_derive import DERIVE_INPUTS, _to_num, compute_derived  # noqa: F401 (re-exported)
+from senior_nav.runtime.profiler import profiled
+
 try:
     import streamlit as st
 except Exception:  # allow offline compile/tests
@@ -27,10 +37,30 @@ except Exception:  # allow offline compile/tests
 # Namespace bootstrap & structure
 # -------------------------------
 
+# Set in a namespace once cp_ensure() has shaped it. It lives in the namespace
+# (per session, gone with it) and is not persisted (sessions.DERIVED), so a
+# restored or replaced "cp" is shaped again.
+SHAPED_KEY = "_shaped"
+
+
 def cp_ensure() -> Dict[str, Any]:
-    """Ensure and return the cost planner namespace."""
+    """Ensure and return the cost planner namespace.
+
+    Module blocks are upgraded to their typed classes once per namespace; after
+    that every cp_get/cp_set costs one session_state lookup. Only blocks whose
+    keys all belong to the contract module are converted: the wizard keeps
+    its own "qualifiers" block in the same namespace.
+    """
     cp = st.session_state.setdefault("cp", {})
-    # minimal shape so pages can read/write safely
+    if cp.get(SHAPED_KEY):
+        return cp
+    for module, cls in MODULE_TYPES.items():
+        block = cp.get(module)
+        if block is None:
+            cp[module] = cls()
+        elif type(block) is dict and block.keys() <= cls._FIELDS:
+            cp[module] = typed_module(module, block)
+    # minimal shape so pages can read/write safely (no-ops for typed modules)
     cp.setdefault("qualifiers", {
         "planner_mode": "Plan",
         "has_partner": "none",                # none | unified | split
@@ -49,6 +79,7 @@ def cp_ensure() -> Dict[str, Any]:
     cp.setdefault("home_mods", {"mods_monthly_total": 0})
     cp.setdefault("assets", {"assets_total_effective": 0})
     cp.setdefault("derived", {})
+    cp[SHAPED_KEY] = True
     return cp
 
 
@@ -56,7 +87,9 @@ def cp_ensure() -> Dict[str, Any]:
 # Path utils (a.b.c)
 # -----------------
 
+@lru_cache(maxsize=1024)
 def _split(path: str) -> Tuple[str, ...]:
+    """Parse a dotted path once; pages reuse a small set of literal paths."""
     return tuple([p for p in path.replace("[", ".").replace("]", "").split(".") if p])
 
 def cp_get(path: str, default: Any = None) -> Any:
@@ -64,7 +97,7 @@ def cp_get(path: str, default: Any = None) -> Any:
     cp = cp_ensure()
     cur: Any = cp
     for part in _split(path):
-        if isinstance(cur, dict) and part in cur:
+        if isinstance(cur, Mapping) and part in cur:
             cur = cur[part]
         else:
             return default
@@ -76,37 +109,149 @@ def cp_set(path: str, value: Any) -> None:
     parts = _split(path)
     cur: Any = cp
     for part in parts[:-1]:
-        if not isinstance(cur, dict):
+        if not isinstance(cur, MutableMapping):
             return
         cur = cur.setdefault(part, {})
-    if isinstance(cur, dict):
+    if isinstance(cur, MutableMapping):
         cur[parts[-1]] = value
 
 
-# ----------------------
-# Numeric coercion (safe)
-# ----------------------
+# ------------------------------------------
+# Typed modules (generated from the contract)
+# ------------------------------------------
+
+CONTRACT_PATH = Path(__file__).resolve().parents[1] / "contracts" / "cost_planner_v2_contract.json"
+
+# Fields cp_ensure() has always seeded that the contract does not list yet.
+SUPPLEMENTAL_FIELDS: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "home": {
+        "home_monthly_total": {"type": "int", "default": 0},
+        "sale_price":         {"type": "int", "default": 0},
+    },
+    "liquidity": {"keeping_car": {"type": "bool", "default": True}},
+}
+_FIELD_TYPES = {"int": float, "float": float, "bool": bool, "enum": str, "str": str}
+_NUMERIC_TYPES = ("int", "float")
+
 
-def _to_num(x: Any, default: float | int = 0) -> float:
-    """Coerce common UI strings to numbers. '$1,200' -> 1200.0"""
+class ModuleState(MutableMapping):
+    """
+    Dict-compatible base for the generated per-module classes. Contract fields
+    live in slots (numeric ones coerced with _to_num on every write, except
+    None and blank strings, which stay None); any other key a page stores
+    goes to a lazily created `_extra` dict.
+    """
+    __slots__ = ()
+    _FIELDS: frozenset = frozenset()
+    _FIELD_ORDER: Tuple[str, ...] = ()
+    _NUMERIC: frozenset = frozenset()
+    _DEFAULTS: Dict[str, Any] = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._NUMERIC and value is not None:
+            value = _to_num(value) if not isinstance(value, str) or value.strip() else None
+        object.__setattr__(self, name, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELDS:
+            return getattr(self, key)
+        extra = self._extra
+        if extra is not None and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._FIELDS:
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._FIELDS:
+            setattr(self, key, self._DEFAULTS[key])  # contract fields always exist
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._FIELDS or (self._extra is not None and key in self._extra)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._FIELD_ORDER
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(self._FIELD_ORDER) + len(self._extra or ())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def clear(self) -> None:
+        for name in self._FIELD_ORDER:
+            setattr(self, name, self._DEFAULTS[name])
+        self._extra = None
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+
+
+def build_module_types(contract: Mapping[str, Any]) -> Dict[str, type]:
+    """One __slots__ dataclass per contract module (plus SUPPLEMENTAL_FIELDS)."""
+    types: Dict[str, type] = {}
+    for module, spec in contract.get("modules", {}).items():
+        specs = dict(spec.get("fields", {}))
+        specs.update(SUPPLEMENTAL_FIELDS.get(module, {}))
+        defaults = {name: meta.get("default") for name, meta in specs.items()}
+        cls = make_dataclass(
+            "".join(part.title() for part in module.split("_")) + "State",
+            [(name, _FIELD_TYPES.get(meta.get("type"), Any), field(default=defaults[name]))
+             for name, meta in specs.items()]
+            + [("_extra", Optional[Dict[str, Any]], field(default=None, repr=False))],
+            bases=(ModuleState,),
+            namespace={
+                "_FIELDS": frozenset(specs),
+                "_FIELD_ORDER": tuple(specs),
+                "_NUMERIC": frozenset(n for n, meta in specs.items() if meta.get("type") in _NUMERIC_TYPES),
+                "_DEFAULTS": defaults,
+            },
+            repr=False,
+            eq=False,
+            slots=True,
+        )
+        cls.__module__ = __name__  # picklable by qualified name
+        types[module] = cls
+    return types
+
+
+def _load_contract() -> Dict[str, Any]:
     try:
-        if x is None:
-            return float(default)
-        if isinstance(x, (int, float)):
-            return float(x)
-        if isinstance(x, dict):
-            # if a dict slipped through (e.g., accidental sub-obj), try common keys
-            for k in ("value", "amount", "total"):
-                if k in x:
-                    return _to_num(x[k], default)
-            return float(default)
-        s = str(x).strip()
-        if not s:
-            return float(default)
-        s = s.replace(",", "").replace("$", "")
-        return float(s)
-    except Exception:
-        return float(default)
+        return json.loads(CONTRACT_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}  # no contract -> plain dict modules, as before
+
+
+MODULE_TYPES: Dict[str, type] = build_module_types(_load_contract())
+globals().update({cls.__name__: cls for cls in MODULE_TYPES.values()})
+
+
+def typed_module(module: str, values: Mapping[str, Any]) -> Any:
+    """Convert a plain dict block into its typed class (unknown modules pass through)."""
+    cls = MODULE_TYPES.get(module)
+    if cls is None:
+        return values
+    block = cls()
+    block.update(values)
+    return block
+
+
+def cp_to_dict(cp: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+    """Plain nested dicts (e.g. for json.dumps) of the cp namespace."""
+    cp = cp_ensure() if cp is None else cp
+    return {k: dict(v) if isinstance(v, ModuleState) else v for k, v in cp.items() if k != SHAPED_KEY}
 
 
 # -----------------------------
@@ -144,7 +289,26 @@ def set_monthly_care_cost(v: Any) -> None:
 # ----------------------------
 # Derived math (single source)
 # ----------------------------
+# DERIVE_INPUTS, _to_num and compute_derived() live in senior_nav.core.cp_derive
+# so headless jobs can use them without Streamlit.
+
+# Every input is module.field, resolved once.
+_DERIVE_PATHS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (name,) + _split(path) for name, path in DERIVE_INPUTS.items()  # type: ignore[misc]
+)
+
 
+def derive_inputs() -> Dict[str, float]:
+    """Numeric inputs for derive(), coerced from the cp namespace."""
+    cp = cp_ensure()
+    values: Dict[str, float] = {}
+    for name, module, key in _DERIVE_PATHS:
+        block = cp.get(module)
+        values[name] = _to_num(block.get(key, 0) if isinstance(block, Mapping) else 0)
+    return values
+
+
+@profiled()
 def derive() -> Dict[str, Any]:
     """
     Compute unified derived values used by Timeline + Expert Review.
@@ -154,37 +318,7 @@ def derive() -> Dict[str, Any]:
     gap             = monthly_all_in - monthly_offsets
     runway_months   = (assets_total_effective + liquidity_total + sale_price_one_time) / gap  (if gap>0)
     """
-    cp = cp_ensure()
-
-    monthly_cost           = _to_num(cp_get("setting_cost.monthly_cost", 0))
-    other_monthly_total    = _to_num(cp_get("expenses.other_monthly_total", 0))
-    mods_monthly_total     = _to_num(cp_get("home_mods.mods_monthly_total", 0))
-    caregiver_cost         = _to_num(cp_get("caregiver.caregiver_cost", 0))
-
-    income_total           = _to_num(cp_get("income.income_total", 0))
-    benefits_total         = _to_num(cp_get("benefits.benefits_total", 0))
-    rm_monthly             = _to_num(cp_get("home.reverse_mortgage_monthly", 0))
-    rent_income_monthly    = _to_num(cp_get("home.home_monthly_total", 0))
-
-    assets_total_effective = _to_num(cp_get("assets.assets_total_effective", 0))
-    liquidity_total        = _to_num(cp_get("liquidity.liquidity_total", 0))
-    sale_price_one_time    = _to_num(cp_get("home.sale_price", 0))
-
-    monthly_all_in  = monthly_cost + other_monthly_total + mods_monthly_total + caregiver_cost
-    monthly_offsets = income_total + benefits_total + rm_monthly + rent_income_monthly
-    gap = monthly_all_in - monthly_offsets
-
-    if gap <= 0:
-        runway_months = math.inf  # unlimited
-    else:
-        runway_months = (assets_total_effective + liquidity_total + sale_price_one_time) / gap
-
-    derived = {
-        "monthly_all_in": round(monthly_all_in, 2),
-        "monthly_offsets": round(monthly_offsets, 2),
-        "gap": round(gap, 2),
-        "runway_months": float("inf") if math.isinf(runway_months) else round(runway_months, 1),
-    }
+    derived = compute_derived(derive_inputs())
     cp_set("derived", derived)
     return derived
 
@@ -235,7 +369,3 @@ def nav_to(page_path: str) -> None:
             st.experimental_rerun()
         except Exception:
             pass
-
-
-# Make sure namespace exists on import
-cp_ensure()
@@ -0,0 +1,131 @@
+"""
+projection.py — month-by-month cash-flow projection for Cost Planner v2
+
+derive() answers "what is the gap this month"; this module answers "how does
+that play out over the years". Costs and offsets escalate at per-category
+annual rates, one-time events (a home sale) land in their month, and the
+running balance shows when savings run out.
+
+Everything is computed as NumPy arrays over the horizon (360 months by
+default), so a projection costs well under a millisecond and is cheap enough
+to run on every rerun.
+
+    from cost_planner_v2.projection import project_cp
+    p = project_cp()            # reads st.session_state["cp"]
+    p.depletion_month           # first month the balance goes negative, or None
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from cost_planner_v2.cp_state import cp_get, derive_inputs, _to_num
+
+MAX_YEARS = 30
+
+# Annual escalation per category. Care costs historically outpace general
+# inflation; Social Security/pension income gets a modest COLA.
+DEFAULT_ESCALATION: Dict[str, float] = {
+    "care": 0.04,          # setting_cost.monthly_cost + caregiver.caregiver_cost
+    "expenses": 0.03,      # expenses.other_monthly_total
+    "home_mods": 0.0,      # home_mods.mods_monthly_total (fixed payments)
+    "income": 0.02,        # income.income_total
+    "benefits": 0.02,      # benefits.benefits_total
+    "home_income": 0.0,    # reverse mortgage + home_monthly_total
+}
+
+# derive_inputs() name -> (escalation category, +1 cost / -1 offset)
+_FLOWS: Tuple[Tuple[str, str, int], ...] = (
+    ("monthly_cost",        "care",        1),
+    ("caregiver_cost",      "care",        1),
+    ("other_monthly_total", "expenses",    1),
+    ("mods_monthly_total",  "home_mods",   1),
+    ("income_total",        "income",     -1),
+    ("benefits_total",      "benefits",   -1),
+    ("rm_monthly",          "home_income", -1),
+    ("rent_income_monthly", "home_income", -1),
+)
+
+
+@dataclass(frozen=True)
+class Projection:
+    """Monthly arrays over the horizon (index 0 = first month)."""
+    monthly_costs: np.ndarray
+    monthly_offsets: np.ndarray
+    net_draw: np.ndarray          # costs - offsets (negative = surplus)
+    balance: np.ndarray           # savings at the end of each month
+    depletion_month: Optional[int]  # 1-based month the balance first goes negative
+
+    @property
+    def months(self) -> int:
+        return len(self.balance)
+
+    @property
+    def runs_out(self) -> bool:
+        return self.depletion_month is not None
+
+    def yearly_balance(self) -> np.ndarray:
+        """End-of-year balances (for charts)."""
+        return self.balance[11::12]
+
+
+def project(
+    values: Mapping[str, float],
+    *,
+    months: int = MAX_YEARS * 12,
+    escalation: Optional[Mapping[str, float]] = None,
+    sale_month: int = 0,
+) -> Projection:
+    """
+    Project monthly cash flow from derive_inputs()-style values.
+
+    Category c in month m is scaled by (1 + rate_c) ** (m / 12). The home sale
+    (sale_price_one_time) is added to savings in `sale_month` (0 = available
+    up front, matching derive()).
+    """
+    months = max(1, min(int(months), MAX_YEARS * 12))
+    rates = dict(DEFAULT_ESCALATION)
+    rates.update(escalation or {})
+
+    years = np.arange(months, dtype=np.float64) / 12.0
+    growth: Dict[str, np.ndarray] = {}
+    costs = np.zeros(months)
+    offsets = np.zeros(months)
+    for name, category, sign in _FLOWS:
+        base = float(values.get(name, 0.0))
+        if not base:
+            continue
+        if category not in growth:
+            growth[category] = np.power(1.0 + float(rates.get(category, 0.0)), years)
+        if sign > 0:
+            costs += base * growth[category]
+        else:
+            offsets += base * growth[category]
+
+    net_draw = costs - offsets
+    inflows = -net_draw
+    sale_price = float(values.get("sale_price_one_time", 0.0))
+    if sale_price and 0 <= sale_month < months:
+        inflows[sale_month] += sale_price
+    start = float(values.get("assets_total_effective", 0.0)) + float(values.get("liquidity_total", 0.0))
+    balance = start + np.cumsum(inflows)
+
+    negative = np.flatnonzero(balance < 0)
+    depletion_month = int(negative[0]) + 1 if negative.size else None
+    return Projection(costs, offsets, net_draw, balance, depletion_month)
+
+
+def project_cp(
+    years: int = MAX_YEARS,
+    escalation: Optional[Mapping[str, float]] = None,
+) -> Projection:
+    """
+    Project the current cp namespace. Optional overrides live under
+    cp["projection"]: {"escalation": {...}, "sale_month": int}.
+    """
+    settings: Any = cp_get("projection", {}) or {}
+    rates = dict(settings.get("escalation", {}) if isinstance(settings, dict) else {})
+    rates.update(escalation or {})
+    sale_month = int(_to_num(settings.get("sale_month", 0) if isinstance(settings, dict) else 0))
+    return project(derive_inputs(), months=years * 12, escalation=rates, sale_month=sale_month)
@@ -0,0 +1,154 @@
+"""
+scenarios.py — side-by-side what-if scenarios for Cost Planner v2
+
+Families compare the same household across care settings (home vs assisted
+vs memory care, or any of the contract's care_setting values) without
+re-entering inputs. A scenario is the cp namespace plus a few dotted-path
+overrides:
+
+- fork() copy-on-writes the namespace: only the module dicts on an
+  overridden path are copied, every other branch is shared with the base,
+- ScenarioSet.compare() evaluates derive() math for all scenarios in one
+  NumPy pass and returns gap / monthly_all_in / runway rows.
+
+    from cost_planner_v2.scenarios import setting_scenarios
+    rows = setting_scenarios({"Home": 3100, "Assisted Living": 5200, "Memory Care": 7400}).compare()
+
+Fifty scenarios cost a handful of dict copies and one (50 x 11) array pass;
+session state is never deep-copied.
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import math
+
+import numpy as np
+
+from cost_planner_v2.cp_state import _split, cp_ensure
+from senior_nav.core.cp_derive import DERIVE_INPUTS, INPUT_NAMES, _to_num, compute_derived_batch  # noqa: F401
+
+_INPUT_PARTS: Tuple[Tuple[str, ...], ...] = tuple(_split(path) for path in DERIVE_INPUTS.values())
+_COLUMN = {parts: idx for idx, parts in enumerate(_INPUT_PARTS)}
+
+# Guided Care Plan settings -> contract qualifiers.care_setting values.
+GCP_CARE_SETTINGS: Dict[str, str] = {
+    "home": "Home",
+    "assisted": "Assisted Living",
+    "memory": "Memory Care",
+}
+
+
+# -------------------------
+# Copy-on-write namespaces
+# -------------------------
+
+def fork(base: Mapping[str, Any], overrides: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Return `base` with dotted-path overrides applied, copying only the dicts
+    along each overridden path. The base namespace is never mutated.
+    """
+    ns: Dict[str, Any] = dict(base)
+    copied = {()}
+    for path, value in overrides.items():
+        parts = _split(path)
+        cur = ns
+        for depth, part in enumerate(parts[:-1], start=1):
+            prefix = parts[:depth]
+            if prefix not in copied:
+                child = cur.get(part)
+                cur[part] = dict(child) if isinstance(child, Mapping) else {}
+                copied.add(prefix)
+            cur = cur[part]
+        cur[parts[-1]] = value
+    return ns
+
+
+def _read(ns: Mapping[str, Any], parts: Tuple[str, ...]) -> Any:
+    cur: Any = ns
+    for part in parts:
+        if isinstance(cur, Mapping) and part in cur:
+            cur = cur[part]
+        else:
+            return 0
+    return cur
+
+
+def namespace_inputs(ns: Mapping[str, Any]) -> np.ndarray:
+    """derive_inputs() for an arbitrary namespace, as a row in INPUT_NAMES order."""
+    return np.array([_to_num(_read(ns, parts)) for parts in _INPUT_PARTS])
+
+
+# -------------
+# Scenario sets
+# -------------
+
+@dataclass
+class ScenarioSet:
+    """Named override sets over one base namespace (insertion-ordered)."""
+    base: Mapping[str, Any]
+    overrides: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def add(self, name: str, overrides: Optional[Mapping[str, Any]] = None) -> "ScenarioSet":
+        self.overrides[name] = dict(overrides or {})
+        return self
+
+    def namespace(self, name: str) -> Dict[str, Any]:
+        """The scenario's copy-on-write namespace (shares untouched branches)."""
+        return fork(self.base, self.overrides[name])
+
+    def values(self) -> np.ndarray:
+        """(scenarios x inputs) matrix: the base row read once, overrides patched in."""
+        base_row = namespace_inputs(self.base)
+        matrix = np.tile(base_row, (len(self.overrides), 1))
+        for row, overrides in enumerate(self.overrides.values()):
+            reread = False
+            for path, value in overrides.items():
+                parts = _split(path)
+                column = _COLUMN.get(parts)
+                if column is not None:
+                    matrix[row, column] = _to_num(value)
+                elif any(p[:len(parts)] == parts for p in _INPUT_PARTS):
+                    reread = True  # a whole module was replaced
+            if reread:
+                matrix[row] = namespace_inputs(fork(self.base, overrides))
+        return matrix
+
+    def compare(self) -> List[Dict[str, Any]]:
+        """One row per scenario: monthly_all_in, monthly_offsets, gap, runway_months."""
+        if not self.overrides:
+            return []
+        derived = compute_derived_batch(self.values())
+        rows = []
+        for idx, name in enumerate(self.overrides):
+            runway = float(derived["runway_months"][idx])
+            rows.append({
+                "scenario": name,
+                "monthly_all_in": round(float(derived["monthly_all_in"][idx]), 2),
+                "monthly_offsets": round(float(derived["monthly_offsets"][idx]), 2),
+                "gap": round(float(derived["gap"][idx]), 2),
+                "runway_months": runway if math.isinf(runway) else round(runway, 1),
+            })
+        return rows
+
+
+def scenarios_cp() -> ScenarioSet:
+    """A ScenarioSet over the live cp namespace (read-only; nothing is copied)."""
+    return ScenarioSet(cp_ensure())
+
+
+def setting_scenarios(
+    monthly_costs: Mapping[str, float],
+    base: Optional[Mapping[str, Any]] = None,
+) -> ScenarioSet:
+    """
+    One scenario per care setting. Keys may be contract care_setting values
+    ("Memory Care") or Guided Care Plan settings ("memory").
+    """
+    scenarios = ScenarioSet(cp_ensure() if base is None else base)
+    for setting, cost in monthly_costs.items():
+        care_setting = GCP_CARE_SETTINGS.get(setting, setting)
+        scenarios.add(care_setting, {
+            "qualifiers.care_setting": care_setting,
+            "setting_cost.monthly_cost": cost,
+        })
+    return scenarios
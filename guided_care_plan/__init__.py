@@ -1,17 +1,49 @@
-"""Guided Care Plan shared utilities."""
+"""Guided Care Plan shared utilities.
 
-from .state import ensure_gcp_session, render_stepper, get_question_meta, QUESTION_ORDER
-from .engine import evaluate_guided_care
+Names are imported from their submodules on first use, so batch jobs that
+only evaluate answers (``engine``, ``batch``, ``cube``) do not load the
+Streamlit session helpers or the theme.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "ensure_gcp_session": "session",
+    "render_stepper": "session",
+    "current_audiencing_snapshot": "session",
+    "get_question_meta": "state",
+    "QUESTION_ORDER": "state",
+    "evaluate_guided_care": "engine",
+    "evaluate_guided_care_batch": "batch",
+    "lookup_guided_care": "cube",
+    "evaluate_guided_care_cached": "cache",
+    "EVALUATION_CACHE": "cache",
+}
 
-from ui.theme import inject_theme
 
 def ensure_gcp_theme():
+    from ui.theme import inject_theme
+
     inject_theme()
 
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "ensure_gcp_session",
     "render_stepper",
     "get_question_meta",
     "QUESTION_ORDER",
     "evaluate_guided_care",
+    "evaluate_guided_care_batch",
+    "lookup_guided_care",
+    "evaluate_guided_care_cached",
+    "EVALUATION_CACHE",
 ]
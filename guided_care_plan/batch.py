@@ -0,0 +1,480 @@
+"""Columnar (vectorized) evaluation for the Guided Care Plan.
+
+``evaluate_guided_care`` scores a single answers dict. Nightly re-scoring jobs
+hold thousands to millions of stored answer sets, so this module evaluates a
+whole batch at once: every answer column is encoded to small integer codes and
+the daily-life score, health & safety score and recommended setting are
+computed as NumPy array operations. List-valued outputs (safety flags,
+chronic conditions, DecisionTrace) are built once per distinct combination and
+broadcast back to rows.
+"""
+from __future__ import annotations
+
+
+from itertools import chain
+from typing import Dict, List, Mapping, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from .engine import (
+    CARE_INTENSITIES,
+    SENIOR_SETTINGS,
+    _build_decision_trace,
+    evaluate_guided_care,
+)
+from .rules import QuestionRule
+from .state import QUESTION_ORDER, GcpLabels, labels
+
+# Code 0 is reserved for missing/unknown answers; option codes start at 1.
+UNKNOWN_CODE = 0
+
+FUNDING_LEVELS = ["supported", "stable", "watch", "stretched"]
+PAYMENT_CONTEXTS = ["private", "medicaid"]
+
+# Safety flag bits in sorted order so a bitmask decodes to a sorted list.
+SAFETY_FLAG_ORDER = ["behavior", "behaviors", "cognition", "falls", "med_mgmt", "supervision"]
+_FLAG_BIT = {flag: 1 << idx for idx, flag in enumerate(SAFETY_FLAG_ORDER)}
+
+MULTI_SELECT_QUESTIONS = ("behavior_risks", "chronic")
+# Only these answers influence the outcome; other questions are not encoded.
+SCORED_QUESTIONS = (
+    "caregiver_support",
+    "adl_help",
+    "cognition",
+    "behavior_risks",
+    "falls",
+    "med_mgmt",
+    "supervision",
+    "chronic",
+)
+
+_FUNDING_BY_CAREGIVER = {"24_7": "stable", "most_days": "stable", "few_days_week": "watch"}
+
+
+def _option_values(question_id: str, current: GcpLabels) -> List[str]:
+    meta = current.questions.get(question_id)
+    if not meta:
+        raise KeyError(f"Unknown Guided Care Plan question id: {question_id}")
+    values = []
+    for option in meta.get("options", ()):
+        value = option.get("value") if isinstance(option, Mapping) else option
+        if value is not None:
+            values.append(str(value))
+    return values
+
+
+def _score_table(rule: QuestionRule) -> np.ndarray:
+    """Score lookup indexed by answer code (index 0 = unknown -> 0).
+
+    Multi-select rules are indexed by option bitmask instead.
+    """
+
+    if not rule.multi:
+        return np.array((0,) + rule.scores, dtype=np.int8)
+    return np.array(
+        [
+            rule.score_selection([value for idx, value in enumerate(rule.options) if mask & (1 << idx)])
+            for mask in range(1 << len(rule.options))
+        ],
+        dtype=np.int8,
+    )
+
+
+def _rule_scores(rule: QuestionRule, codes: Mapping[str, np.ndarray]) -> np.ndarray:
+    scores = _score_table(rule)[codes[rule.question_id]]
+    if rule.multi:
+        irregular = codes[f"{rule.question_id}__irregular"]
+        scores = np.where(irregular, np.maximum(scores, rule.unlisted_score), scores).astype(np.int8)
+    return scores
+
+
+def _code(question_id: str, value: str, current: GcpLabels) -> int:
+    return _option_values(question_id, current).index(value) + 1
+
+
+class _CodeLookup(dict):
+    """Option value -> code. ``__missing__`` keeps misses on the C fast path of
+    ``map(lookup.__getitem__, ...)`` instead of a per-cell ``get`` default."""
+
+    def __init__(self, codes: Mapping[str, int], missing: int) -> None:
+        super().__init__(codes)
+        self.missing = missing
+
+    def __missing__(self, key: object) -> int:
+        return self.missing
+
+
+def _lookup_codes(lookup: _CodeLookup, values: Sequence[object], dtype: type) -> np.ndarray:
+    try:
+        return np.fromiter(map(lookup.__getitem__, values), dtype=dtype, count=len(values))
+    except TypeError:  # unhashable stray values (e.g. a list in a single-select column)
+        return np.fromiter(
+            (lookup[value] if isinstance(value, str) else lookup.missing for value in values),
+            dtype=dtype,
+            count=len(values),
+        )
+
+
+def encode_column(question_id: str, values: Sequence[object], current: GcpLabels | None = None) -> np.ndarray:
+    """Encode a single-select answer column to ``int8`` option codes.
+
+    Integer arrays are assumed to be pre-encoded and are returned as-is.
+    ``current`` is the labels snapshot to encode against (default: the
+    current labels.json).
+    """
+
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        return values.astype(np.int8, copy=False)
+    options = _option_values(question_id, current or labels())
+    lookup = _CodeLookup({value: idx for idx, value in enumerate(options, start=1)}, UNKNOWN_CODE)
+    return _lookup_codes(lookup, values, np.int8)
+
+
+class _Selections(NamedTuple):
+    masks: np.ndarray       # uint16 option bitmask per row
+    irregular: np.ndarray   # row holds a value outside the option list
+    unordered: np.ndarray   # row is not a canonical selection (see below)
+    coerced: np.ndarray     # row was a bare string rather than a list
+
+
+def _as_selection(value: object) -> Tuple[object, ...]:
+    if not value:
+        return ()
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    if isinstance(value, str):
+        return (value,)
+    try:
+        return tuple(value)  # type: ignore[call-overload]
+    except TypeError:
+        return (value,)
+
+
+def _encode_selections(question_id: str, values: Sequence[object], current: GcpLabels) -> _Selections:
+    """Encode a multi-select column by flattening every selection into one array.
+
+    The option position of each selected item is looked up once, then OR-ed
+    into per-row bitmasks with ``reduceat`` over the row boundaries, so no
+    Python work is done per row beyond ``len``. A row is ``unordered`` when
+    its list differs from the canonical decode of its mask: items out of
+    labels.json order, repeated, blank or unknown.
+    """
+
+    size = len(values)
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        none = np.zeros(size, dtype=bool)
+        return _Selections(values.astype(np.uint16, copy=False), none, none, none)
+    kinds = set(map(type, values))
+    if kinds <= {list, tuple}:
+        cells: Sequence[object] = values
+        coerced = np.zeros(size, dtype=bool)
+    else:
+        cells = [value if value.__class__ in (list, tuple) else _as_selection(value) for value in values]
+        coerced = np.fromiter((isinstance(value, str) and value != "" for value in values), dtype=bool, count=size)
+    lengths = np.fromiter(map(len, cells), dtype=np.intp, count=size)
+    items = list(chain.from_iterable(cells))
+
+    index = _CodeLookup({value: idx for idx, value in enumerate(_option_values(question_id, current))}, -1)
+    positions = _lookup_codes(index, items, np.int16)
+    rows = np.repeat(np.arange(size), lengths)
+    starts = np.cumsum(lengths) - lengths
+
+    bits = np.where(positions >= 0, np.left_shift(1, positions.clip(0)), 0).astype(np.uint16)
+    masks = np.zeros(size, dtype=np.uint16)
+    filled = lengths > 0
+    if items:
+        masks[filled] = np.bitwise_or.reduceat(bits, starts[filled])
+
+    irregular = np.zeros(size, dtype=bool)
+    unordered = np.zeros(size, dtype=bool)
+    stray = np.flatnonzero(positions < 0)
+    if stray.size:
+        unordered[rows[stray]] = True
+        unknown = [int(pos) for pos in stray.tolist() if items[pos]]
+        irregular[rows[unknown]] = True
+    repeated = (rows[1:] == rows[:-1]) & (positions[1:] <= positions[:-1])
+    unordered[rows[1:][repeated]] = True
+    return _Selections(masks, irregular, unordered, coerced)
+
+
+def encode_multi_column(
+    question_id: str, values: Sequence[object], current: GcpLabels | None = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode a multi-select column to option bitmasks.
+
+    Returns ``(masks, irregular)`` where bit ``i`` of a mask is set when option
+    ``i`` (labels.json order) was selected, and ``irregular`` marks rows holding
+    values outside the option list. "none" is kept in the mask and blank
+    entries are skipped; callers decide how to treat them.
+    """
+
+    selections = _encode_selections(question_id, values, current or labels())
+    return selections.masks, selections.irregular
+
+
+def encode_batch(
+    columns: Mapping[str, Sequence[object]], current: GcpLabels | None = None
+) -> Dict[str, np.ndarray]:
+    """Encode the scored columns of a batch (one sequence per question id).
+
+    Multi-select questions produce ``<question>`` bitmasks plus
+    ``<question>__irregular``, ``__unordered`` and ``__coerced`` boolean
+    columns. Missing questions encode as unknown.
+    """
+
+    current = current or labels()
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Guided Care Plan batch columns differ in length: {sorted(lengths)}")
+    size = lengths.pop() if lengths else 0
+
+    encoded: Dict[str, np.ndarray] = {}
+    for question_id in SCORED_QUESTIONS:
+        values = columns.get(question_id)
+        if question_id in MULTI_SELECT_QUESTIONS:
+            if values is None:
+                values = np.zeros(size, dtype=np.uint16)
+            selections = _encode_selections(question_id, values, current)
+            encoded[question_id] = selections.masks
+            for field in ("irregular", "unordered", "coerced"):
+                encoded[f"{question_id}__{field}"] = getattr(selections, field)
+        elif values is None:
+            encoded[question_id] = np.zeros(size, dtype=np.int8)
+        else:
+            encoded[question_id] = encode_column(question_id, values, current)
+    return encoded
+
+
+def _score_daily_life_batch(codes: Mapping[str, np.ndarray], current: GcpLabels) -> np.ndarray:
+    score = np.zeros(len(codes["adl_help"]), dtype=np.int16)
+    for rule in current.daily_life_rules:
+        score += _rule_scores(rule, codes)
+    return score
+
+
+def _behavior_masks(codes: Mapping[str, np.ndarray], current: GcpLabels) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (any behavior selected, wandering/exit-seeking selected)."""
+
+    values = _option_values("behavior_risks", current)
+    none_bit = 1 << values.index("none")
+    danger_bits = (1 << values.index("wandering")) | (1 << values.index("exit_seeking"))
+    masks = codes["behavior_risks"]
+    present = ((masks & ~np.uint16(none_bit)) != 0) | codes["behavior_risks__irregular"]
+    return present, (masks & danger_bits) != 0
+
+
+def _flag_bits(condition: np.ndarray, flag: str) -> np.ndarray:
+    return condition.view(np.uint8) * np.uint8(_FLAG_BIT[flag])
+
+
+def _score_health_safety_batch(codes: Mapping[str, np.ndarray], current: GcpLabels) -> Tuple[np.ndarray, np.ndarray]:
+    score = np.zeros(len(codes["adl_help"]), dtype=np.int16)
+    flags = np.zeros(len(score), dtype=np.uint8)
+    for rule in current.health_safety_rules:
+        rule_scores = _rule_scores(rule, codes)
+        score += rule_scores
+        if rule.flag:
+            flags |= _flag_bits(rule_scores >= rule.flag_at, rule.flag)
+    return score, flags
+
+
+def _derive_setting_batch(
+    daily_score: np.ndarray,
+    safety_score: np.ndarray,
+    codes: Mapping[str, np.ndarray],
+    current: GcpLabels,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized ``_derive_setting``: setting codes, intensity codes, flag bits."""
+
+    def code(question_id: str, value: str) -> int:
+        return _code(question_id, value, current)
+
+    total = daily_score + safety_score
+    behavior_present, behavior_danger = _behavior_masks(codes, current)
+    falls, med_mgmt = codes["falls"], codes["med_mgmt"]
+
+    flags = (
+        _flag_bits(np.isin(falls, [code("falls", "one"), code("falls", "recurrent")]), "falls")
+        | _flag_bits(behavior_present, "behaviors")
+        | _flag_bits(np.isin(med_mgmt, [code("med_mgmt", "several"), code("med_mgmt", "complex")]), "med_mgmt")
+    )
+
+    needs_assisted = (total >= 9) | (codes["supervision"] == code("supervision", "never"))
+    setting = np.where(
+        behavior_danger,
+        SENIOR_SETTINGS.index("memory"),
+        np.where(needs_assisted, SENIOR_SETTINGS.index("assisted"), SENIOR_SETTINGS.index("home")),
+    ).astype(np.int8)
+    intensity = np.where(total <= 4, 0, np.where(total <= 8, 1, 2)).astype(np.int8)
+    return setting, intensity, flags
+
+
+def _funding_codes(codes: Mapping[str, np.ndarray], on_medicaid: np.ndarray, current: GcpLabels) -> np.ndarray:
+    table = [FUNDING_LEVELS.index("stretched")] * (len(_option_values("caregiver_support", current)) + 1)
+    for value, level in _FUNDING_BY_CAREGIVER.items():
+        table[_code("caregiver_support", value, current)] = FUNDING_LEVELS.index(level)
+    funding = np.array(table, dtype=np.int8)[codes["caregiver_support"]]
+    return np.where(on_medicaid, FUNDING_LEVELS.index("supported"), funding).astype(np.int8)
+
+
+def _object_table(items: Sequence[object]) -> np.ndarray:
+    table = np.empty(len(items), dtype=object)
+    for idx, item in enumerate(items):
+        table[idx] = item
+    return table
+
+
+def _normalize_chronic(selected: List[object]) -> List[object]:
+    """``evaluate_guided_care``'s chronic list: "none" drops out next to a condition."""
+
+    if "none" in selected and len(selected) > 1:
+        return [value for value in selected if value != "none"]
+    return selected
+
+
+def _chronic_table(current: GcpLabels) -> np.ndarray:
+    """Decoded chronic-condition lists for every option bitmask."""
+
+    values = _option_values("chronic", current)
+    return _object_table(
+        [
+            _normalize_chronic([value for idx, value in enumerate(values) if mask & (1 << idx)])
+            for mask in range(1 << len(values))
+        ]
+    )
+
+
+def _medicaid_column(
+    size: int,
+    audiencing: Mapping[str, object] | None,
+    on_medicaid: Sequence[bool] | None,
+) -> np.ndarray:
+    if on_medicaid is not None:
+        column = np.asarray(on_medicaid, dtype=bool)
+        if column.shape != (size,):
+            raise ValueError("on_medicaid must have one entry per record")
+        return column
+    qualifiers = audiencing.get("qualifiers", {}) if isinstance(audiencing, dict) else {}
+    return np.full(size, bool(qualifiers.get("on_medicaid")), dtype=bool)
+
+
+def evaluate_guided_care_batch(
+    columns: Mapping[str, Sequence[object]],
+    audiencing: Dict[str, object] | None = None,
+    *,
+    on_medicaid: Sequence[bool] | None = None,
+) -> Dict[str, np.ndarray]:
+    """Evaluate a columnar batch of answers.
+
+    ``columns`` maps question ids from ``QUESTION_ORDER`` to one value per
+    record (multi-selects as lists). ``audiencing`` is shared by every record;
+    pass ``on_medicaid`` to supply the Medicaid qualifier per record instead.
+
+    Returns the same fields as ``evaluate_guided_care``, each as a NumPy object
+    array with one entry per record. For raw answers every field matches the
+    engine, including ``chronic_conditions`` in selection order with blank
+    entries kept. Pre-encoded bitmask columns (from ``encode_batch``) carry no
+    order, so their conditions come back in labels.json order without blanks.
+    List values are shared between rows with identical outcomes; copy them
+    before mutating.
+    """
+
+    # Encode and score against one labels snapshot: a labels.json reload
+    # mid-batch must not pair old option codes with new score tables.
+    current = labels()
+    codes = encode_batch(columns, current)
+    size = len(codes["adl_help"])
+    medicaid = _medicaid_column(size, audiencing, on_medicaid)
+
+    daily_score = _score_daily_life_batch(codes, current)
+    safety_score, detail_flags = _score_health_safety_batch(codes, current)
+    setting, intensity, base_flags = _derive_setting_batch(daily_score, safety_score, codes, current)
+    flags = base_flags | detail_flags
+    funding = _funding_codes(codes, medicaid, current)
+    chronic = codes["chronic"]
+
+    flag_lists = _object_table(
+        [[flag for flag in SAFETY_FLAG_ORDER if mask & _FLAG_BIT[flag]] for mask in range(1 << len(SAFETY_FLAG_ORDER))]
+    )
+    chronic_lists = _chronic_table(current)
+
+    # DecisionTrace depends only on (setting, intensity, flags, chronic). The
+    # trace is a setting/intensity preamble followed by independent flag and
+    # chronic lines, so each part is rendered once and concatenated for the
+    # combinations present in the batch.
+    flag_space = 1 << len(SAFETY_FLAG_ORDER)
+    chronic_space = len(chronic_lists)
+    trace_key = (
+        (setting.astype(np.int32) * len(CARE_INTENSITIES) + intensity) * flag_space + flags
+    ) * chronic_space + chronic
+    present = np.zeros(len(SENIOR_SETTINGS) * len(CARE_INTENSITIES) * flag_space * chronic_space, dtype=bool)
+    present[trace_key] = True
+
+    preambles = {
+        (s, i): _build_decision_trace(SENIOR_SETTINGS[s], CARE_INTENSITIES[i], [], [])
+        for s in range(len(SENIOR_SETTINGS))
+        for i in range(len(CARE_INTENSITIES))
+    }
+    preamble_len = len(preambles[0, 0])
+    flag_lines = [_build_decision_trace("home", "low", flag_list, [])[preamble_len:] for flag_list in flag_lists]
+    chronic_lines = [_build_decision_trace("home", "low", [], chronic)[preamble_len:] for chronic in chronic_lists]
+    prefixes: Dict[int, List[str]] = {}
+
+    def trace_prefix(outcome: int) -> List[str]:
+        prefix = prefixes.get(outcome)
+        if prefix is None:
+            rest, flag_mask = divmod(outcome, flag_space)
+            prefix = prefixes[outcome] = preambles[divmod(rest, len(CARE_INTENSITIES))] + flag_lines[flag_mask]
+        return prefix
+
+    traces = np.empty(len(present), dtype=object)
+    for key in np.flatnonzero(present).tolist():
+        outcome, chronic_mask = divmod(key, chronic_space)
+        traces[key] = trace_prefix(outcome) + chronic_lines[chronic_mask]
+
+    result = {
+        "recommended_setting": _object_table(SENIOR_SETTINGS)[setting],
+        "care_intensity": _object_table(CARE_INTENSITIES)[intensity],
+        "safety_flags": flag_lists[flags],
+        "chronic_conditions": chronic_lists[chronic],
+        "payment_context": _object_table(PAYMENT_CONTEXTS)[medicaid.astype(np.int8)],
+        "funding_confidence": _object_table(FUNDING_LEVELS)[funding],
+        "audiencing_snapshot": _object_table([audiencing or {}])[np.zeros(size, dtype=np.intp)],
+        "DecisionTrace": traces[trace_key],
+    }
+
+    # The engine reports chronic conditions as given (selection order, blank
+    # entries kept). Rows whose list is not the canonical decode of its mask
+    # are rendered once per distinct (outcome, selection).
+    fallback = codes["chronic__irregular"] | codes["chronic__coerced"]
+    unordered = np.flatnonzero(codes["chronic__unordered"] & ~fallback).tolist()
+    if unordered:
+        raw = columns["chronic"]
+        conditions: Dict[Tuple[object, ...], List[object]] = {}
+        rendered: Dict[Tuple[int, Tuple[object, ...]], List[str]] = {}
+        outcomes = (trace_key // chronic_space).tolist()
+        for row in unordered:
+            selection = tuple(raw[row])
+            listed = conditions.get(selection)
+            if listed is None:
+                listed = conditions[selection] = _normalize_chronic(list(selection))
+            trace = rendered.get((outcomes[row], selection))
+            if trace is None:
+                trace = rendered[outcomes[row], selection] = (
+                    trace_prefix(outcomes[row]) + _build_decision_trace("home", "low", [], listed)[preamble_len:]
+                )
+            result["chronic_conditions"][row] = listed
+            result["DecisionTrace"][row] = trace
+
+    # Rows with chronic values outside labels.json (or a bare string, which
+    # the engine splits into characters) cannot be decoded from a bitmask;
+    # score them with the single-record engine.
+    for row in np.flatnonzero(fallback).tolist():
+        record = {question_id: columns[question_id][row] for question_id in columns}
+        row_audiencing = audiencing or {}
+        if on_medicaid is not None:
+            row_audiencing = {"qualifiers": {"on_medicaid": bool(medicaid[row])}}
+        single = evaluate_guided_care(record, row_audiencing)
+        for field, value in single.items():
+            result[field][row] = value
+    return result
@@ -0,0 +1,164 @@
+"""Process-wide memoization for Guided Care Plan evaluations.
+
+Streamlit reruns and concurrent sessions evaluate the same answer patterns
+over and over. ``EvaluationCache`` sits in front of the evaluator with a
+bounded LRU keyed on a canonical, hashable form of the answers: the
+``QUESTION_ORDER`` values (multi-selects as tuples in labels.json order) plus
+the Medicaid qualifier, the only audiencing input the rules read. Entries
+are dropped when labels.json is reloaded, since the key does not describe
+the score tables the outcome was computed with.
+"""
+from __future__ import annotations
+
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Mapping, Optional, Tuple
+
+from senior_nav.runtime.profiler import profiled
+
+from .cube import lookup_guided_care
+from .state import QUESTION_ORDER, GcpLabels, labels
+
+Evaluator = Callable[[Dict[str, object], Dict[str, object]], Dict[str, object]]
+
+DEFAULT_MAXSIZE = 4096
+
+
+
+def _freeze(value: object) -> Hashable:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    return value  # type: ignore[return-value]
+
+
+def _canonical_selection(order: Mapping[str, int], value: object) -> Tuple[Hashable, ...]:
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = [value]
+    items = [_freeze(item) for item in value]
+    return tuple(sorted(items, key=lambda item: (order.get(item, len(order)), str(item))))
+
+
+def canonical_answers(answers: Dict[str, object], current: Optional[GcpLabels] = None) -> Dict[str, object]:
+    """Answers restricted to ``QUESTION_ORDER`` with multi-selects in canonical order."""
+
+    current = current or labels()
+    canonical: Dict[str, object] = {}
+    for question_id in QUESTION_ORDER:
+        value = answers.get(question_id)
+        if question_id in current.multi_select:
+            canonical[question_id] = list(_canonical_selection(current.option_index[question_id], value))
+        else:
+            canonical[question_id] = value
+    return canonical
+
+
+def _on_medicaid(audiencing: Dict[str, object] | None) -> bool:
+    qualifiers = audiencing.get("qualifiers", {}) if isinstance(audiencing, dict) else {}
+    return bool(qualifiers.get("on_medicaid"))
+
+
+def cache_key(
+    answers: Dict[str, object],
+    audiencing: Dict[str, object] | None,
+    current: Optional[GcpLabels] = None,
+) -> Tuple[Hashable, ...]:
+    current = current or labels()
+    key = []
+    for question_id in QUESTION_ORDER:
+        value = answers.get(question_id)
+        if question_id in current.multi_select:
+            key.append(_canonical_selection(current.option_index[question_id], value))
+        else:
+            key.append(_freeze(value))
+    key.append(_on_medicaid(audiencing))
+    return tuple(key)
+
+
+class EvaluationCache:
+    """Bounded, thread-safe LRU cache of Guided Care Plan outcomes."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, evaluator: Evaluator = lookup_guided_care) -> None:
+        if maxsize < 1:
+            raise ValueError("EvaluationCache maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._evaluator = evaluator
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Dict[str, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._labels: Optional[GcpLabels] = None  # labels the entries were scored with
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def evaluate(
+        self,
+        answers: Dict[str, object],
+        audiencing: Dict[str, object] | None = None,
+    ) -> Dict[str, object]:
+        """Return the outcome for ``answers``, evaluating only on a cache miss."""
+
+        current = labels()
+        key = cache_key(answers, audiencing, current)
+        with self._lock:
+            if current is not self._labels:
+                # labels.json was reloaded (the registry swaps in a new object).
+                self._entries.clear()
+                self._labels = current
+            outcome = self._entries.get(key)
+            if outcome is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if outcome is None:
+            # Evaluate the canonical answers so the stored outcome is exactly
+            # what the key describes, independent of selection order.
+            medicaid_only = {"qualifiers": {"on_medicaid": _on_medicaid(audiencing)}}
+            outcome = self._evaluator(canonical_answers(answers, current), medicaid_only)
+            outcome.pop("audiencing_snapshot", None)
+            with self._lock:
+                self.misses += 1
+                if current is self._labels:  # not reloaded while evaluating
+                    self._entries[key] = outcome
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+
+        # Hand out fresh lists: callers store results in session state and
+        # must not share mutable values across sessions.
+        result = {field: list(value) if isinstance(value, list) else value for field, value in outcome.items()}
+        result["audiencing_snapshot"] = audiencing or {}
+        return result
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+EVALUATION_CACHE = EvaluationCache()
+
+
+@profiled("evaluate_guided_care")
+def evaluate_guided_care_cached(
+    answers: Dict[str, object],
+    audiencing: Dict[str, object] | None = None,
+) -> Dict[str, object]:
+    """Memoized ``evaluate_guided_care`` backed by the process-wide cache."""
+
+    return EVALUATION_CACHE.evaluate(answers, audiencing)
@@ -0,0 +1,380 @@
+"""Precomputed Guided Care Plan outcome cube.
+
+Every answer that influences scoring comes from a small finite set, so the
+whole scoring space can be enumerated offline. The builder runs
+``evaluate_guided_care`` on each combination and packs the outcome into a
+``uint16`` cell of an N-dimensional cube, written as a memory-mappable binary
+file with a versioned header. At runtime ``lookup_guided_care`` turns the
+answers into one flat index and decodes the cell instead of running the
+engine.
+
+The cube is a build artifact in ``.sn_cache/`` and is not committed. Build
+it at deploy time (``app.py`` also builds it once per process in the
+background when it is missing or stale)::
+
+    python -m guided_care_plan.cube build
+    python -m guided_care_plan.cube verify   # exits 1 if stale or wrong
+
+The header stores ``rules_fingerprint()``: a hash of the compiled rule tables
+and of engine outcomes on a fixed probe, not of source bytes, so comment or
+formatting edits keep a cube fresh. A stale or missing cube makes lookups
+fall back to the engine with a logged warning. A labels.json reload drops the
+cached index layout and runtime cube, so lookups re-check the file against
+the new rules.
+"""
+from __future__ import annotations
+
+
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import os
+import random
+import struct
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .engine import CARE_INTENSITIES, SENIOR_SETTINGS, _build_decision_trace, evaluate_guided_care
+from .rules import QuestionRule
+from .state import PACKAGE_ROOT, GcpLabels, labels
+
+LOGGER = logging.getLogger(__name__)
+
+CUBE_PATH = PACKAGE_ROOT.parent / ".sn_cache" / "gcp_outcome_cube.bin"
+
+MAGIC = b"GCPCUBE\x00"
+FORMAT_VERSION = 1
+# magic, format version, axis count, 32-byte rules fingerprint
+_HEADER = struct.Struct("<8sHH32s")
+
+# Answer axes in cube order. Single-select axes use code 0 for a missing or
+# unknown answer and option position + 1 otherwise.
+SINGLE_AXES = ("caregiver_support", "adl_help", "cognition", "falls", "med_mgmt", "supervision")
+BEHAVIOR_AXIS = "behavior_risks"
+
+FUNDING_LEVELS = ("supported", "stable", "watch", "stretched")
+PAYMENT_CONTEXTS = ("private", "medicaid")
+SAFETY_FLAGS = ("behavior", "behaviors", "cognition", "falls", "med_mgmt", "supervision")
+
+PROBE_SIZE = 512
+
+
+def rules_fingerprint(rules: Mapping[str, QuestionRule] | None = None) -> bytes:
+    """SHA-256 over the compiled scoring tables plus an engine probe.
+
+    The tables (default: the current ones) cover labels.json scores,
+    sections and flags. The probe packs engine outcomes for a fixed sample
+    of cube coordinates, which catches changes to the derivation logic
+    (thresholds, setting rules) that the tables do not describe.
+    """
+
+    if rules is None:
+        rules = labels().rules
+    tables = [
+        (rule.question_id, rule.section, rule.options, rule.scores,
+         rule.multi, rule.flag, rule.flag_at, rule.unlisted_score)
+        for rule in rules.values()
+    ]
+    vocabulary = (SENIOR_SETTINGS, CARE_INTENSITIES, FUNDING_LEVELS, PAYMENT_CONTEXTS, SAFETY_FLAGS)
+    digest = hashlib.sha256(json.dumps([FORMAT_VERSION, tables, vocabulary]).encode("utf-8"))
+    digest.update(_engine_probe())
+    return digest.digest()
+
+
+def _engine_probe() -> bytes:
+    shape = axis_shape()
+    rng = random.Random(0)
+    probe = [tuple(rng.randrange(size) for size in shape) for _ in range(PROBE_SIZE)]
+    # The diagonal walks every axis up together, crossing the score thresholds.
+    probe += [tuple(min(level, size - 1) for size in shape) for level in range(max(shape))]
+    cells = [pack_outcome(evaluate_guided_care(*_representative_answers(coords))) for coords in probe]
+    return np.asarray(cells, dtype="<u2").tobytes()
+
+
+def _behavior_options(rules: Mapping[str, QuestionRule]) -> Tuple[str, ...]:
+    return tuple(value for value in rules[BEHAVIOR_AXIS].options if value != "none")
+
+
+def axis_shape() -> Tuple[int, ...]:
+    """Cube dimensions: single-select axes, behavior bitmask, Medicaid flag."""
+
+    rules = labels().rules
+    singles = tuple(len(rules[question_id].options) + 1 for question_id in SINGLE_AXES)
+    # One bit per listed behavior plus one for any unlisted behavior.
+    return singles + (1 << (len(_behavior_options(rules)) + 1), 2)
+
+
+# ---------------------------------------------------------------------------
+# Cell packing
+# ---------------------------------------------------------------------------
+def pack_outcome(outcome: Dict[str, object]) -> int:
+    flags = 0
+    for flag in outcome["safety_flags"]:
+        flags |= 1 << SAFETY_FLAGS.index(flag)
+    return (
+        SENIOR_SETTINGS.index(outcome["recommended_setting"])
+        | CARE_INTENSITIES.index(outcome["care_intensity"]) << 2
+        | FUNDING_LEVELS.index(outcome["funding_confidence"]) << 4
+        | PAYMENT_CONTEXTS.index(outcome["payment_context"]) << 6
+        | flags << 7
+    )
+
+
+@lru_cache(maxsize=1 << 13)
+def unpack_outcome(cell: int) -> Tuple[str, str, str, str, Tuple[str, ...]]:
+    """Return (setting, intensity, funding, payment context, safety flags)."""
+
+    flags = tuple(flag for idx, flag in enumerate(SAFETY_FLAGS) if cell >> 7 & (1 << idx))
+    return (
+        SENIOR_SETTINGS[cell & 0b11],
+        CARE_INTENSITIES[cell >> 2 & 0b11],
+        FUNDING_LEVELS[cell >> 4 & 0b11],
+        PAYMENT_CONTEXTS[cell >> 6 & 0b1],
+        flags,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Answer <-> cube coordinates
+# ---------------------------------------------------------------------------
+def _representative_answers(coords: Sequence[int]) -> Tuple[Dict[str, object], Dict[str, object]]:
+    """Build an answers dict and audiencing block for a cube coordinate."""
+
+    rules = labels().rules
+    answers: Dict[str, object] = {}
+    for question_id, code in zip(SINGLE_AXES, coords):
+        answers[question_id] = rules[question_id].options[code - 1] if code else None
+    behavior_mask = coords[len(SINGLE_AXES)]
+    listed = _behavior_options(rules)
+    behaviors = [value for idx, value in enumerate(listed) if behavior_mask & (1 << idx)]
+    if behavior_mask >> len(listed):
+        behaviors.append("__unlisted__")
+    answers[BEHAVIOR_AXIS] = behaviors
+    audiencing = {"qualifiers": {"on_medicaid": bool(coords[-1])}}
+    return answers, audiencing
+
+
+@lru_cache(maxsize=1)
+def _index_layout() -> Tuple[Tuple[Tuple[str, Dict[str, int]], ...], Dict[str, int], int, int]:
+    """Precomputed strides and code tables for ``cube_index``."""
+
+    rules = labels().rules
+    shape = axis_shape()
+    strides = np.cumprod((shape[1:] + (1,))[::-1])[::-1].tolist()
+    # Each answer maps straight to its contribution to the flat index.
+    singles = tuple(
+        (question_id, {value: (position + 1) * stride for value, position in rules[question_id].index.items()})
+        for question_id, stride in zip(SINGLE_AXES, strides)
+    )
+    behavior_stride = strides[len(SINGLE_AXES)]
+    listed = _behavior_options(rules)
+    behavior_bits = {value: (1 << idx) * behavior_stride for idx, value in enumerate(listed)}
+    unlisted_bit = (1 << len(listed)) * behavior_stride
+    return singles, behavior_bits, unlisted_bit, strides[-1]
+
+
+_built_for: GcpLabels | None = None  # labels the cached layout and runtime cube were built from
+
+
+def _follow_labels() -> None:
+    """Drop the cached layout and runtime cube after a labels.json reload.
+
+    The registry swaps in a new ``GcpLabels`` on every reload (and when
+    ``gcp.labels`` is re-registered), so an identity check is enough.
+    ``unpack_outcome`` and ``_decision_trace`` do not read labels.json and
+    are kept.
+    """
+
+    global _built_for
+    current = labels()
+    if current is not _built_for:
+        _index_layout.cache_clear()
+        _runtime_cube.cache_clear()
+        _built_for = current
+
+
+def cube_index(answers: Dict[str, object], audiencing: Dict[str, object] | None) -> int:
+    """Flat cube index for an answers dict (same normalization as the engine)."""
+
+    _follow_labels()
+    singles, behavior_bits, unlisted_bit, medicaid_stride = _index_layout()
+    index = 0
+    for question_id, offsets in singles:
+        index += offsets.get(answers.get(question_id), 0)
+
+    raw = answers.get(BEHAVIOR_AXIS) or []
+    if isinstance(raw, str):
+        raw = [raw]
+    behavior = 0
+    for item in raw:
+        if item and item != "none":
+            behavior |= behavior_bits.get(item, unlisted_bit)
+    index += behavior
+
+    qualifiers = audiencing.get("qualifiers", {}) if isinstance(audiencing, dict) else {}
+    return index + (medicaid_stride if qualifiers.get("on_medicaid") else 0)
+
+
+# ---------------------------------------------------------------------------
+# Build / load
+# ---------------------------------------------------------------------------
+def build_cube() -> np.ndarray:
+    """Evaluate every cube coordinate with the engine."""
+
+    shape = axis_shape()
+    cube = np.empty(shape, dtype="<u2")
+    for coords in itertools.product(*(range(size) for size in shape)):
+        answers, audiencing = _representative_answers(coords)
+        cube[coords] = pack_outcome(evaluate_guided_care(answers, audiencing))
+    return cube
+
+
+def write_cube(cube: np.ndarray, path: Path = CUBE_PATH) -> None:
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, cube.ndim, rules_fingerprint())
+    dims = struct.pack(f"<{cube.ndim}I", *cube.shape)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(header)
+        handle.write(dims)
+        handle.write(np.ascontiguousarray(cube, dtype="<u2").tobytes())
+    tmp_path.replace(path)
+
+
+@dataclass(frozen=True)
+class OutcomeCube:
+    cells: np.ndarray  # flat, memory-mapped
+    shape: Tuple[int, ...]
+    fingerprint: bytes
+
+    @property
+    def fresh(self) -> bool:
+        return self.shape == axis_shape() and self.fingerprint == rules_fingerprint()
+
+
+def read_cube(path: Path = CUBE_PATH) -> OutcomeCube:
+    with path.open("rb") as handle:
+        magic, version, ndim, fingerprint = _HEADER.unpack(handle.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"Not a GCP outcome cube: {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported GCP outcome cube version {version} in {path}")
+        shape = struct.unpack(f"<{ndim}I", handle.read(4 * ndim))
+    offset = _HEADER.size + 4 * ndim
+    cells = np.memmap(path, dtype="<u2", mode="r", offset=offset, shape=(int(np.prod(shape)),))
+    return OutcomeCube(cells=cells, shape=tuple(shape), fingerprint=fingerprint)
+
+
+@lru_cache(maxsize=4096)
+def _decision_trace(
+    setting: str, intensity: str, flags: Tuple[str, ...], chronic: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    return tuple(_build_decision_trace(setting, intensity, list(flags), list(chronic)))
+
+
+@lru_cache(maxsize=1)
+def _runtime_cube() -> OutcomeCube | None:
+    """The built cube, or None (logged once) when it is missing or stale."""
+
+    try:
+        cube = read_cube(CUBE_PATH)
+    except (OSError, ValueError) as exc:
+        problem = f"unavailable ({exc})"
+    else:
+        if cube.fresh:
+            return cube
+        problem = "stale (built for other rules)"
+    LOGGER.warning(
+        "GCP outcome cube at %s is %s; scoring with the engine. "
+        "Build it with `python -m guided_care_plan.cube build`.",
+        CUBE_PATH,
+        problem,
+    )
+    return None
+
+
+def ensure_cube(path: Path | None = None) -> OutcomeCube:
+    """Return a fresh cube at ``path``, building and writing it first if needed."""
+
+    path = path or CUBE_PATH
+    try:
+        cube = read_cube(path)
+        if cube.fresh:
+            return cube
+    except (OSError, ValueError):
+        pass
+    write_cube(build_cube(), path)
+    _runtime_cube.cache_clear()
+    return read_cube(path)
+
+
+def lookup_guided_care(
+    answers: Dict[str, object],
+    audiencing: Dict[str, object] | None = None,
+) -> Dict[str, object]:
+    """Cube-backed drop-in for ``evaluate_guided_care``.
+
+    Falls back to the engine when no fresh cube is available.
+    """
+
+    _follow_labels()
+    cube = _runtime_cube()
+    if cube is None:
+        return evaluate_guided_care(answers, audiencing)
+
+    audiencing = audiencing or {}
+    setting, intensity, funding, payment, flags = unpack_outcome(int(cube.cells[cube_index(answers, audiencing)]))
+
+    chronic_conditions = list(answers.get("chronic") or [])
+    if "none" in chronic_conditions and len(chronic_conditions) > 1:
+        chronic_conditions = [cond for cond in chronic_conditions if cond != "none"]
+
+    return {
+        "recommended_setting": setting,
+        "care_intensity": intensity,
+        "safety_flags": list(flags),
+        "chronic_conditions": chronic_conditions,
+        "payment_context": payment,
+        "funding_confidence": funding,
+        "audiencing_snapshot": audiencing,
+        "DecisionTrace": list(_decision_trace(setting, intensity, flags, tuple(chronic_conditions))),
+    }
+
+
+def verify_cube(path: Path = CUBE_PATH) -> int:
+    """Compare every cell against the current engine; return the mismatch count."""
+
+    cube = read_cube(path)
+    if cube.shape != axis_shape():
+        raise ValueError(f"Cube shape {cube.shape} does not match current rules {axis_shape()}")
+    expected = build_cube().reshape(-1)
+    return int(np.count_nonzero(np.asarray(cube.cells) != expected))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Build or verify the GCP outcome cube.")
+    parser.add_argument("command", choices=("build", "verify"))
+    parser.add_argument("--path", type=Path, default=CUBE_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        cube = build_cube()
+        write_cube(cube, args.path)
+        print(f"Wrote {cube.size:,} outcomes {cube.shape} to {args.path}")
+        return 0
+
+    mismatches = verify_cube(args.path)
+    fresh = read_cube(args.path).fresh
+    print(f"{mismatches:,} cells differ from the current engine{'' if fresh else ' (fingerprint stale)'}")
+    return 0 if fresh and not mismatches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
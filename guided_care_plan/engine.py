@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
-from .state import QUESTION_ORDER
+from .rules import QuestionRule
+from .state import QUESTION_ORDER, labels
 
 SENIOR_SETTINGS = ["home", "assisted", "memory"]
 CARE_INTENSITIES = ["low", "med", "high"]
@@ -19,80 +20,34 @@ CHRONIC_FRIENDLY_LABELS = {
 }
 
 
-def _score_daily_life(answers: Dict[str, str]) -> int:
+def _score_daily_life(answers: Dict[str, str], rules: Sequence[QuestionRule] | None = None) -> int:
+    if rules is None:
+        rules = labels().daily_life_rules
     score = 0
-    score_map = {
-        "adl_help": {
-            "0-1": 0,
-            "2-3": 1,
-            "4-5": 2,
-            "6+": 3,
-        },
-        "med_mgmt": {
-            "simple": 0,
-            "several": 1,
-            "complex": 3,
-        },
-        "caregiver_support": {
-            "24_7": 0,
-            "most_days": 1,
-            "few_days_week": 2,
-            "none": 3,
-        },
-    }
-    for key, mapping in score_map.items():
-        score += mapping.get(answers.get(key, ""), 0)
+    for rule in rules:
+        position = rule.index.get(answers.get(rule.question_id))
+        if position is not None:
+            score += rule.scores[position]
     return score
 
 
-def _score_health_safety(answers: Dict[str, str]) -> Tuple[int, List[str]]:
+def _score_health_safety(
+    answers: Dict[str, str], rules: Sequence[QuestionRule] | None = None
+) -> Tuple[int, List[str]]:
+    if rules is None:
+        rules = labels().health_safety_rules
     score = 0
     flags: List[str] = []
-
-    falls = answers.get("falls", "none")
-    if falls == "recurrent":
-        score += 3
-        flags.append("falls")
-    elif falls == "one":
-        score += 1
-        flags.append("falls")
-
-    cognition = answers.get("cognition", "normal")
-    cognition_score = {
-        "normal": 0,
-        "mild": 1,
-        "moderate": 2,
-        "severe": 3,
-    }.get(cognition, 0)
-    score += cognition_score
-    if cognition_score >= 2:
-        flags.append("cognition")
-
-    raw_behaviors = answers.get("behavior_risks") or []
-    if isinstance(raw_behaviors, str):
-        raw_behaviors = [raw_behaviors]
-    behaviors = {item for item in raw_behaviors if item and item != "none"}
-    if not behaviors:
-        behavior_score = 0
-    elif {"wandering", "exit_seeking"} & behaviors:
-        behavior_score = 3
-    else:
-        behavior_score = 2
-    score += behavior_score
-    if behavior_score >= 2:
-        flags.append("behavior")
-
-    supervision = answers.get("supervision", "always")
-    supervision_score = {
-        "always": 0,
-        "sometimes": 1,
-        "rarely": 2,
-        "never": 3,
-    }.get(supervision, 0)
-    score += supervision_score
-    if supervision_score >= 2:
-        flags.append("supervision")
-
+    for rule in rules:
+        value = answers.get(rule.question_id)
+        if rule.multi:
+            rule_score = rule.score_selection(value)
+        else:
+            position = rule.index.get(value)
+            rule_score = 0 if position is None else rule.scores[position]
+        score += rule_score
+        if rule.flag and rule_score >= rule.flag_at:
+            flags.append(rule.flag)
     return score, flags
 
 
@@ -215,8 +170,10 @@ def evaluate_guided_care(
         chronic_conditions = [cond for cond in chronic_conditions if cond != "none"]
     normalized_answers["chronic"] = chronic_conditions
 
-    daily_score = _score_daily_life(normalized_answers)
-    safety_score, safety_flag_details = _score_health_safety(normalized_answers)
+    # One labels snapshot per evaluation, so a reload cannot land between sections.
+    current = labels()
+    daily_score = _score_daily_life(normalized_answers, current.daily_life_rules)
+    safety_score, safety_flag_details = _score_health_safety(normalized_answers, current.health_safety_rules)
     recommended_setting, intensity, base_flags = _derive_setting(
         daily_score, safety_score, normalized_answers, chronic_conditions
     )
@@ -0,0 +1,36 @@
+"""Scoring rules compiled from the per-option scores in labels.json.
+
+Each scored question in labels.json declares a ``score`` next to every option
+plus a ``scoring`` block (section, optional safety flag and threshold). The
+``gcp.labels`` loader in ``senior_nav.core.gcp`` compiles these into
+immutable lookup tables, so the engine scores answers with index lookups
+instead of rebuilding score maps per call, and a labels.json edit reloads
+the tables together with the options.
+
+``RULES``, ``DAILY_LIFE_RULES`` and ``HEALTH_SAFETY_RULES`` resolve to the
+current tables on every attribute access; hot paths read
+``labels().rules`` (or the per-section tuples) once per evaluation instead.
+"""
+from __future__ import annotations
+
+from senior_nav.core.gcp import (  # noqa: F401  (re-exported)
+    DAILY_LIFE,
+    HEALTH_SAFETY,
+    QuestionRule,
+    _compile_rule,
+    compile_rules,
+)
+
+from .state import labels
+
+_CURRENT_TABLES = {
+    "RULES": "rules",
+    "DAILY_LIFE_RULES": "daily_life_rules",
+    "HEALTH_SAFETY_RULES": "health_safety_rules",
+}
+
+
+def __getattr__(name: str):
+    if name in _CURRENT_TABLES:
+        return getattr(labels(), _CURRENT_TABLES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,37 @@
+"""Streamlit session helpers and stepper for the Guided Care Plan."""
+from __future__ import annotations
+
+
+from typing import Dict, Tuple
+
+import streamlit as st
+
+from senior_nav.core import gcp as core
+from senior_nav.core.gcp import STEP_TITLES
+
+
+def ensure_gcp_session() -> Tuple[Dict[str, object], Dict[str, object]]:
+    """Guarantee session storage for answers and evaluation output."""
+
+    return core.ensure_gcp_session(st.session_state)
+
+
+def render_stepper(current_step: int) -> None:
+    """Render a simple progress stepper for the Guided Care Plan."""
+
+    current_step, progress_ratio = core.stepper_position(current_step)
+    st.progress(progress_ratio)
+
+    cols = st.columns(len(STEP_TITLES))
+    for idx, (col, title) in enumerate(zip(cols, STEP_TITLES), start=1):
+        with col:
+            if idx <= current_step:
+                col.markdown(f"**{idx}. {title}**")
+            else:
+                col.caption(f"{idx}. {title}")
+
+
+def current_audiencing_snapshot() -> Dict[str, object]:
+    """Return the latest audiencing snapshot, ensuring defaults."""
+
+    return core.current_audiencing_snapshot(st.session_state)
@@ -45,21 +45,6 @@ except Exception:
             if next and st.button(next.label, key=next.key, type="primary", use_container_width=True):
                 st.switch_page("pages/expert_review.py")
 
-# Pull derived numbers from shared state
-from cost_planner_v2.cp_state import derive
-
-try:
-    d = derive()
-except Exception:
-    d = {}
-
-monthly_all_in = int(round(d.get("monthly_all_in", 0) or 0))
-income_total   = int(round(d.get("income_total", 0) or 0))
-benefits_total = int(round(d.get("benefits_total", 0) or 0))
-gap            = int(round(d.get("gap", 0) or 0))
-assets_total   = int(round(d.get("assets_total_effective", 0) or 0))
-runway_months  = d.get("runway_months", "Unlimited")
-
 def _fmt_money(n: int) -> str:
     return f"${n:,.0f}"
 
@@ -70,6 +55,22 @@ def main() -> None:
     st.set_page_config(page_title="Cost Planner · Timeline", layout="wide")
     apply_cost_planner_theme()
 
+    # Pull derived numbers from shared state (only when the page renders)
+    from cost_planner_v2.cp_state import derive
+    from cost_planner_v2.projection import project_cp
+
+    try:
+        d = derive()
+    except Exception:
+        d = {}
+
+    monthly_all_in = int(round(d.get("monthly_all_in", 0) or 0))
+    income_total   = int(round(d.get("income_total", 0) or 0))
+    benefits_total = int(round(d.get("benefits_total", 0) or 0))
+    gap            = int(round(d.get("gap", 0) or 0))
+    assets_total   = int(round(d.get("assets_total_effective", 0) or 0))
+    runway_months  = d.get("runway_months", "Unlimited")
+
     with cost_planner_page_container():
         render_app_header()
         render_wizard_hero("Your Money Timeline", "Here’s how long your money lasts with the choices so far.")
@@ -86,6 +87,20 @@ def main() -> None:
             Metric("Runway", _fmt_runway(runway_months)),
         ])
 
+        projection = project_cp()
+        yearly = projection.yearly_balance()
+        st.markdown("#### Savings over time")
+        st.line_chart(
+            {"Year": list(range(1, len(yearly) + 1)), "Savings balance": yearly.round(0).tolist()},
+            x="Year",
+            y="Savings balance",
+        )
+        if projection.runs_out:
+            m = projection.depletion_month
+            st.caption(f"With rising care costs, savings run out around year {(m - 1) // 12 + 1} (month {m}).")
+        else:
+            st.caption(f"Savings last the full {projection.months // 12}-year horizon with rising care costs.")
+
         # CTA row
         render_nav_buttons(
             prev=NavButton("← Back to Modules", "tl_back"),
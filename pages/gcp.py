@@ -1,6 +1,8 @@
 """Guided Care Plan intro with financial context questions."""
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 import streamlit as st
 
 from audiencing import (
@@ -10,7 +12,7 @@ from audiencing import (
     snapshot_audiencing,
 )
 from guided_care_plan import ensure_gcp_session, get_question_meta, render_stepper
-from guided_care_plan.state import current_audiencing_snapshot
+from guided_care_plan.session import current_audiencing_snapshot
 from senior_nav.components.choice_chips import choice_single
 from ui.components import card_panel
 from ui.theme import inject_theme
@@ -55,7 +57,7 @@ def _question_config(question_id: str) -> tuple[dict[str, object], list[str], di
     option_map: dict[str, str] = {}
     values: list[str] = []
     for option in meta.get("options", []):
-        if isinstance(option, dict):
+        if isinstance(option, Mapping):
             value = option.get("value")
             label = option.get("label", str(value))
         else:
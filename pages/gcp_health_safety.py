@@ -6,7 +6,7 @@ from __future__ import annotations
 import streamlit as st
 
 from guided_care_plan import ensure_gcp_session, get_question_meta, render_stepper
-from guided_care_plan.state import current_audiencing_snapshot
+from guided_care_plan.session import current_audiencing_snapshot
 from senior_nav.components.choice_chips import choice_multi, choice_single, normalize_none
 from ui.theme import inject_theme
 
@@ -4,8 +4,8 @@ from __future__ import annotations
 import streamlit as st
 
 from audiencing import ensure_audiencing_state
-from guided_care_plan import ensure_gcp_session, evaluate_guided_care, get_question_meta, render_stepper
-from guided_care_plan.state import current_audiencing_snapshot
+from guided_care_plan import ensure_gcp_session, evaluate_guided_care_cached, get_question_meta, render_stepper
+from guided_care_plan.session import current_audiencing_snapshot
 from ui.theme import inject_theme
 
 
@@ -77,7 +77,7 @@ if submitted:
             answers["chronic"] = []
     else:
         answers["chronic"] = chosen
-    result = evaluate_guided_care(answers, aud_state)
+    result = evaluate_guided_care_cached(answers, aud_state)
     gcp_result.update(result)
     gcp_result["audiencing_snapshot"] = snapshot
     st.session_state["gcp"] = gcp_result
@@ -0,0 +1,265 @@
+"""Headless cohort pipeline: audiencing + Guided Care Plan + cost gap per referral.
+
+The intake team's referral exports (CSV or JSONL, hundreds of thousands of
+rows) are scored without the UI:
+
+- ``read_chunks`` streams the input ``chunk_size`` rows at a time.
+- ``score_chunk`` turns one chunk into output rows in a few columnar passes:
+  - the audiencing decision table (sanitized block and route per
+    qualifier bitmask);
+  - ``evaluate_guided_care_batch`` for the GCP outcome;
+  - ``compute_derived_batch`` for the Cost Planner v2 monthly gap and
+    runway.
+- ``run_cohort`` fans chunks out to a process pool. It keeps at most
+  ``2 x workers`` chunks in flight and writes results in input order as
+  they complete, so memory stays bounded by chunk size, not file size.
+
+Nothing here imports Streamlit or touches ``st.session_state``: qualifiers,
+answers and cost inputs come from the row. ``tools/cohort_batch.py`` is the CLI.
+``runway_months`` is written as null when the gap is covered (the UI's inf).
+
+Input columns (all optional; missing values read as "no" / unanswered / 0):
+  id                                     referral id, copied through
+  entry                                  self | proxy | ...
+  is_veteran, has_partner, owns_home,    yes/no, true/false, 1/0
+  on_medicaid, urgent
+  <GCP question ids>                     option values; multi-selects as
+                                         "a|b" in CSV, lists in JSONL
+  monthly_cost, income_total, ...        Cost Planner v2 derive inputs
+                                         (cp_derive.DERIVE_INPUTS names)
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from senior_nav.core.audiencing import AUDIENCING_QUALIFIER_KEYS, DECISION_TABLE, URGENT_FEATURE_FLAG, qualifier_mask
+from senior_nav.core.cp_derive import INPUT_NAMES, _to_num, compute_derived_batch
+from guided_care_plan.batch import evaluate_guided_care_batch
+from guided_care_plan.state import QUESTION_ORDER, labels
+
+CHUNK_SIZE = 5000
+DEFAULT_MONTHLY_COST = 4200.0   # cp_state's default setting cost
+TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y"})
+
+OUTPUT_FIELDS: Tuple[str, ...] = (
+    "id", "entry", "next_route",
+    "household_size", "va_applicable", "homeowner", "medicaid_context", "urgent_case",
+    "recommended_setting", "care_intensity", "safety_flags", "payment_context", "funding_confidence",
+    "monthly_all_in", "monthly_offsets", "gap", "runway_months",
+)
+
+Row = Dict[str, Any]
+
+
+# ---------------------------------------------------------------------------
+# Input / output
+# ---------------------------------------------------------------------------
+def _format(path: Path, explicit: Optional[str]) -> str:
+    if explicit:
+        return explicit
+    return "jsonl" if path.suffix.lower() in (".jsonl", ".ndjson", ".json") else "csv"
+
+
+def read_chunks(path: Path, chunk_size: int = CHUNK_SIZE, fmt: Optional[str] = None) -> Iterator[List[Row]]:
+    """Rows of ``path`` in lists of ``chunk_size`` (only one chunk is held)."""
+    fmt = _format(path, fmt)
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        rows: Iterable[Row] = (
+            csv.DictReader(handle) if fmt == "csv"
+            else (json.loads(line) for line in handle if line.strip())
+        )
+        chunk: List[Row] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+class _Writer:
+    def __init__(self, handle: TextIO, fmt: str) -> None:
+        self.handle = handle
+        self.fmt = fmt
+        self.csv = csv.DictWriter(handle, fieldnames=OUTPUT_FIELDS) if fmt == "csv" else None
+        if self.csv is not None:
+            self.csv.writeheader()
+
+    def write(self, rows: Sequence[Row]) -> None:
+        if self.csv is not None:
+            self.csv.writerows(
+                {**row, "safety_flags": "|".join(row["safety_flags"])} for row in rows
+            )
+        else:
+            buffer = io.StringIO()
+            for row in rows:
+                buffer.write(json.dumps(row, separators=(",", ":")))
+                buffer.write("\n")
+            self.handle.write(buffer.getvalue())
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+def _flag(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in TRUE_STRINGS
+
+
+def _answer(value: Any, multi: bool) -> Any:
+    if value is None or value == "":
+        return [] if multi else None
+    if multi:
+        if isinstance(value, (list, tuple)):
+            return list(value)
+        return [part for part in str(value).split("|") if part]
+    return value
+
+
+def _cost_inputs(rows: Sequence[Row], settings: np.ndarray, setting_costs: Mapping[str, float]) -> np.ndarray:
+    values = np.zeros((len(rows), len(INPUT_NAMES)))
+    for col, name in enumerate(INPUT_NAMES):
+        for i, row in enumerate(rows):
+            raw = row.get(name)
+            if raw not in (None, ""):
+                values[i, col] = _to_num(raw)
+    # Referrals without a quoted cost use the recommended setting's cost.
+    cost_col = INPUT_NAMES.index("monthly_cost")
+    missing = [i for i, row in enumerate(rows) if row.get("monthly_cost") in (None, "")]
+    for i in missing:
+        values[i, cost_col] = setting_costs.get(settings[i], DEFAULT_MONTHLY_COST)
+    return values
+
+
+def score_chunk(
+    rows: Sequence[Row],
+    setting_costs: Optional[Mapping[str, float]] = None,
+    urgent_feature_enabled: bool = URGENT_FEATURE_FLAG,
+) -> List[Row]:
+    """Score one chunk; returns one output row per input row, in order."""
+    if not rows:
+        return []
+    multi = labels().multi_select
+    flag_bit = 1 << len(AUDIENCING_QUALIFIER_KEYS) if urgent_feature_enabled else 0
+
+    qualifiers = [{key: _flag(row.get(key)) for key in AUDIENCING_QUALIFIER_KEYS} for row in rows]
+    decisions = [DECISION_TABLE[qualifier_mask(q) | flag_bit] for q in qualifiers]
+
+    columns = {qid: [_answer(row.get(qid), qid in multi) for row in rows] for qid in QUESTION_ORDER}
+    gcp = evaluate_guided_care_batch(columns, on_medicaid=[q["on_medicaid"] for q in qualifiers])
+
+    derived = compute_derived_batch(_cost_inputs(rows, gcp["recommended_setting"], setting_costs or {}))
+    all_in = np.round(derived["monthly_all_in"], 2).tolist()
+    offsets = np.round(derived["monthly_offsets"], 2).tolist()
+    gaps = np.round(derived["gap"], 2).tolist()
+    runway = [None if np.isinf(v) else round(v, 1) for v in derived["runway_months"].tolist()]
+
+    out: List[Row] = []
+    for i, row in enumerate(rows):
+        decision = decisions[i]
+        sanitized = decision.sanitized
+        out.append({
+            "id": row.get("id"),
+            "entry": row.get("entry") or None,
+            "next_route": decision.next_route,
+            "household_size": sanitized["household_size"],
+            "va_applicable": sanitized["va_applicable"],
+            "homeowner": sanitized["homeowner"],
+            "medicaid_context": sanitized["medicaid_context"],
+            "urgent_case": sanitized["urgent_case"],
+            "recommended_setting": gcp["recommended_setting"][i],
+            "care_intensity": gcp["care_intensity"][i],
+            "safety_flags": list(gcp["safety_flags"][i]),
+            "payment_context": gcp["payment_context"][i],
+            "funding_confidence": gcp["funding_confidence"][i],
+            "monthly_all_in": all_in[i],
+            "monthly_offsets": offsets[i],
+            "gap": gaps[i],
+            "runway_months": runway[i],
+        })
+    return out
+
+
+def _score_task(rows: List[Row], setting_costs: Mapping[str, float]) -> Tuple[List[Row], float]:
+    start = time.process_time()
+    scored = score_chunk(rows, setting_costs)
+    return scored, time.process_time() - start
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+@dataclass
+class CohortStats:
+    rows: int = 0
+    chunks: int = 0
+    workers: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0          # scoring CPU time summed over workers
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.wall_s if self.wall_s else 0.0
+
+    @property
+    def rows_per_core_s(self) -> float:
+        """Scoring throughput of one core (CPU time, excludes I/O and IPC)."""
+        return self.rows / self.cpu_s if self.cpu_s else 0.0
+
+
+def run_cohort(
+    source: Path,
+    dest: Path,
+    *,
+    workers: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+    in_format: Optional[str] = None,
+    out_format: Optional[str] = None,
+    setting_costs: Optional[Mapping[str, float]] = None,
+) -> CohortStats:
+    """Score ``source`` into ``dest``. ``workers=0`` scores in this process."""
+    costs = dict(setting_costs or {})
+    stats = CohortStats(workers=workers)
+    start = time.perf_counter()
+    chunks = read_chunks(source, chunk_size, in_format)
+    with dest.open("w", encoding="utf-8", newline="") as handle:
+        writer = _Writer(handle, _format(dest, out_format))
+
+        def emit(result: Tuple[List[Row], float]) -> None:
+            scored, cpu = result
+            writer.write(scored)
+            stats.rows += len(scored)
+            stats.chunks += 1
+            stats.cpu_s += cpu
+
+        if workers <= 0:
+            for chunk in chunks:
+                emit(_score_task(chunk, costs))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                inflight: Deque[Future] = deque()
+                for chunk in chunks:
+                    inflight.append(pool.submit(_score_task, chunk, costs))
+                    if len(inflight) >= 2 * workers:
+                        emit(inflight.popleft().result())
+                while inflight:
+                    emit(inflight.popleft().result())
+    stats.wall_s = time.perf_counter() - start
+    return stats
+
+
+def default_workers() -> int:
+    return max(1, (os.cpu_count() or 1) - 1)
@@ -6,14 +6,13 @@ from textwrap import dedent
 
 import streamlit as st
 
+from senior_nav.runtime.styles import inject_css, inject_css_file
 from senior_nav.ui_style import tokens
 
 _STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
 _BUTTONS_CSS_PATH = _STATIC_DIR / "buttons.css"
 _CHIP_CSS_PATH = _STATIC_DIR / "chips.css"
 
-_THEME_STATE_KEY = "__sn_theme_injected__"
-
 
 def _build_css() -> str:
     palette = tokens.PALETTE
@@ -156,21 +155,10 @@ def _build_css() -> str:
 
 
 def inject_theme() -> None:
-    """Inject shared theme + component CSS once per session."""
-    if st.session_state.get(_THEME_STATE_KEY):
-        return
-
+    """Inject shared theme + component CSS (once per rerun; repeats are no-ops)."""
     # 1) tokens
-    st.markdown(_build_css(), unsafe_allow_html=True)
-
+    inject_css(_build_css())
     # 2) buttons
-    if _BUTTONS_CSS_PATH.exists():
-        buttons_css = _BUTTONS_CSS_PATH.read_text(encoding="utf-8")
-        st.markdown(f"<style>{buttons_css}</style>", unsafe_allow_html=True)
-
+    inject_css_file(_BUTTONS_CSS_PATH)
     # 3) chips
-    if _CHIP_CSS_PATH.exists():
-        chips_css = _CHIP_CSS_PATH.read_text(encoding="utf-8")
-        st.markdown(f"<style>{chips_css}</style>", unsafe_allow_html=True)
-
-    st.session_state[_THEME_STATE_KEY] = True
+    inject_css_file(_CHIP_CSS_PATH)
@@ -0,0 +1,26 @@
+"""Streamlit-free cores of the audiencing, Guided Care Plan and Cost Planner state.
+
+``audiencing``, ``gcp`` and ``cost_planner`` hold the schema defaults,
+validation and math of one feature as functions over explicit state objects
+(a ``session`` mapping such as ``st.session_state`` or a plain dict, or the
+feature's own block); ``cp_derive`` is the Cost Planner v2 gap and runway
+math; ``flows`` is the step graph shared by the GCP, Cost Planner and PFMA
+flows. The modules at their historical locations (``audiencing``,
+``guided_care_plan.session``, ``cost_planner_shared``,
+``cost_planner_v2.cp_state``) are thin adapters that bind these functions
+to ``st.session_state`` and do the rendering.
+
+Batch jobs, workers and tests import the cores directly and never load
+Streamlit; ``tools/bench_core_imports.py`` checks the import budget.
+"""
+from __future__ import annotations
+
+import importlib
+
+__all__ = ["audiencing", "cost_planner", "cp_derive", "flows", "gcp"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,243 @@
+"""Audiencing schema, sanitizer and router over explicit state.
+
+``session`` arguments are the mapping that holds the ``audiencing`` block
+(``st.session_state`` in the app, a dict in batch jobs and tests); ``state``
+arguments are the block itself. ``audiencing.py`` binds these to the
+Streamlit session.
+
+This module does not import Streamlit.
+"""
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from senior_nav.runtime.snapshots import FrozenMap, freeze, thaw
+
+# ---------------------------------------------------------------------------
+# State schema constants
+# ---------------------------------------------------------------------------
+AUDIENCING_QUALIFIER_KEYS = [
+    "is_veteran",
+    "has_partner",
+    "owns_home",
+    "on_medicaid",
+    "urgent",
+]
+
+URGENT_FEATURE_FLAG = True
+
+
+def default_audiencing_state() -> Dict[str, Any]:
+    return {
+        "entry": None,
+        "qualifiers": {key: False for key in AUDIENCING_QUALIFIER_KEYS},
+        "route": {"next": None, "meta": {}},
+        "people": {"recipient_name": "", "proxy_name": ""},
+        "sanitized": {},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Precomputed decisions
+# ---------------------------------------------------------------------------
+# Sanitized block and route for every combination of the five qualifiers and
+# the urgent feature flag, indexed by ``qualifier_mask(...) | flag << 5``.
+_QUALIFIER_BITS = tuple((key, 1 << bit) for bit, key in enumerate(AUDIENCING_QUALIFIER_KEYS))
+_QUALIFIER_KEYSET = frozenset(AUDIENCING_QUALIFIER_KEYS)
+_URGENT_FLAG_BIT = 1 << len(AUDIENCING_QUALIFIER_KEYS)
+_STATE_KEYSET = frozenset(default_audiencing_state())
+_ROUTE_KEYSET = frozenset(("next", "meta"))
+
+
+class AudiencingDecision(NamedTuple):
+    sanitized: FrozenMap
+    next_route: str
+    meta: FrozenMap | None  # None: reasons depend on the entry (see _entry_meta)
+
+
+def qualifier_mask(qualifiers: Dict[str, Any]) -> int:
+    mask = 0
+    for key, bit in _QUALIFIER_BITS:
+        if qualifiers.get(key):
+            mask |= bit
+    return mask
+
+
+def _decide(mask: int, urgent_feature_enabled: bool) -> AudiencingDecision:
+    q = {key: bool(mask & bit) for key, bit in _QUALIFIER_BITS}
+    sanitized = {
+        "household_size": 2 if q["has_partner"] else 1,
+        "partner_included": q["has_partner"],
+        "va_applicable": q["is_veteran"],
+        "homeowner": q["owns_home"],
+        "home_related_support_enabled": q["owns_home"],
+        "medicaid_context": q["on_medicaid"],
+        "show_medicaid_banner": q["on_medicaid"],
+        "urgent_case": q["urgent"],
+    }
+    if not q["is_veteran"]:
+        sanitized["va_offsets"] = 0
+    if urgent_feature_enabled and q["urgent"]:
+        meta = freeze({"reasons": ["urgent_case"], "urgent_feature_enabled": True})
+        return AudiencingDecision(freeze(sanitized), "pfma", meta)
+    return AudiencingDecision(freeze(sanitized), "contextual_welcome", None)
+
+
+DECISION_TABLE: Tuple[AudiencingDecision, ...] = tuple(
+    _decide(mask, flag) for flag in (False, True) for mask in range(_URGENT_FLAG_BIT)
+)
+
+
+@lru_cache(maxsize=64)
+def _entry_meta(entry: str, urgent_feature_enabled: bool) -> FrozenMap:
+    return freeze({"reasons": [f"entry_{entry}"], "urgent_feature_enabled": urgent_feature_enabled})
+
+
+def audiencing_decision(state: Dict[str, Any], urgent_feature_enabled: bool | None = None) -> AudiencingDecision:
+    if urgent_feature_enabled is None:
+        urgent_feature_enabled = URGENT_FEATURE_FLAG
+    index = qualifier_mask(state["qualifiers"]) | (_URGENT_FLAG_BIT if urgent_feature_enabled else 0)
+    return DECISION_TABLE[index]
+
+
+# ---------------------------------------------------------------------------
+# State operations
+# ---------------------------------------------------------------------------
+def validate_audiencing_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Bring an audiencing block up to the schema, in place.
+
+    The walk is skipped when the block already has every contract key and
+    the qualifiers have exactly the qualifier keys. The check reads only
+    the block itself, so nothing extra is stored in (or persisted with) it.
+    """
+
+    qualifiers = state.get("qualifiers")
+    route = state.get("route")
+    if (
+        type(qualifiers) is dict and qualifiers.keys() == _QUALIFIER_KEYSET
+        and type(route) is dict and route.keys() >= _ROUTE_KEYSET
+        and state.keys() >= _STATE_KEYSET
+    ):
+        return state
+    state.pop("_validated", None)  # id() marker written by earlier releases
+    # Guarantee contract keys
+    state.setdefault("entry", None)
+    qualifiers = state.setdefault("qualifiers", {})
+    for key in AUDIENCING_QUALIFIER_KEYS:
+        qualifiers.setdefault(key, False)
+    # Clean up any unexpected qualifier keys to keep schema tight
+    for stray_key in list(qualifiers.keys()):
+        if stray_key not in AUDIENCING_QUALIFIER_KEYS:
+            qualifiers.pop(stray_key)
+    route = state.setdefault("route", {})
+    route.setdefault("next", None)
+    route.setdefault("meta", {})
+    state.setdefault("people", {"recipient_name": "", "proxy_name": ""})
+    state.setdefault("sanitized", {})
+    return state
+
+
+def ensure_audiencing_state(session: MutableMapping) -> Dict[str, Any]:
+    """The valid ``audiencing`` block of ``session``, created if missing."""
+
+    state = session.get("audiencing")
+    if not isinstance(state, dict):
+        state = default_audiencing_state()
+        session["audiencing"] = state
+    return validate_audiencing_state(state)
+
+
+def apply_audiencing_sanitizer(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply downstream-safe defaults based on qualifier toggles.
+
+    The values for the current qualifiers come from ``DECISION_TABLE`` and
+    are merged into ``state["sanitized"]``, which stays a mutable dict;
+    keys the table does not set are kept.
+    """
+
+    validate_audiencing_state(state)
+    decided = audiencing_decision(state).sanitized
+    sanitized = state.get("sanitized")
+    if type(sanitized) is not dict:
+        sanitized = state["sanitized"] = thaw(sanitized) if isinstance(sanitized, dict) else {}
+    sanitized.update(decided)
+    if "va_offsets" not in decided:
+        sanitized.pop("va_offsets", None)
+    return state
+
+
+def compute_audiencing_route(
+    state: Dict[str, Any], *, urgent_feature_enabled: bool | None = None
+) -> Dict[str, Any]:
+    """Determine the next module destination based on qualifiers."""
+
+    validate_audiencing_state(state)
+    if urgent_feature_enabled is None:
+        urgent_feature_enabled = URGENT_FEATURE_FLAG
+    decision = audiencing_decision(state, urgent_feature_enabled)
+    meta = decision.meta
+    if meta is None:
+        meta = _entry_meta(str(state.get("entry") or "unknown"), bool(urgent_feature_enabled))
+
+    route = state.setdefault("route", {})
+    route["next"] = decision.next_route
+    route["meta"] = {"reasons": list(meta["reasons"]), "urgent_feature_enabled": meta["urgent_feature_enabled"]}
+    return route
+
+
+def snapshot_audiencing(state: Dict[str, Any], previous: Optional[FrozenMap] = None) -> FrozenMap:
+    """Create a canonical snapshot for downstream consumers.
+
+    The snapshot is immutable and shares unchanged blocks with ``previous``
+    (the same object comes back when nothing changed), so consumers can
+    embed it without copying and compare or key caches on
+    ``hash(snapshot)``.
+    """
+
+    validate_audiencing_state(state)
+    qualifiers = {
+        key: bool(state["qualifiers"].get(key, False))
+        for key in AUDIENCING_QUALIFIER_KEYS
+    }
+
+    snapshot = {
+        "entry": state.get("entry"),
+        "qualifiers": qualifiers,
+        "route": {
+            "next": state.get("route", {}).get("next"),
+            "meta": state.get("route", {}).get("meta", {}),
+        },
+        "people": state.get("people", {}),
+        "sanitized": state.get("sanitized", {}),
+        "visibility": {
+            "partner": bool(qualifiers["has_partner"]),
+            "home": bool(qualifiers["owns_home"]),
+            "veteran": bool(qualifiers["is_veteran"]),
+        },
+        "flags": {
+            "medicaid": bool(qualifiers["on_medicaid"]),
+            "urgent": bool(qualifiers["urgent"]),
+        },
+    }
+    return freeze(snapshot, previous)
+
+
+def log_audiencing_set(session: MutableMapping, snapshot: Dict[str, Any]) -> None:
+    """Append an audiencing_set event to the session's bounded event log.
+
+    The log gets its own random session id. ``session["_sid"]`` restores
+    saved state, so it must never be written to the analytics files.
+    """
+
+    from senior_nav.runtime.events import session_event_log  # only the app logs events
+
+    session_event_log(session).append("audiencing_set", snapshot)
+
+
+def reset_audiencing_state(session: MutableMapping) -> None:
+    """Clear the audiencing block and its snapshot."""
+
+    session["audiencing"] = default_audiencing_state()
+    session.pop("audiencing_snapshot", None)
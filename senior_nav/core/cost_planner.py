@@ -0,0 +1,416 @@
+"""Cost Planner field tables, subtotal graph and totals over explicit state.
+
+``session`` arguments are the mapping that holds the ``cost_planner``,
+``audiencing`` and ``gcp`` blocks (``st.session_state`` in the app, a dict
+in batch jobs and tests); ``cp`` arguments are the ``cost_planner`` block.
+``cost_planner_shared`` binds these to the Streamlit session.
+
+This module does not import Streamlit.
+"""
+from __future__ import annotations
+
+import csv
+import itertools
+from collections.abc import MutableMapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from senior_nav.runtime.content import CONTENT
+
+
+ROOT = Path(__file__).resolve().parents[2]
+FIELD_SPEC_PATH = ROOT / "cost_planner_user_data_inputs_only.csv"
+FIELD_MAP_PATH = ROOT / "cost_planner_user_data_map.csv"
+
+
+class FieldSpec(NamedTuple):
+    field_id: str
+    label: str
+    category: str
+    required: bool
+    helper: str
+    default: float
+
+
+def _read_field_specs(path: Path) -> Dict[str, FieldSpec]:
+    specs: Dict[str, FieldSpec] = {}
+    if not path.exists():
+        raise FileNotFoundError(f"Missing Cost Planner field spec: {path}")
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        for row in reader:
+            field_id = row["field_id"].strip()
+            specs[field_id] = FieldSpec(
+                field_id=field_id,
+                label=row.get("label", "").strip(),
+                category=row.get("category", "").strip(),
+                required=row.get("required", "").strip().lower() in {"true", "1", "yes", "required"},
+                helper=row.get("helper_text", "").strip(),
+                default=float(row.get("default_value", "0") or 0),
+            )
+    return specs
+
+
+def _read_field_map(path: Path) -> Dict[str, str]:
+    mapping: Dict[str, str] = {}
+    if not path.exists():
+        raise FileNotFoundError(f"Missing Cost Planner field mapping: {path}")
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        reader = csv.DictReader(handle)
+        for row in reader:
+            field_id = row["field_id"].strip()
+            normalized = row["normalized_key"].strip()
+            mapping[field_id] = normalized
+    return mapping
+
+
+class FieldIndex(NamedTuple):
+    """Reverse lookups over the field map, joined with the field spec categories."""
+    key_by_field: Mapping[str, str]
+    fields_by_key: Mapping[str, Tuple[str, ...]]
+    fields_by_category: Mapping[str, Tuple[str, ...]]
+    category_by_field: Mapping[str, str]
+
+    def fields_for_keys(self, keys: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(fid for key in keys for fid in self.fields_by_key.get(key, ()))
+
+
+def build_field_index(mapping: Mapping[str, str], specs: Mapping[str, FieldSpec]) -> FieldIndex:
+    by_key: Dict[str, List[str]] = {}
+    for fid, norm in mapping.items():
+        by_key.setdefault(norm, []).append(fid)
+    by_category: Dict[str, List[str]] = {}
+    category_by_field: Dict[str, str] = {}
+    for fid in mapping:
+        spec = specs.get(fid)
+        if spec is None or not spec.category:
+            continue
+        category_by_field[fid] = spec.category
+        by_category.setdefault(spec.category, []).append(fid)
+    return FieldIndex(
+        key_by_field=MappingProxyType(dict(mapping)),
+        fields_by_key=MappingProxyType({k: tuple(v) for k, v in by_key.items()}),
+        fields_by_category=MappingProxyType({k: tuple(v) for k, v in by_category.items()}),
+        category_by_field=MappingProxyType(category_by_field),
+    )
+
+
+class FieldTables(NamedTuple):
+    """Both CSVs parsed, plus every lookup derived from them (one content version)."""
+    specs: Mapping[str, FieldSpec]
+    mapping: Mapping[str, str]
+    index: FieldIndex
+    subtotal_fields: Mapping[str, Tuple[str, ...]]  # subtotal -> field_ids that feed it
+    field_subtotals: Mapping[str, str]              # field_id -> subtotal it feeds
+    version: int = 0                                # bumps on every reload
+
+
+_TABLE_VERSIONS = itertools.count(1)
+
+
+def field_tables() -> FieldTables:
+    """Current field tables (hot-reloaded when either CSV changes)."""
+    return CONTENT.get("cost_planner.fields")
+
+
+def load_field_specs() -> Mapping[str, FieldSpec]:
+    return field_tables().specs
+
+
+def load_field_map() -> Mapping[str, str]:
+    return field_tables().mapping
+
+
+def load_field_index() -> FieldIndex:
+    return field_tables().index
+
+
+def ensure_core_state(session: MutableMapping) -> Dict:
+    """Ensure required session state blocks exist and honor audience gates.
+
+    Returns the ``cost_planner`` block.
+    """
+    aud = session.setdefault(
+        "audiencing",
+        {
+            "entry": "self",
+            "qualifiers": {
+                "is_veteran": False,
+                "has_partner": False,
+                "owns_home": False,
+                "on_medicaid": False,
+                "urgent": False,
+            },
+            "route": {"next": None},
+        },
+    )
+    gcp_state = session.setdefault(
+        "gcp",
+        {
+            "recommended_setting": None,
+            "care_intensity": None,
+            "safety_flags": [],
+            "chronic_conditions": [],
+            "payment_context": None,
+            "funding_confidence": None,
+            "audiencing_snapshot": None,
+            "DecisionTrace": None,
+        },
+    )
+    cost_defaults = {
+        "mode": "tinkering",
+        "household": "single",
+        "inputs": {},
+        "subtotals": {
+            "housing": 0.0,
+            "care": 0.0,
+            "medical": 0.0,
+            "insurance": 0.0,
+            "debts": 0.0,
+            "other": 0.0,
+            "offsets": 0.0,
+        },
+        "monthly_total": 0.0,
+        "net_out_of_pocket": 0.0,
+        "assets": 0.0,
+        "runway_months": None,
+        "decision_log": [],
+        "expert_flags": [],
+        "snapshot_for_crm": {},
+    }
+    cp = session.setdefault("cost_planner", cost_defaults)
+
+    quals = aud.get("qualifiers", {})
+
+    if not quals.get("has_partner", False):
+        cp["household"] = "single"
+    cp.setdefault("custom_line_items", [])
+    cp.setdefault("notes", "")
+    cp.setdefault("other_base", 0.0)
+
+    # Seed decision log contextually
+    if quals.get("on_medicaid"):
+        if "Medicaid short-circuit" not in cp["decision_log"]:
+            cp["decision_log"].append("Medicaid short-circuit")
+        if gcp_state.get("payment_context") != "medicaid":
+            gcp_state["payment_context"] = "medicaid"
+
+    recommended = gcp_state.get("recommended_setting")
+    if recommended and all(
+        entry != f"Recommendation: {recommended}" for entry in cp["decision_log"]
+    ):
+        cp["decision_log"].append(f"Recommendation: {recommended}")
+    return cp
+
+
+def inputs_dict(session: MutableMapping) -> Dict[str, float]:
+    return ensure_core_state(session)["inputs"]
+
+
+def get_numeric(session: MutableMapping, field_id: str) -> float:
+    value = inputs_dict(session).get(field_id)
+    if value is None:
+        spec = load_field_specs().get(field_id)
+        return spec.default if spec else 0.0
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def set_numeric(session: MutableMapping, field_id: str, value: float) -> None:
+    apply_input(ensure_core_state(session), field_id, value)
+
+
+def summarize_categories(
+    session: MutableMapping, keys: Iterable[str], mapping: Optional[Dict[str, str]] = None
+) -> float:
+    """Sum the inputs behind the given normalized keys.
+
+    Uses the cached field index, so the cost follows the number of keys, not
+    the size of the map. A custom ``mapping`` gets its own (uncached) index.
+    """
+    index = load_field_index()
+    if mapping is not None and mapping is not load_field_map():
+        index = build_field_index(mapping, load_field_specs())
+    inputs = inputs_dict(session)
+    return sum(float(inputs.get(fid, 0) or 0) for fid in index.fields_for_keys(keys))
+
+
+# ---------------------------------------------------------------------------
+# Dependency graph: field_id -> normalized key -> subtotal -> totals
+# ---------------------------------------------------------------------------
+SUBTOTAL_KEYS: Dict[str, Tuple[str, ...]] = {
+    "housing": ("housing_rent", "housing_util", "housing_maint"),
+    "care": ("care_base", "care_level_addon", "care_second_person", "care_suppl_services"),
+    "medical": ("med_rx", "med_supplies", "med_transport"),
+    "insurance": ("ins_health", "ins_ltc", "ins_other"),
+    "debts": ("debt_cc", "debt_loans"),
+    "other": ("other_misc",),
+    "offsets": (
+        "inc_ss", "inc_pension", "inc_annuity", "inc_other",
+        "off_va", "off_medicaid", "off_ltc_payout",
+    ),
+}
+COST_SUBTOTALS: Tuple[str, ...] = tuple(name for name in SUBTOTAL_KEYS if name != "offsets")
+# monthly_total <- cost subtotals; net_out_of_pocket <- monthly_total, offsets;
+# assets, runway_months <- mode, ASSETS_FIELD, net_out_of_pocket
+ASSETS_FIELD = "assets_total"
+_SYNCED_FLAG = "_subtotals_synced"
+
+
+def _build_field_tables(spec_path: Path, map_path: Path) -> FieldTables:
+    specs = _read_field_specs(spec_path)
+    mapping = _read_field_map(map_path)
+    index = build_field_index(mapping, specs)
+    by_subtotal = {name: index.fields_for_keys(keys) for name, keys in SUBTOTAL_KEYS.items()}
+    return FieldTables(
+        specs=MappingProxyType(specs),
+        mapping=MappingProxyType(mapping),
+        index=index,
+        subtotal_fields=MappingProxyType(by_subtotal),
+        field_subtotals=MappingProxyType({fid: name for name, fids in by_subtotal.items() for fid in fids}),
+        version=next(_TABLE_VERSIONS),
+    )
+
+
+CONTENT.register("cost_planner.fields", [FIELD_SPEC_PATH, FIELD_MAP_PATH], _build_field_tables, lazy=True)
+
+
+def subtotal_fields() -> Mapping[str, Tuple[str, ...]]:
+    """subtotal -> field_ids that feed it."""
+    return field_tables().subtotal_fields
+
+
+def field_subtotals() -> Mapping[str, str]:
+    """field_id -> subtotal it feeds (fields outside SUBTOTAL_KEYS are absent)."""
+    return field_tables().field_subtotals
+
+
+def apply_input(cp: Dict, field_id: str, value: float) -> None:
+    """Store one input and update only the subtotal and totals that depend on it."""
+    cp["inputs"][field_id] = float(value or 0.0)
+    tables = field_tables()
+    if cp.get(_SYNCED_FLAG) != tables.version:
+        return  # the next recompute_costs() does the full pass (new session or field map)
+    subtotal = tables.field_subtotals.get(field_id)
+    if subtotal is not None:
+        cp["subtotals"][subtotal] = _subtotal_value(tables, cp["inputs"], subtotal)
+        _refresh_totals(cp)
+    elif field_id == ASSETS_FIELD:
+        _refresh_totals(cp)
+
+
+def recompute_subtotals(cp: Dict) -> None:
+    """Full pass: rebuild every subtotal from cp["inputs"]."""
+    tables = field_tables()
+    for name in SUBTOTAL_KEYS:
+        cp["subtotals"][name] = _subtotal_value(tables, cp["inputs"], name)
+    cp[_SYNCED_FLAG] = tables.version
+    _refresh_totals(cp)
+
+
+def _subtotal_value(tables: FieldTables, inputs: Dict[str, float], subtotal: str) -> float:
+    return sum(float(inputs.get(fid, 0) or 0) for fid in tables.subtotal_fields[subtotal])
+
+
+def _refresh_totals(cp: Dict) -> None:
+    subtotals = cp["subtotals"]
+    cp["monthly_total"] = sum(subtotals[name] for name in COST_SUBTOTALS)
+    cp["net_out_of_pocket"] = max(0.0, cp["monthly_total"] - subtotals["offsets"])
+
+    if cp["mode"] == "planning":
+        assets_value = float(cp["inputs"].get(ASSETS_FIELD, 0) or 0)
+        cp["assets"] = assets_value
+        cp["runway_months"] = (
+            assets_value / cp["net_out_of_pocket"] if cp["net_out_of_pocket"] > 0 else None
+        )
+    else:
+        cp["assets"] = 0.0
+        cp["runway_months"] = None
+
+    snapshot = cp.get("snapshot_for_crm")
+    if snapshot:
+        for key in ("monthly_total", "net_out_of_pocket", "assets", "runway_months"):
+            snapshot[key] = cp[key]
+
+
+def refresh_snapshot(session: MutableMapping, cp: Dict) -> None:
+    """Keep snapshot_for_crm current without rebuilding it on every call.
+
+    The snapshot holds the live inputs/subtotals containers and totals are
+    written through by _refresh_totals, so only the blocks other pages may
+    replace wholesale are re-pointed here.
+    """
+    snapshot = cp.get("snapshot_for_crm")
+    if not snapshot or snapshot.get("inputs") is not cp["inputs"] or snapshot.get("subtotals") is not cp["subtotals"]:
+        snapshot = cp["snapshot_for_crm"] = {
+            "audiencing": None,
+            "gcp": None,
+            "inputs": cp["inputs"],
+            "subtotals": cp["subtotals"],
+            "monthly_total": cp["monthly_total"],
+            "net_out_of_pocket": cp["net_out_of_pocket"],
+            "assets": cp["assets"],
+            "runway_months": cp["runway_months"],
+        }
+    snapshot["audiencing"] = session.get("audiencing_snapshot") or session.get("audiencing")
+    snapshot["gcp"] = session.get("gcp")
+    snapshot["decision_log"] = cp["decision_log"]
+    snapshot["expert_flags"] = cp["expert_flags"]
+    snapshot["custom_line_items"] = cp.get("custom_line_items", [])
+    snapshot["notes"] = cp.get("notes", "")
+
+
+def recompute_costs(session: MutableMapping, full: bool = False) -> None:
+    """Bring subtotals, totals and the CRM snapshot up to date.
+
+    Subtotals are maintained incrementally by set_numeric; the full pass over
+    the field map runs once per session and field-map version (or when
+    ``full`` is set, e.g. after writing cp["inputs"] directly). Totals depend on ``mode`` as well, so they
+    are refreshed on every call; that is a handful of additions.
+    """
+    cp = ensure_core_state(session)
+
+    if full or cp.get(_SYNCED_FLAG) != field_tables().version:
+        recompute_subtotals(cp)
+    else:
+        _refresh_totals(cp)
+    refresh_snapshot(session, cp)
+
+
+def format_currency(value: float) -> str:
+    return f"${value:,.0f}" if value else "$0"
+
+
+def audiencing_badges(session: Mapping) -> Tuple[str, List[str]]:
+    aud = session.get("audiencing", {})
+    entry = aud.get("entry", "self")
+    quals = aud.get("qualifiers", {})
+    badges = []
+    if quals.get("on_medicaid"):
+        badges.append("Medicaid")
+    if quals.get("is_veteran"):
+        badges.append("Veteran")
+    if quals.get("has_partner"):
+        badges.append("Partner household")
+    if quals.get("owns_home"):
+        badges.append("Owns home")
+    if quals.get("urgent"):
+        badges.append("Urgent")
+    return entry, badges
+
+
+def expert_flag(session: MutableMapping, flag: str) -> None:
+    cp = ensure_core_state(session)
+    if flag not in cp["expert_flags"]:
+        cp["expert_flags"].append(flag)
+
+
+def add_decision_log(session: MutableMapping, entry: str) -> None:
+    cp = ensure_core_state(session)
+    if entry not in cp["decision_log"]:
+        cp["decision_log"].append(entry)
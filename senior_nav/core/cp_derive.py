@@ -0,0 +1,93 @@
+"""Cost Planner v2 derive math: input coercion and the monthly gap / runway.
+
+``cost_planner_v2.cp_state`` reads the inputs from the ``cp`` namespace and
+``cost_planner_v2.scenarios`` runs the batch form over scenario sets; the
+cohort pipeline calls the same functions on referral rows.
+
+This module does not import Streamlit (NumPy is imported on first batch
+call).
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Tuple
+
+# Inputs read by derive(): name -> dotted cp path. Costs and offsets are
+# monthly; the last three are balances available to draw down.
+DERIVE_INPUTS: Dict[str, str] = {
+    "monthly_cost":           "setting_cost.monthly_cost",
+    "other_monthly_total":    "expenses.other_monthly_total",
+    "mods_monthly_total":     "home_mods.mods_monthly_total",
+    "caregiver_cost":         "caregiver.caregiver_cost",
+    "income_total":           "income.income_total",
+    "benefits_total":         "benefits.benefits_total",
+    "rm_monthly":             "home.reverse_mortgage_monthly",
+    "rent_income_monthly":    "home.home_monthly_total",
+    "assets_total_effective": "assets.assets_total_effective",
+    "liquidity_total":        "liquidity.liquidity_total",
+    "sale_price_one_time":    "home.sale_price",
+}
+INPUT_NAMES: Tuple[str, ...] = tuple(DERIVE_INPUTS)
+
+_COSTS = [INPUT_NAMES.index(n) for n in ("monthly_cost", "other_monthly_total", "mods_monthly_total", "caregiver_cost")]
+_OFFSETS = [INPUT_NAMES.index(n) for n in ("income_total", "benefits_total", "rm_monthly", "rent_income_monthly")]
+_BALANCES = [INPUT_NAMES.index(n) for n in ("assets_total_effective", "liquidity_total", "sale_price_one_time")]
+
+
+def _to_num(x: Any, default: float | int = 0) -> float:
+    """Coerce common UI strings to numbers. '$1,200' -> 1200.0"""
+    try:
+        if x is None:
+            return float(default)
+        if isinstance(x, (int, float)):
+            return float(x)
+        if isinstance(x, dict):
+            # if a dict slipped through (e.g., accidental sub-obj), try common keys
+            for k in ("value", "amount", "total"):
+                if k in x:
+                    return _to_num(x[k], default)
+            return float(default)
+        s = str(x).strip()
+        if not s:
+            return float(default)
+        s = s.replace(",", "").replace("$", "")
+        return float(s)
+    except Exception:
+        return float(default)
+
+
+def compute_derived(v: Dict[str, float]) -> Dict[str, Any]:
+    """Pure derive() math over the values returned by derive_inputs()."""
+    monthly_all_in  = v["monthly_cost"] + v["other_monthly_total"] + v["mods_monthly_total"] + v["caregiver_cost"]
+    monthly_offsets = v["income_total"] + v["benefits_total"] + v["rm_monthly"] + v["rent_income_monthly"]
+    gap = monthly_all_in - monthly_offsets
+
+    if gap <= 0:
+        runway_months = math.inf  # unlimited
+    else:
+        runway_months = (v["assets_total_effective"] + v["liquidity_total"] + v["sale_price_one_time"]) / gap
+
+    return {
+        "monthly_all_in": round(monthly_all_in, 2),
+        "monthly_offsets": round(monthly_offsets, 2),
+        "gap": round(gap, 2),
+        "runway_months": float("inf") if math.isinf(runway_months) else round(runway_months, 1),
+    }
+
+
+def compute_derived_batch(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """compute_derived() over an (N x len(INPUT_NAMES)) matrix, unrounded."""
+    import numpy as np
+
+    monthly_all_in = values[:, _COSTS].sum(axis=1)
+    monthly_offsets = values[:, _OFFSETS].sum(axis=1)
+    gap = monthly_all_in - monthly_offsets
+    balances = values[:, _BALANCES].sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        runway = np.where(gap > 0, balances / np.where(gap > 0, gap, 1.0), np.inf)
+    return {
+        "monthly_all_in": monthly_all_in,
+        "monthly_offsets": monthly_offsets,
+        "gap": gap,
+        "runway_months": runway,
+    }
@@ -0,0 +1,153 @@
+"""Step graph for the Guided Care Plan, Cost Planner wizard and PFMA flows.
+
+Each ``Flow`` is built once at import from its ordered steps and keeps:
+
+- the index of every step key;
+- prefix sums of the step weights, so "fraction complete once N steps are
+  done" is one lookup (weights default to 1, i.e. N / len);
+- next / previous links.
+
+Progress bars, "resume where you left off" and step-key validation are then
+O(1) lookups instead of ``list.index`` scans and ad hoc clamping in each
+renderer. ``FLOWS`` holds the three flows by name.
+
+This module does not import Streamlit.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
+
+
+class FlowStep(NamedTuple):
+    key: str
+    title: str
+    index: int
+    weight: float
+    next: Optional[str]
+    previous: Optional[str]
+
+
+StepSpec = Union[Tuple[str, str], Tuple[str, str, float]]
+
+
+class Flow:
+    """An ordered flow of steps with precomputed indices and completion ratios."""
+
+    def __init__(self, name: str, steps: Sequence[StepSpec]) -> None:
+        if not steps:
+            raise ValueError(f"Flow {name!r} has no steps")
+        keys = tuple(spec[0] for spec in steps)
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"Flow {name!r} has duplicate step keys")
+        weights = tuple(float(spec[2]) if len(spec) > 2 else 1.0 for spec in steps)
+        prefix = [0.0]
+        for weight in weights:
+            prefix.append(prefix[-1] + weight)
+        total = prefix[-1] or 1.0
+
+        self.name = name
+        self.keys: Tuple[str, ...] = keys
+        self.titles: Tuple[str, ...] = tuple(spec[1] for spec in steps)
+        self.steps: Tuple[FlowStep, ...] = tuple(
+            FlowStep(
+                key,
+                self.titles[i],
+                i,
+                weights[i],
+                keys[i + 1] if i + 1 < len(keys) else None,
+                keys[i - 1] if i else None,
+            )
+            for i, key in enumerate(keys)
+        )
+        self._index: Dict[str, int] = {key: i for i, key in enumerate(keys)}
+        # _done[n]: fraction complete once the first n steps are done.
+        self._done: Tuple[float, ...] = tuple(value / total for value in prefix)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def __iter__(self) -> Iterator[FlowStep]:
+        return iter(self.steps)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"Flow({self.name!r}, {list(self.keys)!r})"
+
+    def step(self, key: str) -> FlowStep:
+        return self.steps[self._index[key]]
+
+    def index(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        return self._index.get(key, default)
+
+    def clamp(self, index: int) -> int:
+        """``index`` limited to a valid step index."""
+        return min(max(index, 0), len(self.steps) - 1)
+
+    def position(self, current: Union[int, str]) -> int:
+        """Index of ``current`` (a key or an index); unknown keys are past the end."""
+        if isinstance(current, str):
+            return self._index.get(current, len(self.steps))
+        try:
+            return int(current)
+        except (TypeError, ValueError):
+            return 0
+
+    def completed(self, count: int) -> float:
+        """Fraction complete once the first ``count`` steps are done (clamped)."""
+        return self._done[min(max(count, 0), len(self.steps))]
+
+    def progress(self, current: Union[int, str]) -> float:
+        """Fraction complete while on ``current`` (the steps before it are done)."""
+        return self.completed(self.position(current))
+
+    def next(self, key: str) -> Optional[FlowStep]:
+        following = self.step(key).next
+        return self.step(following) if following else None
+
+    def previous(self, key: str) -> Optional[FlowStep]:
+        preceding = self.step(key).previous
+        return self.step(preceding) if preceding else None
+
+    def resume(self, last_completed: Optional[str]) -> FlowStep:
+        """Where to pick up: the step after ``last_completed`` (the first step
+        when nothing or an unknown key was recorded, the last once done)."""
+        index = self._index.get(last_completed, -1) if last_completed else -1
+        return self.steps[self.clamp(index + 1)]
+
+
+GCP_FLOW = Flow("gcp", [
+    ("financial_eligibility", "Financial Eligibility"),
+    ("financial_confidence", "Financial Confidence"),
+    ("daily_life", "Daily Life & Support"),
+    ("health_safety", "Health & Safety"),
+    ("context_prefs", "Context & Preferences"),
+])
+
+# Keys match senior_nav.cost_planner.wizard.STEPS, which adds the page paths.
+COST_PLANNER_FLOW = Flow("cost_planner", [
+    ("mode", "Mode"),
+    ("qualifiers", "Qualifiers"),
+    ("housing", "Housing"),
+    ("care", "Care"),
+    ("medical", "Medical"),
+    ("insurance_benefits", "Insurance & Benefits"),
+    ("debts_other", "Debts & Other"),
+    ("review", "Review"),
+    ("summary", "Summary"),
+    ("confirm", "Confirm"),
+])
+
+PFMA_FLOW = Flow("pfma", [
+    ("personal_info", "personal_info"),
+    ("household_legal", "household_legal"),
+    ("benefits", "benefits"),
+    ("care_needs", "care_needs"),
+    ("care_prefs", "care_prefs"),
+    ("cost_plan", "cost_plan"),
+    ("care_plan", "care_plan"),
+    ("booking", "booking"),
+])
+
+FLOWS: Dict[str, Flow] = {flow.name: flow for flow in (GCP_FLOW, COST_PLANNER_FLOW, PFMA_FLOW)}
@@ -0,0 +1,274 @@
+"""Guided Care Plan question metadata and session schema over explicit state.
+
+``guided_care_plan.state`` re-exports the metadata for the engine, rules
+and batch modules; ``guided_care_plan.session`` binds the session helpers
+to ``st.session_state`` and renders the stepper.
+
+The scoring rules are compiled by the ``gcp.labels`` loader, so a
+labels.json edit swaps the options and the score tables in together.
+
+This module does not import Streamlit.
+"""
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from senior_nav.core.audiencing import ensure_audiencing_state
+from senior_nav.core.flows import GCP_FLOW
+from senior_nav.runtime.content import CONTENT, load_json
+from senior_nav.runtime.snapshots import thaw
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2] / "guided_care_plan"
+
+QUESTION_ORDER: List[str] = [
+    "medicaid_status",
+    "funding_confidence",
+    "who_for",
+    "living_now",
+    "caregiver_support",
+    "adl_help",
+    "cognition",
+    "behavior_risks",
+    "falls",
+    "med_mgmt",
+    "home_safety",
+    "supervision",
+    "chronic",
+    "preferences",
+]
+
+
+LABELS_PATH = PACKAGE_ROOT / "labels.json"
+
+
+DAILY_LIFE = "daily_life"
+HEALTH_SAFETY = "health_safety"
+
+
+class QuestionRule:
+    """Compiled scoring rule for one question (read-only).
+
+    ``index`` maps an option value to its position in ``options``; ``scores``
+    holds the score for each position. Multi-select questions score the
+    highest selected option, with ``unlisted_score`` for values outside the
+    option list.
+
+    Slotted rather than a NamedTuple: the engine reads these fields on every
+    evaluation and slot reads are faster than tuple-getter reads; a frozen
+    dataclass would add ``dataclasses`` to this module's import.
+    """
+
+    __slots__ = (
+        "question_id", "section", "options", "index", "scores", "multi", "flag", "flag_at", "unlisted_score",
+    )
+
+    question_id: str
+    section: str
+    options: Tuple[str, ...]
+    index: Mapping[str, int]
+    scores: Tuple[int, ...]
+    multi: bool
+    flag: Optional[str]
+    flag_at: int
+    unlisted_score: int
+
+    def __init__(
+        self,
+        question_id: str,
+        section: str,
+        options: Tuple[str, ...],
+        index: Mapping[str, int],
+        scores: Tuple[int, ...],
+        multi: bool = False,
+        flag: Optional[str] = None,
+        flag_at: int = 0,
+        unlisted_score: int = 0,
+    ) -> None:
+        for name, value in zip(self.__slots__, (
+            question_id, section, options, index, scores, multi, flag, flag_at, unlisted_score,
+        )):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"QuestionRule is read-only (cannot set {name!r})")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"QuestionRule({fields})"
+
+    def replace(self, **changes: object) -> "QuestionRule":
+        """Copy with ``changes`` applied (rules are never edited in place)."""
+
+        return QuestionRule(**{name: changes.get(name, getattr(self, name)) for name in self.__slots__})
+
+    def score(self, value: object) -> int:
+        """Score a single-select answer (unknown or missing answers score 0)."""
+
+        position = self.index.get(value) if isinstance(value, str) else None
+        return 0 if position is None else self.scores[position]
+
+    def score_selection(self, values: object) -> int:
+        """Score a multi-select answer as its highest-scoring selection."""
+
+        if isinstance(values, str):
+            values = [values]
+        best = 0
+        for item in values or ():
+            if not item or item == "none":
+                continue
+            position = self.index.get(item)
+            item_score = self.unlisted_score if position is None else self.scores[position]
+            if item_score > best:
+                best = item_score
+        return best
+
+
+def _compile_rule(question_id: str, meta: Mapping[str, object]) -> QuestionRule:
+    scoring = meta["scoring"]
+    options = []
+    scores = []
+    for option in meta.get("options", []):
+        if "score" not in option:
+            raise ValueError(f"Scored question {question_id} has an option without a score: {option.get('value')}")
+        options.append(option["value"])
+        scores.append(int(option["score"]))
+    return QuestionRule(
+        question_id=question_id,
+        section=scoring["section"],
+        options=tuple(options),
+        index=MappingProxyType({value: position for position, value in enumerate(options)}),
+        scores=tuple(scores),
+        multi=bool(meta.get("multi")),
+        flag=scoring.get("flag"),
+        flag_at=int(scoring.get("flag_at", 0)),
+        unlisted_score=int(scoring.get("unlisted_score", 0)),
+    )
+
+
+def compile_rules(document: Mapping[str, object]) -> Mapping[str, QuestionRule]:
+    """Compile every question with a ``scoring`` block, in ``QUESTION_ORDER``."""
+
+    questions = document.get("questions", {})
+    compiled = {
+        question_id: _compile_rule(question_id, questions[question_id])
+        for question_id in QUESTION_ORDER
+        if "scoring" in questions.get(question_id, {})
+    }
+    for rule in compiled.values():
+        if rule.section not in (DAILY_LIFE, HEALTH_SAFETY):
+            raise ValueError(f"Unknown scoring section for {rule.question_id}: {rule.section}")
+    return MappingProxyType(compiled)
+
+
+class GcpLabels(NamedTuple):
+    """labels.json, frozen, with per-question option lookups and rules pre-built."""
+
+    document: Mapping[str, object]
+    questions: Mapping[str, Mapping[str, object]]
+    option_values: Mapping[str, Tuple[str, ...]]
+    option_index: Mapping[str, Mapping[str, int]]
+    multi_select: frozenset
+    rules: Mapping[str, QuestionRule]
+    daily_life_rules: Tuple[QuestionRule, ...]
+    health_safety_rules: Tuple[QuestionRule, ...]
+
+
+def _parse_labels(path: Path) -> GcpLabels:
+    # A rule that does not compile fails the load, so the registry keeps
+    # serving the previous labels rather than options without scores.
+    document = load_json(path)
+    questions = document.get("questions", MappingProxyType({}))
+    option_values = {
+        question_id: tuple(
+            opt.get("value") for opt in meta.get("options", ()) if isinstance(opt, Mapping)
+        )
+        for question_id, meta in questions.items()
+    }
+    rules = compile_rules(document)
+    return GcpLabels(
+        document=document,
+        questions=questions,
+        option_values=MappingProxyType(option_values),
+        option_index=MappingProxyType({
+            question_id: MappingProxyType({value: idx for idx, value in enumerate(values)})
+            for question_id, values in option_values.items()
+        }),
+        multi_select=frozenset(qid for qid, meta in questions.items() if meta.get("multi")),
+        rules=rules,
+        daily_life_rules=tuple(rule for rule in rules.values() if rule.section == DAILY_LIFE),
+        health_safety_rules=tuple(rule for rule in rules.values() if rule.section == HEALTH_SAFETY),
+    )
+
+
+CONTENT.register("gcp.labels", [LABELS_PATH], _parse_labels, lazy=True)
+
+
+def labels() -> GcpLabels:
+    """Current labels.json (hot-reloaded when the file changes)."""
+
+    return CONTENT.get("gcp.labels")
+
+
+def _load_labels() -> Mapping[str, object]:
+    return labels().document
+
+
+def get_question_meta(question_id: str) -> Dict[str, object]:
+    """Return metadata (label, helper text, options) for a question id.
+
+    The result is the caller's own copy (dicts and lists), so pages may edit
+    it; read-only hot paths use ``labels().questions`` instead.
+    """
+
+    meta = labels().questions.get(question_id)
+    if not meta:
+        raise KeyError(f"Unknown Guided Care Plan question id: {question_id}")
+    return thaw(meta)
+
+
+STEP_TITLES = list(GCP_FLOW.titles)
+
+
+def default_gcp_result() -> Dict[str, object]:
+    return {
+        "recommended_setting": None,
+        "care_intensity": None,
+        "safety_flags": [],
+        "chronic_conditions": [],
+        "payment_context": None,
+        "funding_confidence": None,
+        "audiencing_snapshot": None,
+        "DecisionTrace": None,
+    }
+
+
+def ensure_gcp_session(session: MutableMapping) -> Tuple[Dict[str, object], Dict[str, object]]:
+    """Guarantee ``session`` storage for answers and evaluation output."""
+
+    answers = session.setdefault("gcp_answers", {})
+    gcp_result = session.setdefault("gcp", default_gcp_result())
+    return answers, gcp_result
+
+
+def stepper_position(current_step: int) -> Tuple[int, float]:
+    """``current_step`` (steps reached, 1-based) clamped, and the progress ratio."""
+
+    current_step = min(max(current_step, 0), len(GCP_FLOW))
+    return current_step, GCP_FLOW.completed(current_step)
+
+
+def current_audiencing_snapshot(session: MutableMapping) -> Dict[str, object]:
+    """Return the latest audiencing snapshot, ensuring defaults."""
+
+    snapshot = session.get("audiencing_snapshot")
+    if snapshot:
+        return snapshot
+    state = ensure_audiencing_state(session)
+    return {
+        "entry": state.get("entry"),
+        "qualifiers": state.get("qualifiers", {}).copy(),
+        "route": state.get("route", {}).copy(),
+    }
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import copy
-import json
-from functools import lru_cache
-from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Mapping
 
 import streamlit as st
 
+from senior_nav.runtime.content import CONTENT, PROJECT_ROOT, load_json
+
+COPY_PATH = PROJECT_ROOT / "copy" / "cost_planner_strings.json"
+
 _DEFAULT_STATE: Dict[str, Any] = {
     "mode": "exploring",
     "qualifiers": {
@@ -81,8 +82,9 @@ def mark_suggestions_seen(suggestion_ids: set[str]) -> None:
     seen.update(suggestion_ids)
 
 
-@lru_cache(maxsize=1)
-def get_copy() -> Dict[str, Any]:
-    """Load and cache the cost planner copy."""
-    path = Path("copy/cost_planner_strings.json")
-    return json.loads(path.read_text())
+CONTENT.register("cost_planner.copy", [COPY_PATH], load_json)
+
+
+def get_copy() -> Mapping[str, Any]:
+    """The cost planner copy (frozen; hot-reloaded when the file changes)."""
+    return CONTENT.get("cost_planner.copy")
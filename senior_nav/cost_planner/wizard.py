@@ -1,14 +1,38 @@
-"""Wizard registry and loader for the cost planner."""
+"""Wizard registry and loader for the cost planner.
+
+Step modules are cached per resolved path in ``STEP_CACHE``, a bounded LRU
+that re-reads a file when its mtime or size changes. While the user is on a
+step, ``PRELOADER`` compiles the next ``PRELOAD_AHEAD`` step files on a
+background thread and imports the modules each step declares in
+``Step.preload``. Page bodies render at module level and the page's own
+imports (``ui.*`` helpers, cp_state) may touch the session when imported,
+so neither runs off the script thread; the first visit executes them.
+
+``first_render_metrics()`` reports how long each step took to load and
+render the first time after it was (re)loaded, and whether it was preloaded.
+"""
 from __future__ import annotations
 
+import importlib
 import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from functools import lru_cache
 from pathlib import Path
-from typing import Callable, List
+from types import CodeType, ModuleType
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from senior_nav.core.flows import COST_PLANNER_FLOW as FLOW
+from senior_nav.runtime import profiler
+from senior_nav.runtime.content import PROJECT_ROOT
 
 from . import state
 
+STEP_CACHE_SIZE = 8   # step modules kept per process (STEPS has 7 distinct files)
+PRELOAD_AHEAD = 2     # steps after the current one warmed in the background
+
 
 @dataclass(frozen=True)
 class Step:
@@ -16,7 +40,13 @@ class Step:
     label: str
     path: str
     drawer_key: str | None = None
+    # Modules the preloader imports off the script thread, e.g. what
+    # st.dataframe pulls in (pandas/pyarrow). List only modules that are
+    # safe to import there: no Streamlit calls or session access at import.
+    preload: Tuple[str, ...] = ()
+
 
+_DATAFRAME_MODULES = ("pandas", "pyarrow", "streamlit.elements.arrow")
 
 STEPS: List[Step] = [
     Step("mode", "Mode", "pages/cost_planner.py"),
@@ -31,8 +61,8 @@ STEPS: List[Step] = [
         drawer_key="insurance_benefits",
     ),
     Step("debts_other", "Debts & Other", "pages/cost_planner_modules.py", drawer_key="debts_other"),
-    Step("review", "Review", "pages/cost_planner_estimate_summary.py"),
-    Step("summary", "Summary", "pages/cost_planner_estimate_summary.py"),
+    Step("review", "Review", "pages/cost_planner_estimate_summary.py", preload=_DATAFRAME_MODULES),
+    Step("summary", "Summary", "pages/cost_planner_estimate_summary.py", preload=_DATAFRAME_MODULES),
     Step("confirm", "Confirm", "pages/cost_planner_evaluation.py"),
 ]
 
@@ -42,35 +72,218 @@ def get_steps() -> List[Step]:
 
 
 def get_current_step() -> Step:
-    index = max(0, min(state.get_progress(), len(STEPS) - 1))
+    index = FLOW.clamp(state.get_progress())
+    PRELOADER.schedule(index)
     return STEPS[index]
 
 
 def get_step_index(step: Step) -> int:
-    return STEPS.index(step)
+    index = FLOW.index(step.key)
+    if index is None:
+        raise ValueError(f"{step.key!r} is not a cost planner step")
+    return index
 
 
 def set_current_step(index: int) -> None:
-    capped = max(0, min(index, len(STEPS) - 1))
-    state.set_progress(capped)
+    state.set_progress(FLOW.clamp(index))
+
+
+def get_progress_ratio() -> float:
+    """Fraction of the wizard completed before the current step."""
+    return FLOW.completed(FLOW.clamp(state.get_progress()))
+
+
+# ---------------------------------------------------------------------------
+# Step module cache
+# ---------------------------------------------------------------------------
+Stamp = Tuple[int, int]
+
+
+def step_path(step: Step) -> Path:
+    return (PROJECT_ROOT / step.path).resolve()
+
+
+def _module_name(step: Step) -> str:
+    return "cp_" + "_".join(Path(step.path).with_suffix("").parts)
+
+
+def _stamp(path: Path) -> Stamp:
+    try:
+        stat = path.stat()
+    except OSError as exc:
+        raise ImportError(f"Unable to load step module at {path}") from exc
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class _CachedStep:
+    stamp: Stamp
+    code: CodeType
+    module: Optional[ModuleType] = None
+
+
+class StepModuleCache:
+    """Bounded LRU of compiled step files and their modules, keyed by path.
+
+    An entry is current while the file's (mtime, size) is unchanged; an
+    edited file is recompiled and re-executed on its next load.
+    """
+
+    def __init__(self, maxsize: int = STEP_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Path, _CachedStep] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0       # module executions (first load or after an edit)
+        self.evictions = 0
+
+    def compiled(self, path: Path) -> _CachedStep:
+        """The current entry for ``path``, compiling the file if needed."""
+        stamp = _stamp(path)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stamp == stamp:
+                self._entries.move_to_end(path)
+                return entry
+        code = compile(path.read_bytes(), str(path), "exec", dont_inherit=True)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry.stamp != stamp:
+                entry = self._entries[path] = _CachedStep(stamp, code)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return entry
+
+    def is_compiled(self, path: Path) -> bool:
+        entry = self._entries.get(path)
+        try:
+            return entry is not None and entry.stamp == _stamp(path)
+        except ImportError:
+            return False
+
+    def module(self, step: Step) -> Tuple[ModuleType, bool]:
+        """The step's module and whether it was executed by this call."""
+        path = step_path(step)
+        entry = self.compiled(path)
+        if entry.module is not None:
+            self.hits += 1
+            return entry.module, False
+        spec = importlib.util.spec_from_file_location(_module_name(step), path)
+        if spec is None:
+            raise ImportError(f"Unable to load step module at {path}")
+        module = importlib.util.module_from_spec(spec)
+        exec(entry.code, module.__dict__)
+        entry.module = module
+        self.loads += 1
+        return module, True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+STEP_CACHE = StepModuleCache()
+
+
+class StepPreloader:
+    """Warms the steps after the current one on a single background thread."""
+
+    def __init__(self, cache: StepModuleCache, ahead: int = PRELOAD_AHEAD) -> None:
+        self.cache = cache
+        self.ahead = ahead
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pending: Set[Path] = set()
+        self._lock = threading.Lock()
+        self.preloaded = 0
+        self.failed = 0
+
+    def schedule(self, index: int) -> None:
+        current = step_path(STEPS[index]) if 0 <= index < len(STEPS) else None
+        for step in STEPS[index + 1:index + 1 + self.ahead]:
+            path = step_path(step)
+            if path == current or self.cache.is_compiled(path):
+                continue
+            with self._lock:
+                if path in self._pending:
+                    continue
+                self._pending.add(path)
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cp-preload")
+                self._pool.submit(self._warm, path, step.preload)
+
+    def _warm(self, path: Path, extra: Tuple[str, ...] = ()) -> None:
+        try:
+            self.cache.compiled(path)
+            for name in extra:
+                importlib.import_module(name)
+            self.preloaded += 1
+        except Exception:  # the visit itself will surface the error
+            self.failed += 1
+        finally:
+            with self._lock:
+                self._pending.discard(path)
+
+    def wait(self) -> None:
+        """Block until scheduled work is done (tests and benchmarks)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+PRELOADER = StepPreloader(STEP_CACHE)
+
+
+# ---------------------------------------------------------------------------
+# First-render metrics
+# ---------------------------------------------------------------------------
+@dataclass
+class StepTiming:
+    key: str
+    first_render_ms: float   # load + render, the first time after a (re)load
+    preloaded: bool          # the file was compiled ahead of that visit
+    renders: int = 0
+
+
+_TIMINGS: Dict[str, StepTiming] = {}
+
+
+def first_render_metrics() -> List[Dict[str, object]]:
+    """Per-step first-render latency, in ``STEPS`` order."""
+    timings = [_TIMINGS[step.key] for step in STEPS if step.key in _TIMINGS]
+    return [
+        {
+            "step": t.key,
+            "first_render_ms": round(t.first_render_ms, 2),
+            "preloaded": t.preloaded,
+            "renders": t.renders,
+        }
+        for t in timings
+    ]
 
 
-@lru_cache(maxsize=None)
-def load_step_module(step: Step):
-    """Dynamically load the module for a step."""
-    path = Path(step.path)
-    module_name = "cp_" + "_".join(path.with_suffix("").parts)
-    spec = importlib.util.spec_from_file_location(module_name, path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Unable to load step module at {path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+def load_step_module(step: Step) -> ModuleType:
+    """Load the module for a step (cached per path until the file changes)."""
+    return STEP_CACHE.module(step)[0]
 
 
 def run_step(step: Step) -> None:
-    module = load_step_module(step)
+    start = time.perf_counter()
+    preloaded = STEP_CACHE.is_compiled(step_path(step))
+    module, fresh = STEP_CACHE.module(step)
     render: Callable[[], None] | None = getattr(module, "render", None)
     if render is None:
         raise AttributeError(f"Step module {step.path} must define a render() function")
     render()
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    timing = _TIMINGS.get(step.key)
+    if fresh or timing is None:
+        timing = _TIMINGS[step.key] = StepTiming(step.key, elapsed_ms, preloaded)
+        profiler.record(f"cp_step.first_render.{step.key}", elapsed_ms)
+    timing.renders += 1
+    PRELOADER.schedule(get_step_index(step))
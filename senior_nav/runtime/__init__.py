@@ -0,0 +1,20 @@
+"""Process-level runtime helpers for app.py.
+
+Streamlit re-executes ``app.py`` on every interaction, so its globals reset on
+each rerun. State that should be computed once per process lives in these
+modules instead, which Python keeps imported across reruns and sessions.
+
+Submodules are imported on first use: ``profiler`` is imported by core
+modules that must not pull in Streamlit.
+"""
+from __future__ import annotations
+
+import importlib
+
+__all__ = ["layout", "preflight", "profiler", "registry", "sessions", "styles"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,155 @@
+"""Process-wide registry for static content files, with hot reload.
+
+GCP labels, Cost Planner copy and the Cost Planner CSV specs used to sit
+behind ``lru_cache(maxsize=1)``, so an edit only showed up after a process
+restart (dropping every live session). Each owning module now registers its
+files here with a loader that parses them into frozen, pre-built structures.
+
+- ``register()`` loads the resource right away (import time = startup),
+  or on the first ``get()`` with ``lazy=True``, which the Streamlit-free
+  cores in ``senior_nav.core`` use to keep their import cheap.
+- ``get()`` returns the current value. At most once per ``CHECK_INTERVAL``
+  seconds it stats the files; when a mtime or size changed, the resource is
+  re-parsed and swapped in with a single dict assignment.
+- Readers never wait: while one thread reloads, the others keep returning
+  the previous value. A reload that fails (say, a half-saved JSON file)
+  keeps the previous value and is retried on the next check.
+
+``generation()`` increments on every swap, so derived per-session state can
+tell that it was built from older content.
+
+This module does not import Streamlit.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CHECK_INTERVAL = 1.0  # seconds between mtime checks per resource
+
+Stamp = Tuple[Tuple[int, int], ...]
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON: dicts -> mappingproxy, lists -> tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def load_json(path: Path) -> Any:
+    """Frozen JSON document."""
+    return freeze(json.loads(path.read_text(encoding="utf-8")))
+
+
+class _Resource(NamedTuple):
+    name: str
+    paths: Tuple[Path, ...]
+    loader: Callable[..., Any]  # called with *paths
+
+
+class _Entry(NamedTuple):
+    value: Any
+    stamp: Stamp
+    generation: int
+
+
+def _stamp(paths: Iterable[Path]) -> Stamp:
+    stamps = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            stamps.append((-1, -1))
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+class ContentRegistry:
+    def __init__(self, check_interval: float = CHECK_INTERVAL) -> None:
+        self.check_interval = check_interval
+        self._resources: Dict[str, _Resource] = {}
+        self._entries: Dict[str, _Entry] = {}
+        self._checked: Dict[str, float] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self, name: str, paths: Iterable[Path], loader: Callable[..., Any], *, lazy: bool = False
+    ) -> None:
+        """Register (or re-register) ``name`` and load it now (or on first use)."""
+        resource = _Resource(name, tuple(Path(p) for p in paths), loader)
+        with self._lock:
+            self._resources[name] = resource
+            self._entries.pop(name, None)
+            if not lazy:
+                self._load(resource, previous=None)
+
+    def get(self, name: str) -> Any:
+        entry = self._entries.get(name)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.get(name) or self._load(self._resources[name], previous=None)
+            return entry.value
+        now = time.monotonic()
+        last = self._checked.get(name)
+        if last is None or now - last >= self.check_interval:
+            self._checked[name] = now
+            resource = self._resources[name]
+            if _stamp(resource.paths) != entry.stamp:
+                entry = self._reload(resource, entry)
+        return entry.value
+
+    def generation(self, name: str) -> int:
+        self.get(name)
+        return self._entries[name].generation
+
+    def refresh(self) -> Dict[str, int]:
+        """Check every resource now; returns name -> generation."""
+        self._checked.clear()
+        return {name: self.generation(name) for name in list(self._resources)}
+
+    def errors(self) -> Dict[str, str]:
+        """Last failed reload per resource (cleared by the next good load)."""
+        return dict(self._errors)
+
+    def _reload(self, resource: _Resource, entry: _Entry) -> _Entry:
+        if not self._lock.acquire(blocking=False):
+            return entry  # another thread is reloading; keep serving the old value
+        try:
+            current = self._entries.get(resource.name, entry)
+            if _stamp(resource.paths) == current.stamp:
+                return current
+            try:
+                return self._load(resource, previous=current)
+            except Exception as exc:  # keep serving the last good content
+                self._errors[resource.name] = f"{type(exc).__name__}: {exc}"
+                import logging  # imported on failure only; keeps this module cheap to import
+
+                logging.getLogger(__name__).warning(
+                    "Reloading %s failed, keeping the previous version: %s", resource.name, exc
+                )
+                return current
+        finally:
+            self._lock.release()
+
+    def _load(self, resource: _Resource, previous: Optional[_Entry]) -> _Entry:
+        # Stamp before reading: an edit landing mid-parse is seen on the next check.
+        stamp = _stamp(resource.paths)
+        value = resource.loader(*resource.paths)
+        entry = _Entry(value, stamp, previous.generation + 1 if previous else 0)
+        self._entries[resource.name] = entry
+        self._checked[resource.name] = time.monotonic()
+        self._errors.pop(resource.name, None)
+        return entry
+
+
+CONTENT = ContentRegistry()
@@ -0,0 +1,314 @@
+"""Bounded per-session event log, stored as deltas.
+
+``st.session_state["event_log"]`` used to be a plain list. Every audiencing
+set appended a deep copy of the whole snapshot, and nothing trimmed it. Now
+it holds an ``EventLog``:
+
+- a ring buffer of the last ``CAPACITY`` events;
+- each event is an interned type code plus the delta against the previous
+  snapshot of that type (changed leaves only, copied once);
+- evicted deltas are folded into a per-type base, so every retained event
+  can still be rebuilt into a full snapshot (``snapshots()``,
+  ``snapshot_at()``, ``latest()``).
+
+With ``SN_EVENT_LOG_DIR`` set, every event is also handed to a ``JsonlSink``.
+A background thread appends it to size-capped JSONL segments for analytics.
+Each session's first event of a type carries the full snapshot, so a reader
+can replay any session from the files alone.
+
+This module does not import Streamlit.
+"""
+from __future__ import annotations
+
+import atexit
+import copy
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+CAPACITY = 256                      # events kept per session
+SEGMENT_BYTES = 8 * 1024 * 1024     # JSONL segment size before rotating
+
+KeyPath = Tuple[str, ...]
+
+
+class _Removed:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "REMOVED"
+
+
+REMOVED = _Removed()
+Op = Tuple[KeyPath, Any]  # (key path, new value or REMOVED)
+
+# ---------------------------------------------------------------------------
+# Event-type interning (process-wide; codes are never reused)
+# ---------------------------------------------------------------------------
+_TYPE_CODES: Dict[str, int] = {}
+_TYPE_NAMES: List[str] = []
+_TYPE_LOCK = threading.Lock()
+
+
+def intern_event(name: str) -> int:
+    code = _TYPE_CODES.get(name)
+    if code is None:
+        with _TYPE_LOCK:
+            code = _TYPE_CODES.get(name)
+            if code is None:
+                code = _TYPE_CODES[name] = len(_TYPE_NAMES)
+                _TYPE_NAMES.append(name)
+    return code
+
+
+def event_name(code: int) -> str:
+    return _TYPE_NAMES[code]
+
+
+# ---------------------------------------------------------------------------
+# Deltas
+# ---------------------------------------------------------------------------
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _clone(value: Any) -> Any:
+    return value if isinstance(value, _SCALARS) else copy.deepcopy(value)
+
+
+def diff(old: Mapping[str, Any], new: Mapping[str, Any], path: KeyPath = ()) -> List[Op]:
+    """Ops that turn ``old`` into ``new``; nested mappings are diffed per key."""
+    ops: List[Op] = []
+    for key, value in new.items():
+        if key not in old:
+            ops.append((path + (key,), _clone(value)))
+            continue
+        prev = old[key]
+        if prev is value:
+            continue
+        if isinstance(value, Mapping) and isinstance(prev, Mapping):
+            if prev != value:  # equal subtrees are skipped without walking them
+                ops.extend(diff(prev, value, path + (key,)))
+        elif type(prev) is not type(value) or prev != value:
+            ops.append((path + (key,), _clone(value)))
+    ops.extend((path + (key,), REMOVED) for key in old if key not in new)
+    return ops
+
+
+def apply(base: Mapping[str, Any], ops: List[Op]) -> Dict[str, Any]:
+    """New dict with ``ops`` applied; untouched branches are shared with ``base``."""
+    root = dict(base)
+    copied: Dict[KeyPath, Dict[str, Any]] = {(): root}
+    for path, value in ops:
+        node = root
+        for depth in range(1, len(path)):
+            child = copied.get(path[:depth])
+            if child is None:
+                existing = node.get(path[depth - 1])
+                child = dict(existing) if isinstance(existing, Mapping) else {}
+                node[path[depth - 1]] = copied[path[:depth]] = child
+            node = child
+        if value is REMOVED:
+            node.pop(path[-1], None)
+        else:
+            node[path[-1]] = value
+    return root
+
+
+# ---------------------------------------------------------------------------
+# Event log
+# ---------------------------------------------------------------------------
+@dataclass(frozen=True)
+class Event:
+    seq: int
+    code: int
+    ts: float
+    delta: Tuple[Op, ...]
+
+    @property
+    def name(self) -> str:
+        return event_name(self.code)
+
+
+class EventLog:
+    """Fixed-capacity ring of delta-encoded events for one session."""
+
+    def __init__(
+        self,
+        capacity: int = CAPACITY,
+        *,
+        session_id: Optional[str] = None,
+        sink: Optional["JsonlSink"] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.session_id = session_id or uuid.uuid4().hex
+        self.sink = sink
+        self._events: Deque[Event] = deque()
+        self._bases: Dict[int, Dict[str, Any]] = {}   # per type, before the oldest kept event
+        self._heads: Dict[int, Dict[str, Any]] = {}   # per type, latest snapshot
+        self._seq = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def append(self, event: str, snapshot: Mapping[str, Any]) -> Event:
+        code = intern_event(event)
+        head = self._heads.get(code, {})
+        delta = tuple(diff(head, snapshot))
+        self._heads[code] = apply(head, list(delta))
+        self._seq += 1
+        entry = Event(self._seq, code, time.time(), delta)
+        self._events.append(entry)
+        if len(self._events) > self.capacity:
+            old = self._events.popleft()
+            self._bases[old.code] = apply(self._bases.get(old.code, {}), list(old.delta))
+            self.dropped += 1
+        if self.sink is not None:
+            self.sink.submit(self.session_id, event, entry)
+        return entry
+
+    def events(self) -> List[Event]:
+        """Retained events (deltas only), oldest first."""
+        return list(self._events)
+
+    def snapshots(self, event: Optional[str] = None) -> Iterator[Tuple[Event, Dict[str, Any]]]:
+        """``(event, full snapshot)`` for each retained event, oldest first."""
+        code = None if event is None else _TYPE_CODES.get(event, -1)
+        states = dict(self._bases)
+        for entry in list(self._events):
+            state = states[entry.code] = apply(states.get(entry.code, {}), list(entry.delta))
+            if code is None or entry.code == code:
+                yield entry, copy.deepcopy(state)
+
+    def snapshot_at(self, seq: int) -> Optional[Dict[str, Any]]:
+        for entry, state in self.snapshots():
+            if entry.seq == seq:
+                return state
+        return None
+
+    def latest(self, event: str) -> Optional[Dict[str, Any]]:
+        head = self._heads.get(_TYPE_CODES.get(event, -1))
+        return None if head is None else copy.deepcopy(head)
+
+
+def session_event_log(state: MutableMapping[str, Any], session_id: Optional[str] = None) -> EventLog:
+    """The ``EventLog`` in ``state["event_log"]``, created (or upgraded) on demand.
+
+    ``session_id`` is written to the JSONL segments, so it must be an opaque
+    analytics id (the default is random), never a credential such as the
+    session-store token. A legacy list of ``{"event", "snapshot"}`` dicts is replayed into the log.
+    """
+    log = state.get("event_log")
+    if isinstance(log, EventLog):
+        return log
+    fresh = EventLog(session_id=session_id, sink=default_sink())
+    for item in log if isinstance(log, list) else ():
+        if isinstance(item, Mapping) and isinstance(item.get("snapshot"), Mapping):
+            fresh.append(str(item.get("event", "unknown")), item["snapshot"])
+    state["event_log"] = fresh
+    return fresh
+
+
+# ---------------------------------------------------------------------------
+# JSONL sink
+# ---------------------------------------------------------------------------
+def _record(session_id: str, event: str, entry: Event) -> Dict[str, Any]:
+    return {
+        "session": session_id,
+        "seq": entry.seq,
+        "event": event,
+        "ts": round(entry.ts, 3),
+        "set": [[list(path), value] for path, value in entry.delta if value is not REMOVED],
+        "unset": [list(path) for path, value in entry.delta if value is REMOVED],
+    }
+
+
+def replay(records: List[Mapping[str, Any]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Latest snapshot per ``(session, event)`` from JSONL records."""
+    states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for record in sorted(records, key=lambda r: (r["session"], r["seq"])):
+        key = (record["session"], record["event"])
+        ops: List[Op] = [(tuple(path), value) for path, value in record["set"]]
+        ops += [(tuple(path), REMOVED) for path in record["unset"]]
+        states[key] = apply(states.get(key, {}), ops)
+    return states
+
+
+class JsonlSink:
+    """Append-only JSONL segments written by a background thread."""
+
+    def __init__(self, directory: Path, segment_bytes: int = SEGMENT_BYTES) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.written = 0
+        self._queue: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+        self._segment: Optional[Path] = None
+        self._segments = 0
+        self._thread = threading.Thread(target=self._run, name="sn-event-sink", daemon=True)
+        self._thread.start()
+
+    def submit(self, session_id: str, event: str, entry: Event) -> None:
+        self._queue.put(_record(session_id, event, entry))
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    @property
+    def segments(self) -> List[Path]:
+        return sorted(self.directory.glob("events-*.jsonl"))
+
+    def _next_segment(self) -> Path:
+        self._segments += 1
+        stamp = time.strftime("%Y%m%dT%H%M%S")
+        return self.directory / f"events-{stamp}-{os.getpid()}-{self._segments:04d}.jsonl"
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:  # drain whatever else is waiting into one write
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not None]
+            lines = "".join(
+                json.dumps(record, default=str, separators=(",", ":")) + "\n" for record in records
+            )
+            if lines:
+                if self._segment is None or (
+                    self._segment.exists() and self._segment.stat().st_size >= self.segment_bytes
+                ):
+                    self._segment = self._next_segment()
+                with self._segment.open("a", encoding="utf-8") as handle:
+                    handle.write(lines)
+                self.written += len(records)
+            if len(records) < len(batch):
+                return
+
+
+_SINK: Optional[JsonlSink] = None
+_SINK_LOCK = threading.Lock()
+
+
+def default_sink() -> Optional[JsonlSink]:
+    """Process-wide sink under ``SN_EVENT_LOG_DIR``; None when unset."""
+    global _SINK
+    directory = os.environ.get("SN_EVENT_LOG_DIR", "").strip()
+    if not directory:
+        return None
+    with _SINK_LOCK:
+        if _SINK is None:
+            _SINK = JsonlSink(Path(directory))
+            atexit.register(_SINK.close)
+    return _SINK
@@ -0,0 +1,146 @@
+"""Process-level index of the project layout.
+
+``app.py`` needs two facts on every rerun: that exactly one ``pages/``
+directory with Python files exists in the checkout, and which page files are
+present. Globbing ``**/pages`` for that walks every directory in the tree,
+``.git`` and any in-tree virtualenv included, and filters them only after
+the fact. ``ProjectLayout`` is built once with a pruned ``os.scandir`` walk
+(skipped subtrees are never entered) and rebuilt only when the mtime of
+``pages/`` or one of its subdirectories changes, i.e. when a page file is
+added, removed or renamed.
+
+A stray ``pages`` directory created elsewhere while the server is running is
+picked up on the next rebuild or restart.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+PAGES_DIRNAME = "pages"
+
+# Never entered by the walk (hidden directories are skipped as well).
+SKIP_DIRS = frozenset({
+    "_graveyard",
+    "__pycache__",
+    "node_modules",
+    "venv",
+    "env",
+    "site-packages",
+})
+
+
+def _skipped(name: str) -> bool:
+    return name.startswith(".") or name in SKIP_DIRS
+
+
+def _subdirs(path: str) -> Iterator[os.DirEntry]:
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and not _skipped(entry.name):
+                    yield entry
+    except OSError:
+        return
+
+
+def _contains_py(path: str) -> bool:
+    """True as soon as any ``*.py`` file is found under ``path`` (pruned)."""
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".py"):
+                        return True
+                    if entry.is_dir(follow_symlinks=False) and not _skipped(entry.name):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return False
+
+
+def _find_pages_dirs(root: str) -> List[str]:
+    found: List[str] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        for entry in _subdirs(current):
+            if entry.name == PAGES_DIRNAME and _contains_py(entry.path):
+                found.append(entry.path)
+            stack.append(entry.path)
+    return sorted(found)
+
+
+def _scan_pages(root: Path) -> Tuple[FrozenSet[str], Tuple[Tuple[str, int], ...]]:
+    """Page files (as "pages/…" posix paths) and the mtimes of every pages dir."""
+    files = []
+    dir_mtimes = []
+    stack = [root / PAGES_DIRNAME]
+    while stack:
+        current = stack.pop()
+        try:
+            dir_mtimes.append((str(current), current.stat().st_mtime_ns))
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _skipped(entry.name):
+                            stack.append(Path(entry.path))
+                    elif entry.name.endswith(".py"):
+                        files.append(Path(entry.path).relative_to(root).as_posix())
+        except OSError:
+            continue
+    return frozenset(files), tuple(sorted(dir_mtimes))
+
+
+@dataclass(frozen=True)
+class ProjectLayout:
+    root: Path
+    pages_dirs: Tuple[Path, ...]  # every directory named "pages" that holds Python files
+    page_files: FrozenSet[str]    # "pages/welcome.py", "pages/cost_planner_v2/…"
+    dir_mtimes: Tuple[Tuple[str, int], ...]
+
+    def has_page(self, path: str) -> bool:
+        return Path(path).as_posix() in self.page_files
+
+    def sorted_page_files(self) -> Tuple[Path, ...]:
+        """Page files relative to ``root`` (app.py runs from the project root)."""
+        return tuple(Path(rel) for rel in sorted(self.page_files))
+
+    def is_stale(self) -> bool:
+        for path, mtime_ns in self.dir_mtimes:
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return not self.dir_mtimes and (self.root / PAGES_DIRNAME).is_dir()
+
+
+def build_layout(root: Path) -> ProjectLayout:
+    root = root.resolve()
+    page_files, dir_mtimes = _scan_pages(root)
+    return ProjectLayout(
+        root=root,
+        pages_dirs=tuple(Path(p).resolve() for p in _find_pages_dirs(str(root))),
+        page_files=page_files,
+        dir_mtimes=dir_mtimes,
+    )
+
+
+_LAYOUTS: Dict[Path, ProjectLayout] = {}
+_LOCK = threading.Lock()
+
+
+def project_layout(root: Optional[Path] = None) -> ProjectLayout:
+    """The cached layout for ``root`` (default: the working directory)."""
+    key = (root or Path.cwd()).resolve()
+    with _LOCK:
+        layout = _LAYOUTS.get(key)
+        if layout is None or layout.is_stale():
+            layout = _LAYOUTS[key] = build_layout(key)
+        return layout
@@ -0,0 +1,376 @@
+"""Compact binary encoding for persisted session state.
+
+The wire format is MessagePack (nil, bool, int, float, str, bin, array, map)
+plus a few ext types, written in pure Python so no new dependency is needed:
+
+- SYMBOL: a string from the symbol table as a 1- or 2-byte code. Map keys
+  are learned into the table as they are seen, up to ``MAX_SYMBOLS``. String
+  values only use codes when they are in the seeded vocabulary, which holds
+  enum answers such as GCP options and care settings. Free text is never
+  learned.
+- INT_FLOAT: an integral float (``3100.0``) as a small int, so money stays a
+  float on decode without paying 9 bytes for it.
+- SET: a set, as a packed array.
+- DATE / DATETIME: ISO text.
+
+Codes are append-only. The session store assigns them in its database, in
+the transaction that inserts the symbol, so old blobs keep decoding after a
+restart or a labels.json edit and processes sharing the database agree.
+"""
+from __future__ import annotations
+
+import datetime as _dt
+import struct
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+FORMAT_VERSION = 1
+MAX_SYMBOLS = 65535
+MAX_KEY_SYMBOL_LEN = 64
+
+EXT_SYMBOL = 1
+EXT_INT_FLOAT = 2
+EXT_SET = 3
+EXT_DATE = 4
+EXT_DATETIME = 5
+
+_F32 = struct.Struct(">f")
+_F64 = struct.Struct(">d")
+_FIXEXT = {1: 0xd4, 2: 0xd5, 4: 0xd6, 8: 0xd7, 16: 0xd8}
+
+
+class PackError(TypeError):
+    """A value in session state has no binary encoding."""
+
+
+Allocator = Callable[[Sequence[str]], Mapping[str, int]]
+Refresher = Callable[[int], Iterable[Tuple[int, str]]]
+
+
+class SymbolTable:
+    """String <-> code table shared by every session.
+
+    Standalone, codes are assigned locally in append order. The session store
+    passes ``allocate``, which assigns codes in a database transaction, so
+    processes sharing one database never give two strings the same code.
+    ``refresh(after)`` returns entries above code ``after`` and is called
+    when a blob uses a code this process has not seen yet.
+    """
+
+    def __init__(
+        self,
+        texts: Iterable[str] = (),
+        *,
+        entries: Iterable[Tuple[int, str]] = (),
+        allocate: Optional[Allocator] = None,
+        refresh: Optional[Refresher] = None,
+    ) -> None:
+        self._texts: Dict[int, str] = {}
+        self._codes: Dict[str, int] = {}
+        self._enums: set = set()
+        self._next = 0
+        self._synced = -1       # entries up to this code are known to be loaded
+        self._allocate = allocate
+        self._refresh = refresh
+        self._lock = threading.Lock()
+        self._sync(entries)
+        self._add(self._local(texts))
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def _add(self, entries: Iterable[Tuple[int, str]]) -> None:
+        for code, text in entries:
+            self._texts[code] = text
+            self._codes.setdefault(text, code)
+            self._next = max(self._next, code + 1)
+
+    def _sync(self, entries: Iterable[Tuple[int, str]]) -> None:
+        entries = list(entries)
+        self._add(entries)
+        self._synced = max([self._synced] + [code for code, _ in entries])
+
+    def _local(self, texts: Iterable[str]) -> List[Tuple[int, str]]:
+        start = self._next
+        return [(start + idx, text) for idx, text in enumerate(texts)]
+
+    def _assign(self, texts: Sequence[str]) -> None:
+        """Give ``texts`` codes (caller holds the lock); texts the allocator
+        could not place stay uncoded."""
+        if self._allocate is None:
+            self._add(self._local(texts))
+        else:
+            codes = self._allocate(texts)
+            self._add([(codes[text], text) for text in texts if codes.get(text, MAX_SYMBOLS) < MAX_SYMBOLS])
+
+    def seed(self, vocabulary: Iterable[str]) -> None:
+        """Add enum values (and known keys) that string values may be coded as."""
+        with self._lock:
+            new = []
+            for text in vocabulary:
+                if not isinstance(text, str) or text in self._enums:
+                    continue
+                self._enums.add(text)
+                if text not in self._codes:
+                    new.append(text)
+            new = new[:max(MAX_SYMBOLS - len(self._codes), 0)]
+            if new:
+                self._assign(new)
+
+    def code(self, text: str, learn: bool) -> int:
+        """Code for ``text``, or -1. Values are coded only for seeded enums."""
+        code = self._codes.get(text, -1)
+        if code >= 0:
+            return code if learn or text in self._enums else -1
+        if not learn or len(text) > MAX_KEY_SYMBOL_LEN:
+            return -1
+        with self._lock:
+            if text not in self._codes and len(self._codes) < MAX_SYMBOLS:
+                self._assign([text])
+            return self._codes.get(text, -1)
+
+    def text(self, code: int) -> str:
+        text = self._texts.get(code)
+        if text is None and self._refresh is not None:
+            with self._lock:
+                self._sync(self._refresh(self._synced))
+            text = self._texts.get(code)
+        if text is None:
+            raise ValueError(f"unknown symbol code {code}")
+        return text
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+def _int(out: bytearray, value: int) -> None:
+    if 0 <= value < 0x80:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xff)
+    elif 0 <= value < 1 << 8:
+        out += b"\xcc" + value.to_bytes(1, "big")
+    elif 0 <= value < 1 << 16:
+        out += b"\xcd" + value.to_bytes(2, "big")
+    elif 0 <= value < 1 << 32:
+        out += b"\xce" + value.to_bytes(4, "big")
+    elif 0 <= value < 1 << 64:
+        out += b"\xcf" + value.to_bytes(8, "big")
+    elif -(1 << 7) <= value:
+        out += b"\xd0" + value.to_bytes(1, "big", signed=True)
+    elif -(1 << 15) <= value:
+        out += b"\xd1" + value.to_bytes(2, "big", signed=True)
+    elif -(1 << 31) <= value:
+        out += b"\xd2" + value.to_bytes(4, "big", signed=True)
+    elif -(1 << 63) <= value:
+        out += b"\xd3" + value.to_bytes(8, "big", signed=True)
+    else:
+        raise PackError(f"integer out of range: {value}")
+
+
+def _ext(out: bytearray, ext_type: int, data: bytes) -> None:
+    size = len(data)
+    if size in _FIXEXT:
+        out.append(_FIXEXT[size])
+    elif size < 1 << 8:
+        out += b"\xc7" + size.to_bytes(1, "big")
+    elif size < 1 << 16:
+        out += b"\xc8" + size.to_bytes(2, "big")
+    else:
+        out += b"\xc9" + size.to_bytes(4, "big")
+    out.append(ext_type)
+    out += data
+
+
+def _small_signed(value: int) -> bytes:
+    for size in (1, 2, 4):
+        if -(1 << (8 * size - 1)) <= value < 1 << (8 * size - 1):
+            return value.to_bytes(size, "big", signed=True)
+    return b""
+
+
+def _header(out: bytearray, size: int, fix: int, fix_max: int, codes: Tuple[int, int]) -> None:
+    if size <= fix_max:
+        out.append(fix | size)
+    elif size < 1 << 16:
+        out += bytes((codes[0],)) + size.to_bytes(2, "big")
+    else:
+        out += bytes((codes[1],)) + size.to_bytes(4, "big")
+
+
+def _str(out: bytearray, value: str, symbols: SymbolTable, key: bool) -> None:
+    data = value.encode("utf-8")
+    if len(data) > 2:
+        code = symbols.code(value, learn=key)
+        if 0 <= code < 1 << 8:
+            out += bytes((0xd4, EXT_SYMBOL, code))
+            return
+        if 0 <= code < 1 << 16 and len(data) > 3:
+            out += bytes((0xd5, EXT_SYMBOL)) + code.to_bytes(2, "big")
+            return
+    size = len(data)
+    if size < 32:
+        out.append(0xa0 | size)
+    elif size < 1 << 8:
+        out += b"\xd9" + size.to_bytes(1, "big")
+    elif size < 1 << 16:
+        out += b"\xda" + size.to_bytes(2, "big")
+    else:
+        out += b"\xdb" + size.to_bytes(4, "big")
+    out += data
+
+
+def _pack(out: bytearray, value: Any, symbols: SymbolTable) -> None:
+    if value is None:
+        out.append(0xc0)
+    elif value is True:
+        out.append(0xc3)
+    elif value is False:
+        out.append(0xc2)
+    elif isinstance(value, str):
+        _str(out, value, symbols, key=False)
+    elif isinstance(value, int):
+        _int(out, value)
+    elif isinstance(value, float):
+        if value.is_integer() and (data := _small_signed(int(value))):
+            _ext(out, EXT_INT_FLOAT, data)
+        elif _F32.unpack(_F32.pack(value))[0] == value:
+            out += b"\xca" + _F32.pack(value)
+        else:
+            out += b"\xcb" + _F64.pack(value)
+    elif isinstance(value, Mapping):
+        _header(out, len(value), 0x80, 15, (0xde, 0xdf))
+        for key, item in value.items():
+            if isinstance(key, str):
+                _str(out, key, symbols, key=True)
+            else:
+                _pack(out, key, symbols)
+            _pack(out, item, symbols)
+    elif isinstance(value, (list, tuple)):
+        _header(out, len(value), 0x90, 15, (0xdc, 0xdd))
+        for item in value:
+            _pack(out, item, symbols)
+    elif isinstance(value, (set, frozenset)):
+        inner = bytearray()
+        _pack(inner, sorted(value, key=repr), symbols)
+        _ext(out, EXT_SET, bytes(inner))
+    elif isinstance(value, (bytes, bytearray)):
+        size = len(value)
+        out += (b"\xc4" + size.to_bytes(1, "big") if size < 1 << 8
+                else b"\xc5" + size.to_bytes(2, "big") if size < 1 << 16
+                else b"\xc6" + size.to_bytes(4, "big"))
+        out += value
+    elif isinstance(value, _dt.datetime):
+        _ext(out, EXT_DATETIME, value.isoformat().encode("ascii"))
+    elif isinstance(value, _dt.date):
+        _ext(out, EXT_DATE, value.isoformat().encode("ascii"))
+    elif hasattr(value, "item") and callable(value.item):  # NumPy scalars
+        _pack(out, value.item(), symbols)
+    else:
+        raise PackError(f"cannot encode {type(value).__name__}")
+
+
+def pack(value: Any, symbols: SymbolTable) -> bytes:
+    out = bytearray((FORMAT_VERSION,))
+    _pack(out, value, symbols)
+    return bytes(out)
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+class _Reader:
+    __slots__ = ("data", "pos", "symbols")
+
+    def __init__(self, data: bytes, symbols: SymbolTable) -> None:
+        self.data = data
+        self.pos = 0
+        self.symbols = symbols
+
+    def take(self, size: int) -> bytes:
+        start = self.pos
+        self.pos += size
+        if self.pos > len(self.data):
+            raise ValueError("truncated session blob")
+        return self.data[start:self.pos]
+
+    def uint(self, size: int) -> int:
+        return int.from_bytes(self.take(size), "big")
+
+    def value(self) -> Any:
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag < 0x80:
+            return tag
+        if tag >= 0xe0:
+            return tag - 0x100
+        if 0x80 <= tag <= 0x8f:
+            return self.map(tag & 0x0f)
+        if 0x90 <= tag <= 0x9f:
+            return self.array(tag & 0x0f)
+        if 0xa0 <= tag <= 0xbf:
+            return self.take(tag & 0x1f).decode("utf-8")
+        if tag == 0xc0:
+            return None
+        if tag == 0xc2:
+            return False
+        if tag == 0xc3:
+            return True
+        if tag in (0xc4, 0xc5, 0xc6):
+            return bytes(self.take(self.uint(1 << (tag - 0xc4))))
+        if tag in (0xc7, 0xc8, 0xc9):
+            size = self.uint(1 << (tag - 0xc7))
+            return self.ext(self.uint(1), size)
+        if tag == 0xca:
+            return _F32.unpack(self.take(4))[0]
+        if tag == 0xcb:
+            return _F64.unpack(self.take(8))[0]
+        if 0xcc <= tag <= 0xcf:
+            return self.uint(1 << (tag - 0xcc))
+        if 0xd0 <= tag <= 0xd3:
+            return int.from_bytes(self.take(1 << (tag - 0xd0)), "big", signed=True)
+        if 0xd4 <= tag <= 0xd8:
+            ext_type = self.uint(1)
+            return self.ext(ext_type, 1 << (tag - 0xd4))
+        if tag in (0xd9, 0xda, 0xdb):
+            return self.take(self.uint(1 << (tag - 0xd9))).decode("utf-8")
+        if tag in (0xdc, 0xdd):
+            return self.array(self.uint(2 if tag == 0xdc else 4))
+        if tag in (0xde, 0xdf):
+            return self.map(self.uint(2 if tag == 0xde else 4))
+        raise ValueError(f"unknown tag 0x{tag:02x}")
+
+    def map(self, size: int) -> Dict[Any, Any]:
+        result = {}
+        for _ in range(size):
+            key = self.value()
+            result[key] = self.value()
+        return result
+
+    def array(self, size: int) -> List[Any]:
+        return [self.value() for _ in range(size)]
+
+    def ext(self, ext_type: int, size: int) -> Any:
+        data = self.take(size)
+        if ext_type == EXT_SYMBOL:
+            return self.symbols.text(int.from_bytes(data, "big"))
+        if ext_type == EXT_INT_FLOAT:
+            return float(int.from_bytes(data, "big", signed=True))
+        if ext_type == EXT_SET:
+            return set(_Reader(data, self.symbols).value())
+        if ext_type == EXT_DATE:
+            return _dt.date.fromisoformat(data.decode("ascii"))
+        if ext_type == EXT_DATETIME:
+            return _dt.datetime.fromisoformat(data.decode("ascii"))
+        raise ValueError(f"unknown ext type {ext_type}")
+
+
+def unpack(blob: bytes, symbols: SymbolTable) -> Any:
+    if not blob or blob[0] != FORMAT_VERSION:
+        raise ValueError("unsupported session blob version")
+    reader = _Reader(memoryview(blob)[1:].tobytes(), symbols)
+    value = reader.value()
+    if reader.pos != len(reader.data):
+        raise ValueError("trailing bytes in session blob")
+    return value
@@ -0,0 +1,163 @@
+"""Cached syntax preflight for page modules.
+
+``app.py`` compiles every file under ``pages/`` before navigation so a bad
+edit shows a readable error instead of a broken page. Doing that on every
+rerun recompiles 60+ unchanged files per click. ``PreflightCache`` keeps a
+verdict per file keyed on (mtime, size, content hash): only new or changed
+files are read and compiled. Verdicts are shared by every session in the
+process and persisted to a JSON manifest so a restarted server starts warm.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+MANIFEST_PATH = PROJECT_ROOT / ".sn_cache" / "preflight.json"
+MANIFEST_VERSION = 1
+TIMING_SAMPLES = 200
+
+
+@dataclass(frozen=True)
+class PreflightError:
+    path: str
+    line: int
+    col: int
+    msg: str
+    text: str
+
+
+@dataclass(frozen=True)
+class PreflightReport:
+    errors: Tuple[PreflightError, ...]
+    checked: int   # files seen
+    compiled: int  # files read and compiled this time (new or changed)
+    elapsed_ms: float
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _iter_sources(roots: Iterable[str]) -> Iterator[Path]:
+    for root in roots:
+        yield from sorted(Path(root).rglob("*.py"))
+
+
+def _compile_errors(path: Path, source: bytes) -> List[PreflightError]:
+    try:
+        compile(source, str(path), "exec", dont_inherit=True)
+    except SyntaxError as e:
+        return [PreflightError(str(path), e.lineno or 0, e.offset or 0, e.msg, e.text or "")]
+    except Exception as e:
+        return [PreflightError(str(path), 0, 0, f"{type(e).__name__}: {e}", "")]
+    return []
+
+
+class PreflightCache:
+    """Per-file compile verdicts, reused until a file's mtime/size/hash changes."""
+
+    def __init__(self, manifest_path: Path | None = MANIFEST_PATH) -> None:
+        self.manifest_path = manifest_path
+        self._entries: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self.timings_ms: Deque[float] = deque(maxlen=TIMING_SAMPLES)
+        self._load()
+
+    # -- manifest -----------------------------------------------------------
+    def _load(self) -> None:
+        if self.manifest_path is None:
+            return
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        # Verdicts depend on the interpreter's grammar.
+        if data.get("version") == MANIFEST_VERSION and data.get("python") == sys.version:
+            self._entries = dict(data.get("files", {}))
+
+    def _save(self) -> None:
+        if self.manifest_path is None:
+            return
+        payload = {"version": MANIFEST_VERSION, "python": sys.version, "files": self._entries}
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+            tmp_path.replace(self.manifest_path)
+        except OSError:
+            pass  # read-only checkout: the in-process cache still applies
+
+    # -- checking -----------------------------------------------------------
+    def _verdict(self, path: Path) -> Tuple[List[PreflightError], bool]:
+        """Return (errors, compiled) for one file, updating the cache entry."""
+        key = str(path)
+        try:
+            stat = path.stat()
+        except OSError as e:
+            return [PreflightError(key, 0, 0, f"read error: {e}", "")], False
+        entry = self._entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return [PreflightError(*err) for err in entry["errors"]], False
+
+        try:
+            source = path.read_bytes()
+        except OSError as e:
+            return [PreflightError(key, 0, 0, f"read error: {e}", "")], False
+        digest = hashlib.sha256(source).hexdigest()
+        if entry and entry["sha256"] == digest:
+            # Touched but unchanged (checkout, copy): keep the verdict.
+            errors = [PreflightError(*err) for err in entry["errors"]]
+            compiled = False
+        else:
+            errors = _compile_errors(path, source)
+            compiled = True
+        self._entries[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "errors": [[e.path, e.line, e.col, e.msg, e.text] for e in errors],
+        }
+        return errors, compiled
+
+    def check(self, roots: Sequence[str] = ("pages",), paths: Iterable[Path] | None = None) -> PreflightReport:
+        """Preflight every ``*.py`` under ``roots`` (or the given ``paths``)."""
+        started = time.perf_counter()
+        errors: List[PreflightError] = []
+        checked = compiled = 0
+        with self._lock:
+            before = dict(self._entries)
+            seen = set()
+            for path in (paths if paths is not None else _iter_sources(roots)):
+                file_errors, was_compiled = self._verdict(path)
+                errors.extend(file_errors)
+                checked += 1
+                compiled += was_compiled
+                seen.add(str(path))
+            for key in [k for k in self._entries if k not in seen]:
+                del self._entries[key]
+            if self._entries != before:
+                self._save()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self.timings_ms.append(elapsed_ms)
+        return PreflightReport(tuple(errors), checked, compiled, elapsed_ms)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.timings_ms.clear()
+
+
+PREFLIGHT = PreflightCache()
+
+
+def syntax_preflight(roots: Sequence[str] = ("pages",), paths: Iterable[Path] | None = None) -> PreflightReport:
+    """Run the process-wide cached preflight (``paths`` skips the directory walk)."""
+    return PREFLIGHT.check(roots, paths)
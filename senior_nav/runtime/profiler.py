@@ -0,0 +1,168 @@
+"""Opt-in per-rerun span timings and sampled cProfile captures.
+
+Hot helpers are decorated with ``@profiled()``; ``app.py`` wraps the page
+run in ``span()``. Nothing is recorded unless ``begin_rerun(True)`` was
+called on the current script thread (design mode), so the decorators cost a
+thread-local lookup per call otherwise.
+
+Timings go into fixed-size ring buffers, one per span name and at most
+``MAX_SPANS`` names, so memory stays bounded however long the process runs.
+``summary()`` reports p50/p95 over the buffered samples. Every
+``SAMPLE_EVERY``-th profiled rerun, ``sampled_profile()`` runs the page under
+cProfile and keeps the top functions of the last few captures.
+
+This module does not import Streamlit; ``app.py`` renders the results.
+"""
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Iterator, List, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+RING_SIZE = 256        # samples kept per span
+MAX_SPANS = 64         # distinct span names; further names are dropped
+SAMPLE_EVERY = int(os.environ.get("SN_PROFILE_EVERY", "20") or 20)
+PROFILE_LINES = 25     # functions kept per cProfile capture
+
+_LOCAL = threading.local()
+_LOCK = threading.Lock()
+_BUFFERS: Dict[str, Deque[float]] = {}
+_PROFILES: Deque["ProfileCapture"] = deque(maxlen=4)
+_RERUNS = 0
+
+
+@dataclass(frozen=True)
+class ProfileCapture:
+    rerun: int          # profiled-rerun counter value when captured
+    label: str
+    elapsed_ms: float
+    stats: str          # pstats output, cumulative order
+
+
+def begin_rerun(enabled: bool) -> None:
+    """Turn recording on or off for the rest of this rerun (this thread)."""
+    _LOCAL.active = bool(enabled)
+
+
+def is_active() -> bool:
+    return getattr(_LOCAL, "active", False)
+
+
+def record(name: str, elapsed_ms: float) -> None:
+    buffer = _BUFFERS.get(name)
+    if buffer is None:
+        with _LOCK:
+            buffer = _BUFFERS.get(name)
+            if buffer is None:
+                if len(_BUFFERS) >= MAX_SPANS:
+                    return
+                buffer = _BUFFERS[name] = deque(maxlen=RING_SIZE)
+    buffer.append(elapsed_ms)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the block under ``name`` (no-op unless the rerun is profiled)."""
+    if not is_active():
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000.0)
+
+
+def profiled(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator form of ``span``; the label defaults to the function's name."""
+    def decorate(fn: F) -> F:
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not getattr(_LOCAL, "active", False):
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(label, (time.perf_counter() - start) * 1000.0)
+
+        return wrapper  # type: ignore[return-value]
+    return decorate
+
+
+@contextmanager
+def sampled_profile(label: str) -> Iterator[None]:
+    """Run the block under cProfile on every ``SAMPLE_EVERY``-th profiled rerun."""
+    global _RERUNS
+    if not is_active():
+        yield
+        return
+    with _LOCK:
+        _RERUNS += 1
+        rerun = _RERUNS
+    profiler = cProfile.Profile() if SAMPLE_EVERY > 0 and rerun % SAMPLE_EVERY == 0 else None
+    if profiler is not None:
+        try:
+            profiler.enable()
+        except ValueError:  # another profiler is already attached
+            profiler = None
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_LINES)
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            _PROFILES.append(ProfileCapture(rerun, label, round(elapsed_ms, 2), out.getvalue()))
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def summary() -> List[Dict[str, object]]:
+    """One row per span over its buffered samples, slowest p95 first."""
+    rows = []
+    for name, buffer in list(_BUFFERS.items()):
+        samples = list(buffer)
+        if not samples:
+            continue
+        ordered = sorted(samples)
+        rows.append({
+            "span": name,
+            "calls": len(samples),
+            "p50_ms": round(_percentile(ordered, 50), 2),
+            "p95_ms": round(_percentile(ordered, 95), 2),
+            "last_ms": round(samples[-1], 2),
+        })
+    rows.sort(key=lambda row: -row["p95_ms"])
+    return rows
+
+
+def profiles() -> List[ProfileCapture]:
+    """Most recent cProfile captures, newest last."""
+    return list(_PROFILES)
+
+
+def reset() -> None:
+    global _RERUNS
+    with _LOCK:
+        _BUFFERS.clear()
+        _PROFILES.clear()
+        _RERUNS = 0
@@ -0,0 +1,176 @@
+"""Process-level page registry for ``st.navigation``.
+
+``app.py`` used to walk its ``INTENDED`` table on every rerun, checking each
+file and building the ``st.Page`` list from scratch. The table only changes
+when the code does, so it is resolved once per process into an immutable
+``PageRegistry`` (re-resolved when the project layout changes, i.e. a page
+file is added or removed). Each rerun only turns the resolved specs into
+fresh ``st.Page`` objects, which Streamlit requires because a page returned
+by ``st.navigation`` can be run only once.
+
+Page scripts themselves are executed by Streamlit only when navigated to, so
+any work a page does at module level is paid on that page alone. What a page
+still pays on its first visit in a process is its imports; ``import_costs()``
+measures them per page (``tools/page_import_report.py`` prints the report).
+"""
+from __future__ import annotations
+
+import ast
+import re
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .layout import ProjectLayout, project_layout
+
+
+@dataclass(frozen=True)
+class PageSpec:
+    path: str      # "pages/welcome.py", relative to the project root
+    title: str
+    icon: str
+    default: bool = False
+
+
+@dataclass(frozen=True)
+class PageRegistry:
+    specs: Tuple[PageSpec, ...]    # present pages, in navigation order
+    missing: Tuple[str, ...]       # INTENDED paths with no file behind them
+    layout: ProjectLayout
+
+    @property
+    def default(self) -> Optional[PageSpec]:
+        return next((spec for spec in self.specs if spec.default), None)
+
+    def st_pages(self) -> list:
+        """Fresh ``st.Page`` objects for this rerun (cheap; no lookups)."""
+        import streamlit as st
+
+        return [
+            st.Page(spec.path, title=spec.title, icon=spec.icon, default=True)
+            if spec.default else st.Page(spec.path, title=spec.title, icon=spec.icon)
+            for spec in self.specs
+        ]
+
+
+def resolve_pages(intended: Iterable[Sequence], layout: ProjectLayout) -> PageRegistry:
+    """Resolve ``(path, title, icon, default)`` rows against ``layout``.
+
+    Missing files are dropped (and listed in ``missing``); only the first
+    page flagged as default keeps the flag, as ``st.navigation`` allows one.
+    """
+    specs: List[PageSpec] = []
+    missing: List[str] = []
+    has_default = False
+    for path, title, icon, default in intended:
+        if not layout.has_page(path):
+            missing.append(path)
+            continue
+        default = bool(default) and not has_default
+        has_default = has_default or default
+        specs.append(PageSpec(Path(path).as_posix(), title, icon, default))
+    return PageRegistry(tuple(specs), tuple(missing), layout)
+
+
+_REGISTRIES: Dict[Tuple[Path, Tuple[Tuple, ...]], PageRegistry] = {}
+_LOCK = threading.Lock()
+
+
+def page_registry(intended: Iterable[Sequence], root: Optional[Path] = None) -> PageRegistry:
+    """The cached registry for ``intended``; rebuilt when the layout changes."""
+    layout = project_layout(root)
+    key = (layout.root, tuple(tuple(row) for row in intended))
+    with _LOCK:
+        registry = _REGISTRIES.get(key)
+        if registry is None or registry.layout is not layout:
+            registry = _REGISTRIES[key] = resolve_pages(key[1], layout)
+        return registry
+
+
+# ---------------------------------------------------------------------------
+# Import-cost report
+# ---------------------------------------------------------------------------
+def page_imports(path: Path) -> Tuple[str, ...]:
+    """Absolute modules a page imports at module level (``try``/``if`` included)."""
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return ()
+    modules: List[str] = []
+    stack = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and not node.level and node.module != "__future__":
+                modules.append(node.module)
+        elif isinstance(node, (ast.Try, ast.If, ast.With)):
+            children = list(node.body) + list(getattr(node, "orelse", []))
+            for handler in getattr(node, "handlers", []):
+                children.extend(handler.body)
+            children.extend(getattr(node, "finalbody", []))
+            stack.extend(reversed(children))
+    return tuple(dict.fromkeys(modules))
+
+
+@dataclass(frozen=True)
+class ImportCost:
+    path: str
+    total_ms: float                           # first-visit import time beyond the app's own
+    modules: Tuple[Tuple[str, float], ...]    # top-level imports, slowest first
+
+
+# Modules app.py has already imported before any page runs.
+BASELINE_IMPORTS: Tuple[str, ...] = ("streamlit", "ui.theme", "senior_nav.runtime")
+
+_MARKER = "--sn-page-imports--"
+_IMPORTTIME = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( +)(\S+)")
+
+
+def _measure(root: Path, spec_path: str, python: str) -> ImportCost:
+    modules = page_imports(root / spec_path)
+    lines = [f"import sys; sys.path.insert(0, {str(root)!r})"]
+    lines += [f"try:\n    import {name}\nexcept Exception:\n    pass" for name in BASELINE_IMPORTS]
+    lines.append(f"sys.stderr.write({_MARKER + chr(10)!r}); sys.stderr.flush()")
+    lines += [f"try:\n    import {name}\nexcept Exception:\n    pass" for name in modules]
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", "\n".join(lines)],
+        cwd=root, capture_output=True, text=True, check=False,
+    )
+    rows = []
+    after_marker = False
+    for line in proc.stderr.splitlines():
+        if line == _MARKER:
+            after_marker = True
+            continue
+        match = _IMPORTTIME.match(line) if after_marker else None
+        if match:
+            rows.append((len(match.group(3)), match.group(4), int(match.group(2)) / 1000.0))
+    if not rows:
+        return ImportCost(spec_path, 0.0, ())
+    top = min(depth for depth, _, _ in rows)
+    costs = sorted(((name, ms) for depth, name, ms in rows if depth == top), key=lambda r: -r[1])
+    return ImportCost(spec_path, round(sum(ms for _, ms in costs), 2), tuple(costs))
+
+
+def import_costs(
+    registry: PageRegistry,
+    *,
+    python: str = sys.executable,
+    workers: int = 4,
+) -> List[ImportCost]:
+    """Per-page first-visit import cost, each page in a fresh interpreter.
+
+    Modules in ``BASELINE_IMPORTS`` are imported first and not counted, so
+    the numbers are what a cold process pays on top of app.py's own imports.
+    Sorted slowest first.
+    """
+    root = registry.layout.root
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        costs = list(pool.map(lambda spec: _measure(root, spec.path, python), registry.specs))
+    return sorted(costs, key=lambda cost: -cost.total_ms)
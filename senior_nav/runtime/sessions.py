@@ -0,0 +1,361 @@
+"""Server-side persistence of planner session state.
+
+A browser refresh or a dropped websocket used to lose everything: the
+planner namespaces (see ``NAMESPACES``) only existed in
+``st.session_state``. Persistence is opt-in (``SN_SESSION_DB``, see
+``default_store``). When enabled, ``app.py`` keys each session by an
+``sn_sid`` cookie. It reuses a cookie's token only when the store already
+holds state for it, and mints a fresh token otherwise. It restores the
+saved namespaces on the first rerun and saves them after each page run.
+
+- Blobs use the compact codec in ``packing``, so enum answers and repeated
+  keys are stored as 1-2 byte codes. The symbol table is kept in the same
+  sqlite file, and codes are assigned there, so several server processes
+  can share one database.
+- ``save()`` is cheap and non-blocking. Unchanged state is skipped by
+  digest. Changed state is queued, and repeated saves of one token coalesce
+  into a single pending row. A background thread writes the queue in one
+  transaction every ``FLUSH_INTERVAL`` seconds, or as soon as
+  ``MAX_PENDING`` tokens are waiting.
+- ``load()`` sees queued writes before they reach disk.
+
+This module does not import Streamlit.
+"""
+from __future__ import annotations
+
+import atexit
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .content import PROJECT_ROOT, load_json
+from .packing import PackError, SymbolTable, pack, unpack
+
+LOGGER = logging.getLogger(__name__)
+
+NAMESPACES: Tuple[str, ...] = (
+    "audiencing", "gcp", "gcp_answers", "cost_planner", "cp", "pfma", "care_context",
+)
+# Derived entries that are rebuilt after a restore instead of stored:
+# None drops the key, a callable resets it.
+DERIVED: Mapping[str, Mapping[str, Optional[Callable[[], Any]]]] = {
+    "cp": {
+        "_shaped": None,            # cp_state.SHAPED_KEY: typed blocks come back as plain dicts
+    },
+    "cost_planner": {
+        "_subtotals_synced": None,  # field-table versions restart per process
+        "snapshot_for_crm": dict,   # aliases inputs/subtotals; recompute_costs rebuilds it
+    },
+}
+
+DEFAULT_PATH = PROJECT_ROOT / ".sn_cache" / "sessions.sqlite3"
+FLUSH_INTERVAL = 2.0     # seconds between background flushes
+MAX_PENDING = 256        # flush early once this many tokens are queued
+TTL_DAYS = 30            # sessions untouched for longer are purged on open
+MAX_DIGESTS = 4096       # recent tokens whose last blob digest is remembered
+
+LABELS_PATH = PROJECT_ROOT / "guided_care_plan" / "labels.json"
+# Enum values stored outside labels.json (GCP outcomes, planner modes, statuses).
+EXTRA_VOCABULARY: Tuple[str, ...] = (
+    "self", "loved_one", "professional", "single", "couple", "unified", "split",
+    "exploring", "estimate", "detailed", "start", "in_progress", "done", "skipped",
+    "home", "assisted", "memory", "low", "med", "high", "medicaid", "private",
+    "supported", "stable", "watch", "stretched",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    token TEXT PRIMARY KEY,
+    updated REAL NOT NULL,
+    blob BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    code INTEGER PRIMARY KEY,
+    text TEXT NOT NULL UNIQUE
+);
+"""
+
+
+def label_vocabulary(path: Path = LABELS_PATH) -> Tuple[str, ...]:
+    """GCP question ids and option values (the enum answers)."""
+    try:
+        questions = load_json(path).get("questions", {})
+    except (OSError, ValueError):
+        return ()
+    words = []
+    for question_id, meta in questions.items():
+        words.append(question_id)
+        words.extend(option.get("value") for option in meta.get("options", ()))
+    return tuple(word for word in words if isinstance(word, str))
+
+
+def snapshot(state: Mapping[str, Any]) -> Dict[str, Any]:
+    """The persisted namespaces of ``state``, minus derived entries."""
+    data = {}
+    for name in NAMESPACES:
+        value = state.get(name)
+        if value is None:
+            continue
+        derived = DERIVED.get(name)
+        if derived and isinstance(value, Mapping):
+            value = {key: item for key, item in value.items() if key not in derived}
+        data[name] = value
+    return data
+
+
+def restore(state: Any, data: Mapping[str, Any]) -> None:
+    """Write loaded namespaces into ``state`` (a session_state or a dict)."""
+    for name, value in data.items():
+        if name not in NAMESPACES:
+            continue
+        for key, factory in DERIVED.get(name, {}).items():
+            if factory is not None and isinstance(value, dict):
+                value[key] = factory()
+        state[name] = value
+
+
+@dataclass
+class StoreStats:
+    saves: int = 0           # save() calls
+    unchanged: int = 0       # skipped: same bytes as the last save
+    coalesced: int = 0       # replaced a write still in the queue
+    queued_bytes: int = 0    # blob bytes of every changed save (= write-through volume)
+    failed: int = 0          # state that could not be encoded
+    rows_written: int = 0    # session rows sent to sqlite
+    bytes_written: int = 0   # blob bytes sent to sqlite
+    transactions: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+class SessionStore:
+    def __init__(
+        self,
+        path: Path = DEFAULT_PATH,
+        *,
+        vocabulary: Iterable[str] = (),
+        flush_interval: float = FLUSH_INTERVAL,
+        max_pending: int = MAX_PENDING,
+        background: bool = True,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.stats = StoreStats()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.execute("DELETE FROM sessions WHERE updated < ?", (time.time() - TTL_DAYS * 86400,))
+        self._db_lock = threading.Lock()
+        rows = self._db.execute("SELECT code, text FROM symbols").fetchall()
+        self.symbols = SymbolTable(entries=rows, allocate=self._allocate_symbols, refresh=self._symbols_after)
+        self.symbols.seed(vocabulary)
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._pending: Dict[str, Tuple[float, bytes]] = {}
+        # Last saved digest per token, for skipping unchanged saves. Bounded:
+        # a forgotten token just writes its next save once more.
+        self._digests: "OrderedDict[str, bytes]" = OrderedDict()
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+        if background:
+            self._writer = threading.Thread(target=self._run, name="sn-session-writer", daemon=True)
+            self._writer.start()
+
+    # -- public API -----------------------------------------------------------
+    def save(self, token: str, state: Mapping[str, Any]) -> bool:
+        """Queue ``state`` for ``token``; False when unchanged or not encodable."""
+        try:
+            blob = pack(state, self.symbols)
+        except (PackError, ValueError, RecursionError) as exc:
+            with self._lock:
+                self.stats.saves += 1
+                self.stats.failed += 1
+            LOGGER.warning("Session %s not saved: %s", token[:6], exc)
+            return False
+        digest = hashlib.blake2b(blob, digest_size=16).digest()
+        with self._lock:
+            self.stats.saves += 1
+            if self._digests.get(token) == digest:
+                self._digests.move_to_end(token)
+                self.stats.unchanged += 1
+                return False
+            self._remember(token, digest)
+            self.stats.queued_bytes += len(blob)
+            if token in self._pending:
+                self.stats.coalesced += 1
+            self._pending[token] = (time.time(), blob)
+            if len(self._pending) >= self.max_pending:
+                self._wake.notify()
+        if self._writer is None and len(self._pending) >= self.max_pending:
+            self.flush()
+        return True
+
+    def load(self, token: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            queued = self._pending.get(token)
+        if queued is not None:
+            blob = queued[1]
+        else:
+            with self._db_lock:
+                row = self._db.execute("SELECT blob FROM sessions WHERE token = ?", (token,)).fetchone()
+            if row is None:
+                return None
+            blob = row[0]
+        try:
+            data = unpack(blob, self.symbols)
+        except (ValueError, IndexError) as exc:
+            LOGGER.warning("Session %s could not be decoded: %s", token[:6], exc)
+            return None
+        with self._lock:
+            if token not in self._digests:
+                self._remember(token, hashlib.blake2b(blob, digest_size=16).digest())
+        return data if isinstance(data, dict) else None
+
+    def discard(self, token: str) -> None:
+        """Forget ``token``: its queued write, saved row and digest."""
+        with self._lock:
+            self._pending.pop(token, None)
+            self._digests.pop(token, None)
+        with self._db_lock:
+            self._db.execute("DELETE FROM sessions WHERE token = ?", (token,))
+
+    def flush(self) -> int:
+        """Write every queued session now; returns the number of rows."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        rows = [(token, updated, blob) for token, (updated, blob) in pending.items()]
+        with self._db_lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO sessions (token, updated, blob) VALUES (?, ?, ?)", rows,
+                )
+                self._db.execute("COMMIT")
+            except sqlite3.Error:
+                self._db.execute("ROLLBACK")
+                self._requeue(pending)
+                raise
+        with self._lock:
+            self.stats.rows_written += len(rows)
+            self.stats.bytes_written += sum(len(blob) for _, _, blob in rows)
+            self.stats.transactions += 1
+        return len(rows)
+
+    def _requeue(self, pending: Dict[str, Tuple[float, bytes]]) -> None:
+        """Put a failed batch back, unless newer state was queued meanwhile."""
+        with self._lock:
+            for token, entry in pending.items():
+                self._pending.setdefault(token, entry)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake.notify()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+        with self._db_lock:
+            self._db.close()
+
+    def _remember(self, token: str, digest: bytes) -> None:
+        """Record ``token``'s digest (caller holds ``_lock``)."""
+        self._digests[token] = digest
+        self._digests.move_to_end(token)
+        if len(self._digests) > MAX_DIGESTS:
+            self._digests.popitem(last=False)
+
+    # -- symbol codes ---------------------------------------------------------
+    def _allocate_symbols(self, texts: Sequence[str]) -> Dict[str, int]:
+        """Codes for ``texts``, inserted and read back in one transaction.
+
+        The database assigns each code (``symbols.code`` is the rowid), so
+        two processes learning different strings never share one. Texts
+        another process added first get that process's code.
+        """
+        with self._db_lock:
+            try:
+                self._db.execute("BEGIN IMMEDIATE")
+                try:
+                    self._db.executemany(
+                        "INSERT INTO symbols (text) VALUES (?) ON CONFLICT(text) DO NOTHING",
+                        [(text,) for text in texts],
+                    )
+                    codes = {}
+                    for text in texts:
+                        (codes[text],) = self._db.execute("SELECT code FROM symbols WHERE text = ?", (text,)).fetchone()
+                    self._db.execute("COMMIT")
+                except sqlite3.Error:
+                    self._db.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as exc:  # the strings are stored as text instead
+                LOGGER.warning("Symbol codes not assigned: %s", exc)
+                return {}
+        return codes
+
+    def _symbols_after(self, code: int) -> List[Tuple[int, str]]:
+        """Symbols other processes added above ``code``."""
+        with self._db_lock:
+            return self._db.execute("SELECT code, text FROM symbols WHERE code > ?", (code,)).fetchall()
+
+    # -- background writer ----------------------------------------------------
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._closed and len(self._pending) < self.max_pending:
+                    self._wake.wait(self.flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except sqlite3.Error as exc:  # keep the process alive; next flush retries new state
+                LOGGER.warning("Session flush failed: %s", exc)
+
+
+_STORE: Optional[SessionStore] = None
+_UNAVAILABLE = False
+_STORE_LOCK = threading.Lock()
+
+
+def default_store() -> Optional[SessionStore]:
+    """Process-wide store, or None unless persistence is opted into.
+
+    ``SN_SESSION_DB`` enables it: a database path, or ``on``/``1`` for
+    ``DEFAULT_PATH``. Unset (or ``off``) keeps planner state in memory only.
+    Also returns None when the database cannot be opened.
+    """
+    global _STORE, _UNAVAILABLE
+    if _STORE is not None or _UNAVAILABLE:
+        return _STORE
+    setting = os.environ.get("SN_SESSION_DB", "").strip()
+    if setting.lower() in ("", "off", "0", "false", "none"):
+        return None
+    if setting.lower() in ("on", "1", "true", "yes"):
+        setting = ""
+    with _STORE_LOCK:
+        if _STORE is None and not _UNAVAILABLE:
+            try:
+                _STORE = SessionStore(
+                    Path(setting) if setting else DEFAULT_PATH,
+                    vocabulary=NAMESPACES + label_vocabulary() + EXTRA_VOCABULARY,
+                )
+            except (OSError, sqlite3.Error) as exc:
+                LOGGER.warning("Session store unavailable: %s", exc)
+                _UNAVAILABLE = True
+                return None
+            atexit.register(_STORE.close)
+    return _STORE
@@ -0,0 +1,119 @@
+"""Immutable snapshots with structural sharing and a content hash.
+
+Snapshots such as ``audiencing_snapshot`` are built on most reruns and then
+embedded in GCP results, the Cost Planner CRM snapshot and the event log.
+Deep-copying them at each step was the only way to keep one consumer's
+edits out of another's copy. ``freeze()`` instead builds a ``FrozenMap``
+tree that can be shared freely:
+
+- ``FrozenMap`` is a read-only ``dict`` subclass, so ``json.dumps``,
+  ``isinstance(x, dict)`` and Streamlit widgets keep working. Lists become
+  tuples and sets become frozensets.
+- The hash is computed once from the content. Equality compares hashes
+  first, and caches can key on ``hash(snapshot)``.
+- ``freeze(value, previous)`` reuses every sub-block of ``previous`` that
+  is unchanged. When nothing changed, ``previous`` itself is returned, so
+  ``new is old`` is the cheapest "did it change" check.
+
+``copy.copy``/``deepcopy`` return the same object; ``thaw()`` gives a mutable
+copy.
+
+This module does not import Streamlit.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is immutable; use thaw() or replace()")
+
+
+class FrozenMap(dict):
+    """Hashable, read-only dict whose values are frozen as well."""
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, items: Iterable[Tuple[Any, Any]] | Mapping = ()) -> None:
+        super().__init__(items)
+        self._hash = hash(frozenset(dict.items(self)))
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, FrozenMap) and other._hash != self._hash:
+            return False
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __setitem__ = __delitem__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = __ior__ = _readonly  # type: ignore[assignment]
+
+    def __copy__(self) -> "FrozenMap":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenMap":
+        return self
+
+    def __reduce__(self):
+        return (FrozenMap, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenMap({dict.__repr__(self)})"
+
+    def replace(self, **changes: Any) -> "FrozenMap":
+        """Copy with ``changes`` applied (frozen, sharing the untouched values)."""
+        merged = dict(self)
+        for key, value in changes.items():
+            merged[key] = freeze(value, self.get(key))
+        return FrozenMap(merged)
+
+    def thaw(self) -> Dict[str, Any]:
+        """Mutable deep copy (dicts and lists)."""
+        return thaw(self)
+
+
+def freeze(value: Any, previous: Optional[Any] = None) -> Any:
+    """Frozen copy of ``value``, reusing unchanged parts of ``previous``."""
+    if isinstance(value, Mapping):
+        if type(value) is FrozenMap and (previous is None or value is previous):
+            return value
+        prior = previous if isinstance(previous, FrozenMap) else None
+        items = {}
+        shared = prior is not None and len(prior) == len(value)
+        for key, item in value.items():
+            old = prior.get(key) if prior is not None else None
+            frozen = freeze(item, old)
+            shared = shared and key in prior and frozen is old
+            items[key] = frozen
+        return prior if shared else FrozenMap(items)
+    if isinstance(value, (list, tuple)):
+        prior_items = previous if isinstance(previous, tuple) and len(previous) == len(value) else None
+        items = tuple(
+            freeze(item, prior_items[i] if prior_items is not None else None)
+            for i, item in enumerate(value)
+        )
+        return previous if prior_items is not None and items == prior_items else items
+    if isinstance(value, (set, frozenset)):
+        items = frozenset(freeze(item) for item in value)
+        return previous if previous == items else items
+    if previous is not None and type(previous) is type(value) and previous == value:
+        return previous
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen tree (FrozenMap -> dict, tuple -> list)."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
@@ -0,0 +1,164 @@
+"""Process-wide stylesheet cache with per-rerun de-duplication.
+
+Every rerun used to re-read ``static/style.css`` and every page re-emitted its
+theme ``<style>`` block, so a render carried the same CSS several times over
+the websocket. Stylesheets are now minified once per process (files are
+re-read only when their mtime changes, inline CSS is memoized by content)
+and emitted at most once per rerun, keyed by content hash.
+
+Streamlit drops any element a rerun does not emit again, so "once" means
+once per rerun, not once per session: app.py calls ``begin_rerun()`` before
+anything renders, emits the global bundle, and later ``inject_css`` calls
+for CSS already on the page become no-ops.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import streamlit as st
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Always on the page: app.py bundles these with the base theme CSS.
+GLOBAL_SOURCES: Tuple[Path, ...] = (PROJECT_ROOT / "static" / "style.css",)
+
+_EMITTED_KEY = "_sn_styles_emitted"
+STATS_KEY = "_sn_styles_stats"
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_STYLE_TAGS = re.compile(r"</?style[^>]*>", re.I)
+_WHITESPACE = re.compile(r"\s+")
+_AROUND_PUNCT = re.compile(r"\s*([{};,])\s*")
+_AFTER_COLON = re.compile(r":\s+")
+
+
+def minify_css(css: str) -> str:
+    """Conservative minifier: comments, <style> tags and redundant whitespace.
+
+    Spaces before ``:`` are kept (``a :hover`` differs from ``a:hover``), as
+    are spaces around operators inside ``calc()``.
+    """
+    css = _STYLE_TAGS.sub("", _COMMENTS.sub("", css))
+    css = _WHITESPACE.sub(" ", css)
+    css = _AROUND_PUNCT.sub(r"\1", css)
+    css = _AFTER_COLON.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+@dataclass(frozen=True)
+class Stylesheet:
+    css: str            # minified, without <style> tags
+    digest: str
+    raw_bytes: int      # size of the unminified source
+    parts: Tuple[str, ...] = ()  # digests of bundled members
+
+    @property
+    def bytes(self) -> int:
+        return len(self.css.encode("utf-8"))
+
+    def html(self) -> str:
+        return f"<style>{self.css}</style>"
+
+
+def _sheet(raw: str, parts: Tuple[str, ...] = ()) -> Stylesheet:
+    css = minify_css(raw)
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:16]
+    return Stylesheet(css, digest, len(raw.encode("utf-8")), parts)
+
+
+@lru_cache(maxsize=256)
+def inline_stylesheet(css: str) -> Stylesheet:
+    """Minified stylesheet for an inline CSS string (memoized by content)."""
+    return _sheet(css)
+
+
+_FILE_SHEETS: Dict[Path, Tuple[int, Stylesheet]] = {}
+_LOCK = threading.Lock()
+
+
+def file_stylesheet(path: Path) -> Optional[Stylesheet]:
+    """Minified stylesheet for a file, re-read only when its mtime changes."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    with _LOCK:
+        cached = _FILE_SHEETS.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        raw = path.read_bytes().decode(errors="ignore")
+    except OSError:
+        return None
+    sheet = _sheet(raw)
+    with _LOCK:
+        _FILE_SHEETS[path] = (mtime_ns, sheet)
+    return sheet
+
+
+@lru_cache(maxsize=16)
+def _bundle(members: Tuple[Stylesheet, ...]) -> Stylesheet:
+    css = "".join(member.css for member in members)
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:16]
+    return Stylesheet(css, digest, sum(m.raw_bytes for m in members), tuple(m.digest for m in members))
+
+
+def global_bundle(extra_css: Iterable[str] = ()) -> Stylesheet:
+    """GLOBAL_SOURCES plus inline CSS as one minified stylesheet."""
+    members = [sheet for sheet in map(file_stylesheet, GLOBAL_SOURCES) if sheet is not None]
+    members.extend(inline_stylesheet(css) for css in extra_css)
+    return _bundle(tuple(members))
+
+
+# ---------------------------------------------------------------------------
+# Injection
+# ---------------------------------------------------------------------------
+def begin_rerun() -> None:
+    """Start a new render: nothing has been emitted yet."""
+    st.session_state[_EMITTED_KEY] = set()
+    st.session_state[STATS_KEY] = {"requested_bytes": 0, "emitted_bytes": 0, "blocks": 0, "skipped": 0}
+
+
+def inject_stylesheet(sheet: Stylesheet) -> None:
+    """Emit ``sheet`` unless it (or a bundle containing it) is already on the page."""
+    emitted = st.session_state.get(_EMITTED_KEY)
+    stats = st.session_state.get(STATS_KEY)
+    if stats is not None:
+        stats["requested_bytes"] += sheet.raw_bytes
+    if emitted is not None and sheet.digest in emitted:
+        if stats is not None:
+            stats["skipped"] += 1
+        return
+    st.markdown(sheet.html(), unsafe_allow_html=True)
+    if emitted is not None:
+        emitted.add(sheet.digest)
+        emitted.update(sheet.parts)
+    if stats is not None:
+        stats["emitted_bytes"] += sheet.bytes
+        stats["blocks"] += 1
+
+
+def inject_css(css: str) -> None:
+    inject_stylesheet(inline_stylesheet(css))
+
+
+def inject_css_file(path: Path) -> None:
+    sheet = file_stylesheet(path)
+    if sheet is not None:
+        inject_stylesheet(sheet)
+
+
+def rerun_stats() -> Dict[str, int]:
+    """Bytes requested vs. emitted so far in this rerun."""
+    stats = dict(st.session_state.get(STATS_KEY) or {})
+    if stats:
+        stats["saved_bytes"] = stats["requested_bytes"] - stats["emitted_bytes"]
+    return stats
@@ -0,0 +1,92 @@
+"""Audiencing decision table matches the per-call sanitizer and router it replaced."""
+from __future__ import annotations
+
+from pathlib import Path
+import itertools
+import sys
+
+import pytest
+import streamlit as st
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import audiencing
+
+
+def _reference(qualifiers: dict, entry, urgent_feature_enabled: bool):
+    """The sanitizer and router before the table (kept here as the oracle)."""
+    sanitized = {
+        "household_size": 2 if qualifiers["has_partner"] else 1,
+        "partner_included": bool(qualifiers["has_partner"]),
+        "va_applicable": bool(qualifiers["is_veteran"]),
+        "homeowner": bool(qualifiers["owns_home"]),
+        "home_related_support_enabled": bool(qualifiers["owns_home"]),
+        "medicaid_context": bool(qualifiers["on_medicaid"]),
+        "show_medicaid_banner": bool(qualifiers["on_medicaid"]),
+        "urgent_case": bool(qualifiers.get("urgent", False)),
+    }
+    if not sanitized["va_applicable"]:
+        sanitized["va_offsets"] = 0
+    if urgent_feature_enabled and qualifiers.get("urgent", False):
+        route = {"next": "pfma", "meta": {"reasons": ["urgent_case"], "urgent_feature_enabled": urgent_feature_enabled}}
+    else:
+        route = {
+            "next": "contextual_welcome",
+            "meta": {"reasons": [f"entry_{entry or 'unknown'}"], "urgent_feature_enabled": urgent_feature_enabled},
+        }
+    return sanitized, route
+
+
+@pytest.mark.parametrize("urgent_feature_enabled", [False, True])
+def test_table_matches_reference_for_every_combination(urgent_feature_enabled: bool) -> None:
+    keys = audiencing.AUDIENCING_QUALIFIER_KEYS
+    for bits, entry in itertools.product(itertools.product([False, True], repeat=len(keys)), ["self", "proxy", None]):
+        st.session_state.clear()
+        state = audiencing.ensure_audiencing_state()
+        state["entry"] = entry
+        state["qualifiers"].update(zip(keys, bits))
+
+        audiencing.apply_audiencing_sanitizer(state)
+        route = audiencing.compute_audiencing_route(state, urgent_feature_enabled=urgent_feature_enabled)
+
+        sanitized, expected_route = _reference(state["qualifiers"], entry, urgent_feature_enabled)
+        assert state["sanitized"] == sanitized
+        assert route["next"] == expected_route["next"]
+        assert route["meta"] == expected_route["meta"]
+        assert route["meta"]["urgent_feature_enabled"] == urgent_feature_enabled
+
+
+def test_validation_repairs_replaced_or_reshaped_qualifiers() -> None:
+    st.session_state.clear()
+    state = audiencing.ensure_audiencing_state()
+    state["qualifiers"]["stray"] = True
+    audiencing.ensure_audiencing_state()
+    assert "stray" not in state["qualifiers"]
+
+    state["qualifiers"] = {"urgent": True}
+    audiencing.ensure_audiencing_state()
+    assert set(state["qualifiers"]) == set(audiencing.AUDIENCING_QUALIFIER_KEYS)
+    assert state["qualifiers"]["urgent"] is True
+
+    same = audiencing.ensure_audiencing_state()
+    assert same is state and "_validated" not in state
+
+
+def test_sanitized_and_route_meta_stay_mutable_dicts() -> None:
+    st.session_state.clear()
+    state = audiencing.ensure_audiencing_state()
+    state["sanitized"]["custom_note"] = "keep me"
+    state["qualifiers"]["is_veteran"] = False
+    audiencing.apply_audiencing_sanitizer(state)
+    assert state["sanitized"]["va_offsets"] == 0
+
+    state["qualifiers"]["is_veteran"] = True
+    audiencing.apply_audiencing_sanitizer(state)
+    route = audiencing.compute_audiencing_route(state)
+    state["sanitized"]["household_size"] = 3
+    route["meta"]["reasons"].append("manual")
+
+    assert type(state["sanitized"]) is dict and state["sanitized"]["custom_note"] == "keep me"
+    assert "va_offsets" not in state["sanitized"]
+    assert type(route["meta"]) is dict
+    assert audiencing.compute_audiencing_route(state)["meta"]["reasons"] == ["entry_unknown"]
@@ -0,0 +1,74 @@
+"""Cohort pipeline rows agree with the single-record audiencing, GCP and derive paths."""
+from __future__ import annotations
+
+from pathlib import Path
+import csv
+import json
+import subprocess
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.core.audiencing import AUDIENCING_QUALIFIER_KEYS, DECISION_TABLE
+from senior_nav.core.cp_derive import compute_derived
+from guided_care_plan import evaluate_guided_care
+from senior_nav.cohort import run_cohort, score_chunk
+
+ROWS = [
+    {"id": "a", "entry": "self", "on_medicaid": "yes", "has_partner": "1", "adl_help": "many",
+     "chronic": "diabetes|copd", "income_total": "1,800", "assets_total_effective": "90000"},
+    {"id": "b", "entry": "proxy", "urgent": "true", "is_veteran": "no", "monthly_cost": "6100",
+     "benefits_total": "500", "liquidity_total": "12000"},
+    {"id": "c", "income_total": "9000"},
+]
+
+
+def test_score_chunk_matches_single_record_paths() -> None:
+    scored = score_chunk(ROWS, {"assisted": 5200.0})
+    assert [row["id"] for row in scored] == ["a", "b", "c"]
+
+    first = scored[0]
+    gcp = evaluate_guided_care({"adl_help": "many", "chronic": ["diabetes", "copd"]},
+                               {"qualifiers": {"on_medicaid": True}})
+    assert first["recommended_setting"] == gcp["recommended_setting"]
+    assert first["safety_flags"] == list(gcp["safety_flags"])
+    assert first["payment_context"] == gcp["payment_context"]
+    assert first["household_size"] == 2 and first["medicaid_context"] is True
+
+    second = scored[1]
+    assert second["next_route"] == DECISION_TABLE[1 << AUDIENCING_QUALIFIER_KEYS.index("urgent") | 32].next_route
+    assert second["next_route"] == "pfma" and second["urgent_case"] is True
+    expected = compute_derived({"monthly_cost": 6100, "other_monthly_total": 0, "mods_monthly_total": 0,
+                                "caregiver_cost": 0, "income_total": 0, "benefits_total": 500, "rm_monthly": 0,
+                                "rent_income_monthly": 0, "assets_total_effective": 0, "liquidity_total": 12000,
+                                "sale_price_one_time": 0})
+    assert {key: second[key] for key in expected} == expected
+
+    # No quoted cost: the recommended setting's cost, and a covered gap has no runway.
+    third = scored[2]
+    assert third["monthly_all_in"] == {"assisted": 5200.0}.get(third["recommended_setting"], 4200.0)
+    assert third["gap"] < 0 and third["runway_months"] is None
+
+
+def test_run_cohort_streams_csv_to_jsonl_in_order(tmp_path: Path) -> None:
+    source = tmp_path / "referrals.csv"
+    fields = sorted({key for row in ROWS for key in row})
+    with source.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(ROWS * 5)
+
+    dest = tmp_path / "scored.jsonl"
+    stats = run_cohort(source, dest, workers=0, chunk_size=4)
+
+    lines = [json.loads(line) for line in dest.read_text().splitlines()]
+    assert stats.rows == len(lines) == 15 and stats.chunks == 4
+    assert [row["id"] for row in lines] == ["a", "b", "c"] * 5
+    assert lines[0] == lines[3] == score_chunk(ROWS[:1])[0]
+
+
+def test_cohort_import_does_not_load_streamlit() -> None:
+    root = str(Path(__file__).resolve().parents[1])
+    code = f"import sys; sys.path.insert(0, {root!r}); import senior_nav.cohort; print('streamlit' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root)
+    assert out.stdout.strip() == "False"
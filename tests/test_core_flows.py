@@ -0,0 +1,37 @@
+"""Flow graph lookups: progress, resume, links and the flows that use them."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.core import gcp
+from senior_nav.core.flows import FLOWS, Flow
+from senior_nav.cost_planner import wizard
+
+
+def test_weighted_prefix_progress_links_and_resume() -> None:
+    flow = Flow("demo", [("intro", "Intro", 1), ("details", "Details", 3), ("done", "Done")])
+
+    assert [flow.completed(n) for n in range(-1, 5)] == [0.0, 0.0, 0.2, 0.8, 1.0, 1.0]
+    assert flow.progress("details") == 0.2 and flow.progress(2) == 0.8
+    assert flow.progress("unknown") == 1.0
+    assert flow.next("intro").key == "details" and flow.next("done") is None
+    assert flow.previous("details").key == "intro" and flow.previous("intro") is None
+    assert flow.resume(None).key == "intro"
+    assert flow.resume("details").key == "done" and flow.resume("done").key == "done"
+    assert "details" in flow and "nope" not in flow and flow.index("nope") is None
+    assert flow.clamp(99) == 2 and flow.clamp(-1) == 0
+    with pytest.raises(ValueError):
+        Flow("dupes", [("a", "A"), ("a", "A")])
+
+
+def test_app_flows_match_their_steppers() -> None:
+    cost_planner = FLOWS["cost_planner"]
+    assert [(s.key, s.label) for s in wizard.STEPS] == list(zip(cost_planner.keys, cost_planner.titles))
+    assert gcp.STEP_TITLES == list(FLOWS["gcp"].titles)
+    assert gcp.stepper_position(2) == (2, 0.4) and gcp.stepper_position(9) == (5, 1.0)
+    assert wizard.get_step_index(wizard.STEPS[4]) == 4
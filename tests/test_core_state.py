@@ -0,0 +1,57 @@
+"""The Streamlit-free cores work on plain dicts and never import Streamlit."""
+from __future__ import annotations
+
+from pathlib import Path
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+
+from senior_nav.core import audiencing, cost_planner, gcp
+
+
+def test_cores_and_evaluators_do_not_import_streamlit() -> None:
+    code = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "import senior_nav.core.audiencing, senior_nav.core.gcp, senior_nav.core.cost_planner\n"
+        "import guided_care_plan.batch, guided_care_plan.cache\n"
+        "print('streamlit' in sys.modules)" % str(ROOT)
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_cores_take_explicit_session_dicts() -> None:
+    session: dict = {}
+    state = audiencing.ensure_audiencing_state(session)
+    state["qualifiers"].update(urgent=True, on_medicaid=True)
+    audiencing.apply_audiencing_sanitizer(state)
+    assert audiencing.compute_audiencing_route(state)["next"] == "pfma"
+    session["audiencing_snapshot"] = audiencing.snapshot_audiencing(state)
+    assert gcp.current_audiencing_snapshot(session)["flags"]["urgent"] is True
+
+    answers, result = gcp.ensure_gcp_session(session)
+    assert answers == {} and result["recommended_setting"] is None
+    assert gcp.stepper_position(9) == (len(gcp.STEP_TITLES), 1.0)
+
+    cp = cost_planner.ensure_core_state(session)
+    assert "Medicaid short-circuit" in cp["decision_log"]
+    field_id = cost_planner.subtotal_fields()["housing"][0]
+    cost_planner.recompute_costs(session)
+    cost_planner.set_numeric(session, field_id, 1200)
+    assert cp["subtotals"]["housing"] == 1200.0 and cp["monthly_total"] == 1200.0
+    assert cp["snapshot_for_crm"]["audiencing"] is session["audiencing_snapshot"]
+    assert cost_planner.audiencing_badges(session) == (None, ["Medicaid", "Urgent"])
+
+
+def test_gcp_state_keeps_its_historical_api() -> None:
+    from guided_care_plan import session, state
+
+    for name in ("ensure_gcp_session", "render_stepper", "current_audiencing_snapshot"):
+        assert getattr(state, name) is getattr(session, name)
+
+    meta = state.get_question_meta("chronic")
+    assert type(meta) is dict and type(meta["options"]) is list and type(meta["options"][0]) is dict
+    meta["options"].append({"value": "scratch"})
+    assert {"value": "scratch"} not in state.get_question_meta("chronic")["options"]
@@ -0,0 +1,76 @@
+"""Incremental cost recompute agrees with a full pass over the field map."""
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import sys
+
+import streamlit as st
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import cost_planner_shared as shared
+
+
+def _fresh_session(mode: str = "planning") -> dict:
+    st.session_state.clear()
+    shared.ensure_core_state()
+    cp = st.session_state["cost_planner"]
+    cp["mode"] = mode
+    shared.recompute_costs()
+    return cp
+
+
+def test_every_mapped_field_feeds_one_subtotal() -> None:
+    fields = shared.subtotal_fields()
+    assert set(fields) == set(shared.SUBTOTAL_KEYS)
+    assert sorted(fid for fids in fields.values() for fid in fids) == sorted(shared.field_subtotals())
+    assert shared.field_subtotals()["offset_va_benefits"] == "offsets"
+
+
+def test_set_numeric_matches_full_recompute() -> None:
+    cp = _fresh_session()
+    rng = random.Random(3)
+    field_ids = list(shared.load_field_map())
+    for _ in range(500):
+        shared.set_numeric(rng.choice(field_ids), rng.choice([0.0, 125.0, 980.5, 4200.0]))
+    shared.set_numeric("assets_total", 250000.0)
+    incremental = dict(cp["subtotals"]), cp["monthly_total"], cp["net_out_of_pocket"], cp["runway_months"]
+
+    shared.recompute_costs(full=True)
+    assert incremental == (dict(cp["subtotals"]), cp["monthly_total"], cp["net_out_of_pocket"], cp["runway_months"])
+    assert cp["snapshot_for_crm"]["monthly_total"] == cp["monthly_total"]
+    assert cp["snapshot_for_crm"]["inputs"]["assets_total"] == 250000.0
+
+
+def test_mode_change_refreshes_runway() -> None:
+    cp = _fresh_session(mode="tinkering")
+    shared.set_numeric("housing_base_rent", 3000.0)
+    shared.set_numeric("assets_total", 60000.0)
+    assert cp["runway_months"] is None
+
+    cp["mode"] = "planning"
+    shared.recompute_costs()
+    assert cp["runway_months"] == 20.0
+    assert cp["snapshot_for_crm"]["runway_months"] == 20.0
+
+
+def test_field_index_joins_map_and_spec_categories() -> None:
+    index = shared.load_field_index()
+
+    assert index.fields_by_key["care_base"] == ("care_base_rate",)
+    assert index.category_by_field["offset_va_benefits"] == "offsets"
+    # Spec categories line up with the subtotals the graph feeds.
+    for name, fids in shared.subtotal_fields().items():
+        assert set(fids) == set(index.fields_by_category[name])
+
+
+def test_summarize_categories_uses_requested_keys() -> None:
+    _fresh_session()
+    shared.set_numeric("insurance_health", 300.0)
+    shared.set_numeric("insurance_ltc", 150.0)
+    shared.set_numeric("debt_loans", 90.0)
+
+    assert shared.summarize_categories(["ins_health", "ins_ltc", "unknown"]) == 450.0
+    assert shared.summarize_categories(["debt_loans"], shared.load_field_map()) == 90.0
+    assert shared.summarize_categories(["loans"], {"debt_loans": "loans"}) == 90.0
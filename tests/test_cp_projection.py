@@ -0,0 +1,44 @@
+"""Cash-flow projection agrees with derive() and applies escalation/events."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from cost_planner_v2.cp_state import compute_derived
+from cost_planner_v2.projection import project
+
+VALUES = {
+    "monthly_cost": 5000.0,
+    "caregiver_cost": 0.0,
+    "other_monthly_total": 500.0,
+    "mods_monthly_total": 0.0,
+    "income_total": 2500.0,
+    "benefits_total": 0.0,
+    "rm_monthly": 0.0,
+    "rent_income_monthly": 0.0,
+    "assets_total_effective": 60000.0,
+    "liquidity_total": 0.0,
+    "sale_price_one_time": 0.0,
+}
+NO_ESCALATION = {"care": 0.0, "expenses": 0.0, "income": 0.0, "benefits": 0.0}
+
+
+def test_flat_projection_matches_derived_runway() -> None:
+    projection = project(VALUES, escalation=NO_ESCALATION)
+    runway = compute_derived(VALUES)["runway_months"]  # 60000 / 3000 = 20
+
+    assert projection.months == 360
+    assert projection.net_draw[0] == 3000.0
+    assert projection.depletion_month == int(runway) + 1
+
+
+def test_escalation_and_home_sale_shift_depletion() -> None:
+    flat = project(VALUES, escalation=NO_ESCALATION)
+    inflated = project(VALUES)
+    with_sale = project(dict(VALUES, sale_price_one_time=100000.0), escalation=NO_ESCALATION, sale_month=12)
+
+    assert inflated.monthly_costs[-1] > inflated.monthly_costs[0]
+    assert inflated.depletion_month <= flat.depletion_month
+    assert with_sale.depletion_month == 54  # 160k / 3k per month, sale lands before month 20
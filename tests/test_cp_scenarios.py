@@ -0,0 +1,63 @@
+"""Scenario comparison shares unchanged branches and matches derive() math."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from cost_planner_v2.cp_state import DERIVE_INPUTS, compute_derived
+from cost_planner_v2.scenarios import ScenarioSet, fork, namespace_inputs, setting_scenarios
+
+BASE = {
+    "qualifiers": {"care_setting": "Assisted Living"},
+    "setting_cost": {"monthly_cost": 5200},
+    "income": {"income_total": "$2,400"},
+    "expenses": {"other_monthly_total": 650},
+    "caregiver": {"caregiver_cost": 0},
+    "benefits": {"benefits_total": 800},
+    "home": {"reverse_mortgage_monthly": 0, "home_monthly_total": 0, "sale_price": 180000},
+    "liquidity": {"liquidity_total": 20000},
+    "home_mods": {"mods_monthly_total": 0},
+    "assets": {"assets_total_effective": 95000},
+}
+
+
+def test_fork_copies_only_overridden_branches() -> None:
+    ns = fork(BASE, {"setting_cost.monthly_cost": 7400, "qualifiers.care_setting": "Memory Care"})
+
+    assert ns["setting_cost"]["monthly_cost"] == 7400
+    assert BASE["setting_cost"]["monthly_cost"] == 5200
+    assert BASE["qualifiers"]["care_setting"] == "Assisted Living"
+    assert ns["income"] is BASE["income"]
+    assert ns["home"] is BASE["home"]
+
+
+def test_compare_matches_compute_derived() -> None:
+    scenarios = setting_scenarios({"home": 3100, "assisted": 5200, "memory": 7400}, base=BASE)
+    scenarios.add("Sell home later", {"home": {"sale_price": 0}})
+    scenarios.add("Surplus", {"income.income_total": 12000})
+
+    rows = scenarios.compare()
+    assert [row["scenario"] for row in rows] == ["Home", "Assisted Living", "Memory Care", "Sell home later", "Surplus"]
+    for row in rows:
+        ns = scenarios.namespace(row["scenario"])
+        expected = compute_derived(dict(zip(DERIVE_INPUTS, namespace_inputs(ns).tolist())))
+        assert {k: row[k] for k in expected} == expected
+    assert rows[-1]["runway_months"] == float("inf")
+
+
+def test_empty_scenario_set() -> None:
+    assert ScenarioSet(BASE).compare() == []
+
+
+def test_fork_over_typed_modules() -> None:
+    from cost_planner_v2.cp_state import typed_module
+
+    typed = {module: typed_module(module, block) for module, block in BASE.items()}
+    rows = setting_scenarios({"memory": 7400}, base=typed).compare()
+    ns = fork(typed, {"setting_cost.monthly_cost": 7400})
+
+    assert typed["setting_cost"]["monthly_cost"] == 5200.0
+    assert ns["income"] is typed["income"]
+    assert rows[0]["monthly_all_in"] == 8050.0
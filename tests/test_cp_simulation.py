@@ -0,0 +1,41 @@
+"""Monte Carlo runway simulator is reproducible and reduces to the projection."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from cost_planner_v2.projection import project
+from cost_planner_v2.simulation import SimulationParams, simulate
+
+VALUES = {
+    "monthly_cost": 6200.0,
+    "caregiver_cost": 400.0,
+    "other_monthly_total": 850.0,
+    "income_total": 3100.0,
+    "benefits_total": 900.0,
+    "assets_total_effective": 240000.0,
+    "liquidity_total": 35000.0,
+    "sale_price_one_time": 310000.0,
+}
+
+
+def test_deterministic_params_match_projection() -> None:
+    params = SimulationParams(care_inflation_vol=0.0, return_mean=0.0, return_vol=0.0, escalation_annual_prob=0.0)
+    result = simulate(VALUES, paths=50, params=params, sale_month=18, seed=1)
+
+    assert set(result.runway_months.tolist()) == {float(project(VALUES, sale_month=18).depletion_month)}
+
+
+def test_seed_reproduces_paths() -> None:
+    first = simulate(VALUES, paths=2000, seed=7)
+    second = simulate(VALUES, paths=2000, seed=7)
+
+    assert np.array_equal(first.runway_months, second.runway_months)
+    bands = first.percentiles
+    assert bands[10] <= bands[50] <= bands[90]
+    assert 0.0 <= first.probability_lasts(10) <= 1.0
+    assert first.probability_lasts(1) >= first.probability_lasts(10)
@@ -0,0 +1,86 @@
+"""Typed cp modules generated from the contract behave like the old dicts."""
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import pickle
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from cost_planner_v2 import cp_state
+
+
+def test_every_contract_module_has_a_slots_class() -> None:
+    contract = json.loads(cp_state.CONTRACT_PATH.read_text(encoding="utf-8"))
+    for module, spec in contract["modules"].items():
+        cls = cp_state.MODULE_TYPES[module]
+        assert set(spec["fields"]) <= set(cls._FIELDS)
+        assert not hasattr(cls(), "__dict__")
+
+
+def test_module_is_dict_compatible_and_coerces_numbers() -> None:
+    home = cp_state.typed_module("home", {"sale_price": "$250,000", "notes": "condo"})
+
+    assert home["sale_price"] == 250000.0
+    assert home == {
+        "reverse_mortgage_monthly": 0.0, "home_monthly_total": 0.0, "sale_price": 250000.0, "notes": "condo",
+    }
+    home.setdefault("rent", 10)
+    home["reverse_mortgage_monthly"] = "1,200"
+    assert home.get("reverse_mortgage_monthly") == 1200.0 and home["rent"] == 10
+    del home["notes"]
+    assert "notes" not in home and "sale_price" in home
+    assert pickle.loads(pickle.dumps(home)) == home
+    json.dumps(cp_state.cp_to_dict({"home": home, "derived": {}}))
+
+
+def test_cp_get_set_and_derive_on_typed_namespace() -> None:
+    cp_state.st.session_state["cp"] = {"income": {"income_total": "2,000"}, "ui": {"progress": 2}}
+    cp = cp_state.cp_ensure()
+
+    assert isinstance(cp["income"], cp_state.ModuleState)
+    assert cp["ui"] == {"progress": 2}
+    cp_state.cp_set("setting_cost.monthly_cost", "$5,000")
+    cp_state.cp_set("assets.assets_total_effective", 30000)
+    assert cp_state.cp_get("income.income_total") == 2000.0
+    assert cp_state.derive() == {
+        "monthly_all_in": 5000.0, "monthly_offsets": 2000.0, "gap": 3000.0, "runway_months": 10.0,
+    }
+
+
+def test_numeric_fields_keep_not_entered_apart_from_zero() -> None:
+    income = cp_state.typed_module("income", {"income_total": None})
+
+    assert income["income_total"] is None
+    income["income_total"] = "  "
+    assert income["income_total"] is None
+    income["income_total"] = "0"
+    assert income["income_total"] == 0.0
+    assert cp_state.typed_module("income", {"income_total": ""})["income_total"] is None
+
+
+def test_cp_ensure_shapes_each_namespace_once() -> None:
+    cp_state.st.session_state["cp"] = {"income": {"income_total": 10}}
+    cp = cp_state.cp_ensure()
+    cp["income"] = {"income_total": 20}  # a page replacing a block wholesale
+
+    assert cp_state.cp_ensure() is cp
+    assert type(cp["income"]) is dict  # not rescanned on every access
+
+    cp_state.st.session_state["cp"] = restored = {"income": {"income_total": 30}}
+    assert cp_state.cp_ensure() is restored
+    assert isinstance(restored["income"], cp_state.ModuleState)
+
+
+def test_cp_ensure_marks_each_namespace_and_skips_foreign_blocks() -> None:
+    wizard_qualifiers = {"contribution_style": "unified", "contributors": [], "owns_home": None, "is_veteran": None}
+    first = {"qualifiers": wizard_qualifiers}
+    second: dict = {}
+    for cp in (first, second, first, second):  # two interleaved sessions
+        cp_state.st.session_state["cp"] = cp
+        assert cp_state.cp_ensure() is cp and cp[cp_state.SHAPED_KEY] is True
+
+    assert first["qualifiers"] is wizard_qualifiers  # the wizard's block, not the contract's
+    assert isinstance(second["qualifiers"], cp_state.ModuleState)
+    assert cp_state.SHAPED_KEY not in cp_state.cp_to_dict(first)
@@ -0,0 +1,96 @@
+"""Cost planner step cache invalidates on edits, stays bounded and preloads ahead."""
+from __future__ import annotations
+
+from pathlib import Path
+import os
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.core.flows import Flow
+from senior_nav.cost_planner import wizard
+
+
+def _page(path: Path, value: int, bump_ns: int = 0) -> None:
+    path.write_text(f"import json\nVALUE = {value}\nRENDERED = []\ndef render():\n    RENDERED.append(VALUE)\n")
+    if bump_ns:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump_ns))
+
+
+def _steps(tmp_path: Path, count: int) -> list:
+    steps = []
+    for i in range(count):
+        path = tmp_path / f"step_{i}.py"
+        _page(path, i)
+        steps.append(wizard.Step(f"s{i}", f"Step {i}", str(path)))
+    return steps
+
+
+def test_cache_reloads_edited_files_and_evicts_oldest(tmp_path: Path) -> None:
+    cache = wizard.StepModuleCache(maxsize=2)
+    first, second, third = _steps(tmp_path, 3)
+
+    module, fresh = cache.module(first)
+    assert module.VALUE == 0 and fresh
+    assert cache.module(first) == (module, False)
+
+    _page(Path(first.path), 10, bump_ns=1_000_000)
+    reloaded, fresh = cache.module(first)
+    assert reloaded is not module and reloaded.VALUE == 10 and fresh
+
+    cache.module(second)
+    cache.module(third)
+    assert len(cache) == 2 and cache.evictions == 1
+    assert not cache.is_compiled(wizard.step_path(first))
+
+
+def test_preloader_warms_next_steps_and_metrics_record_first_render(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    steps = _steps(tmp_path, 4)
+    cache = wizard.StepModuleCache()
+    preloader = wizard.StepPreloader(cache, ahead=2)
+    monkeypatch.setattr(wizard, "STEPS", steps)
+    monkeypatch.setattr(wizard, "FLOW", Flow("test", [(step.key, step.label) for step in steps]))
+    monkeypatch.setattr(wizard, "STEP_CACHE", cache)
+    monkeypatch.setattr(wizard, "PRELOADER", preloader)
+    monkeypatch.setattr(wizard, "_TIMINGS", {})
+
+    wizard.run_step(steps[0])
+    preloader.wait()
+    assert [cache.is_compiled(wizard.step_path(step)) for step in steps] == [True, True, True, False]
+    assert cache.loads == 1  # preloading compiles only; page bodies run on visit
+
+    wizard.run_step(steps[1])
+    wizard.run_step(steps[1])
+    preloader.wait()
+    metrics = wizard.first_render_metrics()
+    assert [(m["step"], m["preloaded"], m["renders"]) for m in metrics] == [("s0", False, 1), ("s1", True, 2)]
+    assert all(m["first_render_ms"] > 0 for m in metrics)
+
+
+def test_preloader_imports_only_declared_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "sn_page_dep.py").write_text("IMPORTED = True\n")
+    (tmp_path / "sn_declared_dep.py").write_text("IMPORTED = True\n")
+    page = tmp_path / "page.py"
+    page.write_text("import sn_page_dep\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("sn_page_dep", "sn_declared_dep"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    _page(tmp_path / "step_a.py", 0)
+    steps = [
+        wizard.Step("a", "A", str(tmp_path / "step_a.py")),
+        wizard.Step("b", "B", str(page), preload=("sn_declared_dep",)),
+    ]
+    cache = wizard.StepModuleCache()
+    preloader = wizard.StepPreloader(cache, ahead=1)
+    monkeypatch.setattr(wizard, "STEPS", steps)
+
+    preloader.schedule(0)
+    preloader.wait()
+    assert cache.is_compiled(page) and preloader.preloaded == 1
+    assert "sn_declared_dep" in sys.modules
+    assert "sn_page_dep" not in sys.modules  # the page's own imports wait for the visit
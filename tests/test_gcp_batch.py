@@ -0,0 +1,97 @@
+"""Batch evaluation must agree with the single-record Guided Care Plan engine."""
+from __future__ import annotations
+
+from pathlib import Path
+import random
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from guided_care_plan import QUESTION_ORDER, evaluate_guided_care, evaluate_guided_care_batch, get_question_meta
+from guided_care_plan.batch import SCORED_QUESTIONS, encode_batch
+
+
+def _option_values(question_id: str) -> list[str]:
+    return [opt["value"] for opt in get_question_meta(question_id)["options"]]
+
+
+def _random_records(count: int, seed: int = 7) -> list[dict[str, object]]:
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        record: dict[str, object] = {}
+        for question_id in QUESTION_ORDER:
+            values = _option_values(question_id)
+            if get_question_meta(question_id).get("multi"):
+                selection = [value for value in values if rng.random() < 0.3]
+                if rng.random() < 0.2:
+                    rng.shuffle(selection)
+                record[question_id] = selection
+            else:
+                record[question_id] = rng.choice(values + [None])
+        records.append(record)
+    return records
+
+
+def test_batch_matches_single_record_engine() -> None:
+    records = _random_records(2000)
+    records.append({"chronic": ["diabetes", "gout"], "behavior_risks": ["pacing"]})
+    columns = {question_id: [record.get(question_id) for record in records] for question_id in QUESTION_ORDER}
+    audiencing = {"qualifiers": {"on_medicaid": False}}
+
+    batch = evaluate_guided_care_batch(columns, audiencing)
+
+    for row, record in enumerate(records):
+        expected = evaluate_guided_care(record, audiencing)
+        for field, value in expected.items():
+            assert batch[field][row] == value, f"{field} differs for record {row}"
+
+
+def test_batch_accepts_per_record_medicaid() -> None:
+    records = _random_records(50, seed=11)
+    columns = {question_id: [record.get(question_id) for record in records] for question_id in QUESTION_ORDER}
+    medicaid = [row % 2 == 0 for row in range(len(records))]
+
+    batch = evaluate_guided_care_batch(columns, on_medicaid=medicaid)
+
+    for row, record in enumerate(records):
+        expected = evaluate_guided_care(record, {"qualifiers": {"on_medicaid": medicaid[row]}})
+        assert batch["payment_context"][row] == expected["payment_context"]
+        assert batch["funding_confidence"][row] == expected["funding_confidence"]
+
+
+def test_batch_keeps_engine_chronic_order_and_blanks() -> None:
+    records = [
+        {"chronic": ["stroke", "diabetes"]},
+        {"chronic": ["", "copd"], "falls": "recurrent"},
+        {"chronic": ["none", "diabetes"]},
+        {"chronic": ["copd", "copd"]},
+        {"chronic": [None, "chf"], "behavior_risks": "wandering"},
+        {"chronic": "diabetes"},
+        {"chronic": ["stroke", "diabetes"], "adl_help": "most"},
+    ]
+    columns = {question_id: [record.get(question_id) for record in records] for question_id in QUESTION_ORDER}
+
+    batch = evaluate_guided_care_batch(columns)
+
+    for row, record in enumerate(records):
+        expected = evaluate_guided_care(record)
+        for field, value in expected.items():
+            assert batch[field][row] == value, f"{field} differs for record {row}"
+
+
+def test_encoded_columns_report_chronic_in_label_order() -> None:
+    # Bitmask codes carry no order or blanks, so re-scoring stored codes lists
+    # conditions in labels.json order; every other field still matches.
+    record = {"chronic": ["stroke", "", "diabetes"], "falls": "one"}
+    columns = {question_id: [record.get(question_id)] for question_id in QUESTION_ORDER}
+    encoded = encode_batch(columns)
+
+    batch = evaluate_guided_care_batch({question_id: encoded[question_id] for question_id in SCORED_QUESTIONS})
+    expected = evaluate_guided_care(record)
+
+    assert expected["chronic_conditions"] == ["stroke", "", "diabetes"]
+    assert batch["chronic_conditions"][0] == ["diabetes", "stroke"]
+    assert batch["DecisionTrace"][0][-1] == "Chronic conditions to plan around: Diabetes, Stroke."
+    for field in ("recommended_setting", "care_intensity", "safety_flags", "funding_confidence"):
+        assert batch[field][0] == expected[field]
@@ -0,0 +1,49 @@
+"""Behavior of the process-wide Guided Care Plan evaluation cache."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from guided_care_plan import evaluate_guided_care
+from guided_care_plan.cache import EvaluationCache
+
+ANSWERS = {
+    "caregiver_support": "few_days_week",
+    "adl_help": "4-5",
+    "cognition": "moderate",
+    "behavior_risks": ["agitation", "wandering"],
+    "falls": "one",
+    "med_mgmt": "several",
+    "supervision": "rarely",
+    "chronic": ["diabetes"],
+}
+
+
+def test_cache_hits_on_equivalent_answers() -> None:
+    cache = EvaluationCache(maxsize=8)
+    audiencing = {"entry": "self", "qualifiers": {"on_medicaid": False}}
+
+    first = cache.evaluate(ANSWERS, audiencing)
+    reordered = dict(ANSWERS, behavior_risks=["wandering", "agitation"])
+    second = cache.evaluate(reordered, {"entry": "proxy", "qualifiers": {"on_medicaid": False}})
+
+    assert first == evaluate_guided_care(ANSWERS, audiencing)
+    assert second["audiencing_snapshot"]["entry"] == "proxy"
+    assert second["safety_flags"] is not first["safety_flags"]
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    cache.evaluate(ANSWERS, {"qualifiers": {"on_medicaid": True}})
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_evicts_least_recently_used_and_clears() -> None:
+    cache = EvaluationCache(maxsize=2)
+    for adl in ("0-1", "2-3", "4-5"):
+        cache.evaluate(dict(ANSWERS, adl_help=adl))
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "size": 0, "maxsize": 2}
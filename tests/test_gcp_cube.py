@@ -0,0 +1,79 @@
+"""The outcome cube must match the current Guided Care Plan rules."""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+import random
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from guided_care_plan import cube as gcp_cube
+from guided_care_plan import evaluate_guided_care, get_question_meta, lookup_guided_care
+from guided_care_plan.rules import RULES
+
+
+@pytest.fixture(scope="module")
+def built_cube(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("cube") / "gcp_outcome_cube.bin"
+    gcp_cube.ensure_cube(path)
+    return path
+
+
+@pytest.fixture
+def runtime_cube(monkeypatch: pytest.MonkeyPatch, built_cube: Path) -> Path:
+    monkeypatch.setattr(gcp_cube, "CUBE_PATH", built_cube)
+    gcp_cube._runtime_cube.cache_clear()
+    yield built_cube
+    gcp_cube._runtime_cube.cache_clear()
+
+
+def test_built_cube_is_fresh(built_cube: Path) -> None:
+    assert gcp_cube.read_cube(built_cube).fresh
+    assert gcp_cube.ensure_cube(built_cube).fingerprint == gcp_cube.rules_fingerprint()
+
+
+def test_fingerprint_tracks_rule_tables_not_sources() -> None:
+    assert gcp_cube.rules_fingerprint() == gcp_cube.rules_fingerprint()
+    rescored = dict(RULES, falls=RULES["falls"].replace(scores=tuple(score + 1 for score in RULES["falls"].scores)))
+    assert gcp_cube.rules_fingerprint(rescored) != gcp_cube.rules_fingerprint()
+
+
+def test_cube_lookup_matches_engine(runtime_cube: Path) -> None:
+    assert gcp_cube._runtime_cube() is not None
+    rng = random.Random(3)
+    questions = ["caregiver_support", "adl_help", "cognition", "falls", "med_mgmt", "supervision"]
+    for _ in range(500):
+        answers: dict[str, object] = {}
+        for question_id in questions:
+            values = [opt["value"] for opt in get_question_meta(question_id)["options"]]
+            answers[question_id] = rng.choice(values + [None, "unexpected"])
+        behaviors = [opt["value"] for opt in get_question_meta("behavior_risks")["options"]] + ["pacing"]
+        answers["behavior_risks"] = rng.sample(behaviors, rng.randint(0, 3))
+        answers["chronic"] = rng.sample(["diabetes", "copd", "none"], rng.randint(0, 2))
+        audiencing = {"qualifiers": {"on_medicaid": rng.random() < 0.3}}
+
+        assert lookup_guided_care(answers, audiencing) == evaluate_guided_care(answers, audiencing), answers
+
+
+def test_stale_cube_warns_and_falls_back(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture, built_cube: Path, tmp_path: Path
+) -> None:
+    stale = tmp_path / "stale.bin"
+    data = bytearray(built_cube.read_bytes())
+    data[12:44] = bytes(32)  # zero the fingerprint in the header
+    stale.write_bytes(bytes(data))
+    monkeypatch.setattr(gcp_cube, "CUBE_PATH", stale)
+    gcp_cube._runtime_cube.cache_clear()
+    answers = {"adl_help": "4-5", "falls": "recurrent"}
+
+    with caplog.at_level(logging.WARNING, logger=gcp_cube.__name__):
+        assert lookup_guided_care(answers) == evaluate_guided_care(answers)
+    gcp_cube._runtime_cube.cache_clear()
+
+    assert "stale" in caplog.text
+    # verify fails on a stale fingerprint even when every cell still matches.
+    monkeypatch.setattr(gcp_cube, "verify_cube", lambda path: 0)
+    assert gcp_cube.main(["verify", "--path", str(stale)]) == 1
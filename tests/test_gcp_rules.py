@@ -0,0 +1,57 @@
+"""Compiled Guided Care Plan scoring rules must line up with labels.json."""
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from guided_care_plan import cube as gcp_cube
+from guided_care_plan import evaluate_guided_care, evaluate_guided_care_batch
+from guided_care_plan import rules as gcp_rules
+from guided_care_plan.cache import EvaluationCache
+from guided_care_plan.rules import DAILY_LIFE_RULES, HEALTH_SAFETY_RULES
+from senior_nav.core.gcp import LABELS_PATH, _parse_labels
+from senior_nav.runtime.content import CONTENT
+
+
+def test_scored_gcp_questions_declare_option_scores() -> None:
+    daily = {rule.question_id for rule in DAILY_LIFE_RULES}
+    safety = {rule.question_id for rule in HEALTH_SAFETY_RULES}
+    assert daily == {"caregiver_support", "adl_help", "med_mgmt"}
+    assert safety == {"cognition", "behavior_risks", "falls", "supervision"}
+    for rule in DAILY_LIFE_RULES + HEALTH_SAFETY_RULES:
+        assert len(rule.scores) == len(rule.options), f"{rule.question_id} scores misaligned"
+
+
+@pytest.fixture
+def labels_copy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "labels.json"
+    path.write_text(LABELS_PATH.read_text(encoding="utf-8"), encoding="utf-8")
+    monkeypatch.setattr(CONTENT, "check_interval", 0.0)
+    CONTENT.register("gcp.labels", [path], _parse_labels, lazy=True)
+    yield path
+    CONTENT.register("gcp.labels", [LABELS_PATH], _parse_labels, lazy=True)
+
+
+def test_labels_reload_rescores_every_evaluation_path(labels_copy: Path) -> None:
+    answers = {"falls": "weekly"}
+    cache = EvaluationCache(maxsize=8)
+    assert cache.evaluate(answers)["care_intensity"] == "low"
+    assert gcp_cube.cube_index(answers, None) == gcp_cube.cube_index({}, None)
+
+    document = json.loads(labels_copy.read_text(encoding="utf-8"))
+    document["questions"]["falls"]["options"].append({"value": "weekly", "label": "Weekly falls", "score": 6})
+    labels_copy.write_text(json.dumps(document), encoding="utf-8")
+    stat = labels_copy.stat()
+    os.utime(labels_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert "weekly" in gcp_rules.RULES["falls"].index
+    assert evaluate_guided_care(answers)["care_intensity"] == "med"
+    assert evaluate_guided_care_batch({"falls": ["weekly"]})["care_intensity"][0] == "med"
+    assert cache.evaluate(answers)["safety_flags"] == ["falls"]
+    assert gcp_cube.cube_index(answers, None) != gcp_cube.cube_index({}, None)
@@ -0,0 +1,86 @@
+"""Content registry hot-swaps edited files without blocking readers."""
+from __future__ import annotations
+
+from pathlib import Path
+from types import MappingProxyType
+import json
+import os
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.runtime.content import ContentRegistry, load_json
+
+
+def _write(path: Path, data: object, bump_ns: int = 0) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if bump_ns:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump_ns))
+
+
+def test_edits_are_swapped_in_and_frozen(tmp_path: Path) -> None:
+    path = tmp_path / "copy.json"
+    _write(path, {"navi": {"items": ["a", "b"]}})
+    registry = ContentRegistry(check_interval=0.0)
+    registry.register("copy", [path], load_json)
+
+    first = registry.get("copy")
+    assert isinstance(first, MappingProxyType)
+    assert first["navi"]["items"] == ("a", "b")
+    assert registry.get("copy") is first
+    assert registry.generation("copy") == 0
+
+    _write(path, {"navi": {"items": ["c"]}}, bump_ns=1_000_000)
+    assert registry.get("copy")["navi"]["items"] == ("c",)
+    assert registry.generation("copy") == 1
+
+
+def test_bad_edit_keeps_last_good_content(tmp_path: Path) -> None:
+    path = tmp_path / "labels.json"
+    _write(path, {"ok": True})
+    registry = ContentRegistry(check_interval=0.0)
+    registry.register("labels", [path], load_json)
+
+    path.write_text("{ half saved", encoding="utf-8")
+    assert registry.get("labels")["ok"] is True
+    assert "labels" in registry.errors()
+
+    _write(path, {"ok": False}, bump_ns=2_000_000)
+    assert registry.get("labels")["ok"] is False
+    assert registry.errors() == {}
+
+
+def test_readers_do_not_wait_for_a_reload_in_progress(tmp_path: Path) -> None:
+    path = tmp_path / "labels.json"
+    _write(path, {"v": 1})
+    registry = ContentRegistry(check_interval=0.0)
+    registry.register("labels", [path], load_json)
+
+    _write(path, {"v": 2}, bump_ns=1_000_000)
+    with registry._lock:  # another thread is mid-reload
+        assert registry.get("labels")["v"] == 1
+    assert registry.get("labels")["v"] == 2
+
+
+def test_checks_are_rate_limited(tmp_path: Path) -> None:
+    path = tmp_path / "labels.json"
+    _write(path, {"v": 1})
+    registry = ContentRegistry(check_interval=3600.0)
+    registry.register("labels", [path], load_json)
+
+    _write(path, {"v": 2}, bump_ns=1_000_000)
+    assert registry.get("labels")["v"] == 1
+    assert registry.refresh() == {"labels": 1}
+    assert registry.get("labels")["v"] == 2
+
+
+def test_lazy_registration_loads_on_first_get(tmp_path: Path) -> None:
+    path = tmp_path / "copy.json"
+    _write(path, {"a": 1})
+    calls = []
+    registry = ContentRegistry(check_interval=0.0)
+    registry.register("copy", [path], lambda p: calls.append(p) or load_json(p), lazy=True)
+
+    assert calls == []
+    assert registry.get("copy")["a"] == 1 and len(calls) == 1
@@ -0,0 +1,75 @@
+"""Event log keeps a bounded, delta-encoded history that rebuilds full snapshots."""
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.runtime.events import REMOVED, EventLog, JsonlSink, replay, session_event_log
+
+
+def _snapshot(n: int) -> dict:
+    snap = {
+        "entry": "self" if n % 3 else "proxy",
+        "qualifiers": {"is_veteran": n % 2 == 0, "urgent": False},
+        "route": {"next": "contextual_welcome", "meta": {"reasons": [f"step_{n}"]}},
+        "people": {"recipient_name": "Pat"},
+    }
+    if n % 5 == 0:
+        snap["sanitized"] = {"dropped": ["owns_home"]}
+    return snap
+
+
+def test_ring_is_bounded_and_rebuilds_retained_snapshots() -> None:
+    log = EventLog(capacity=8)
+    for n in range(30):
+        log.append("audiencing_set", _snapshot(n))
+        log.append("other", {"count": n})
+
+    assert len(log) == 8 and log.dropped == 52
+    rebuilt = [(entry.seq, state) for entry, state in log.snapshots("audiencing_set")]
+    assert [state for _, state in rebuilt] == [_snapshot(n) for n in range(26, 30)]
+    assert log.snapshot_at(rebuilt[-1][0]) == _snapshot(29)
+    assert log.latest("other") == {"count": 29}
+
+    # Deltas hold only changed leaves, not copies of the whole snapshot.
+    last = log.events()[-2]
+    assert last.name == "audiencing_set"
+    assert {path for path, _ in last.delta} == {("qualifiers", "is_veteran"), ("route", "meta", "reasons")}
+    assert (("sanitized",), REMOVED) in log.events()[0].delta
+
+
+def test_legacy_list_is_upgraded_in_place() -> None:
+    state = {"event_log": [{"event": "audiencing_set", "snapshot": _snapshot(1)}]}
+    log = session_event_log(state, "sid-1")
+    assert state["event_log"] is log and log.session_id == "sid-1"
+    assert log.latest("audiencing_set") == _snapshot(1)
+    assert session_event_log(state) is log
+
+
+def test_jsonl_sink_replays_to_latest_snapshot(tmp_path: Path) -> None:
+    sink = JsonlSink(tmp_path, segment_bytes=512)
+    log = EventLog(capacity=2, session_id="s1", sink=sink)
+    for n in range(12):
+        log.append("audiencing_set", _snapshot(n))
+    sink.close()
+
+    assert sink.written == 12
+    records = [json.loads(line) for path in sink.segments for line in path.read_text().splitlines()]
+    assert replay(records)[("s1", "audiencing_set")] == _snapshot(11)
+
+
+def test_audiencing_events_never_carry_the_session_token(tmp_path: Path, monkeypatch) -> None:
+    from senior_nav.core.audiencing import log_audiencing_set
+    from senior_nav.runtime import events
+
+    sink = JsonlSink(tmp_path)
+    monkeypatch.setattr(events, "default_sink", lambda: sink)
+    session = {"_sid": "secret-restore-token"}
+    log_audiencing_set(session, _snapshot(1))
+    sink.close()
+
+    assert sink.written == 1 and session["event_log"].session_id != "secret-restore-token"
+    assert all("secret-restore-token" not in path.read_text() for path in sink.segments)
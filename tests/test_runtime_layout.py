@@ -0,0 +1,43 @@
+"""Project layout index prunes skipped trees and refreshes on page changes."""
+from __future__ import annotations
+
+from pathlib import Path
+import os
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.runtime.layout import build_layout, project_layout
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x = 1\n", encoding="utf-8")
+
+
+def test_skipped_subtrees_do_not_count_as_pages_dirs(tmp_path: Path) -> None:
+    _touch(tmp_path / "pages" / "welcome.py")
+    _touch(tmp_path / "pages" / "cost_planner_v2" / "timeline.py")
+    _touch(tmp_path / ".venv" / "lib" / "pkg" / "pages" / "x.py")
+    _touch(tmp_path / "_graveyard" / "pages" / "old.py")
+    (tmp_path / "docs" / "pages").mkdir(parents=True)  # no Python files
+
+    layout = build_layout(tmp_path)
+    assert layout.pages_dirs == ((tmp_path / "pages").resolve(),)
+    assert layout.has_page("pages/cost_planner_v2/timeline.py")
+    assert not layout.has_page("pages/missing.py")
+
+    _touch(tmp_path / "ui" / "pages" / "stray.py")
+    assert len(build_layout(tmp_path).pages_dirs) == 2
+
+
+def test_layout_is_rebuilt_when_a_page_is_added(tmp_path: Path) -> None:
+    _touch(tmp_path / "pages" / "welcome.py")
+    first = project_layout(tmp_path)
+    assert project_layout(tmp_path) is first
+
+    _touch(tmp_path / "pages" / "hub.py")
+    stat = (tmp_path / "pages").stat()
+    os.utime(tmp_path / "pages", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = project_layout(tmp_path)
+    assert second is not first and second.has_page("pages/hub.py")
@@ -0,0 +1,48 @@
+"""Syntax preflight only recompiles new or changed page files."""
+from __future__ import annotations
+
+from pathlib import Path
+import os
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.runtime.preflight import PreflightCache
+
+
+def _write(path: Path, text: str) -> None:
+    path.write_text(text, encoding="utf-8")
+
+
+def test_unchanged_files_reuse_cached_verdicts(tmp_path: Path) -> None:
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    _write(pages / "good.py", "x = 1\n")
+    _write(pages / "bad.py", "def broken(:\n")
+    manifest = tmp_path / "cache" / "preflight.json"
+    cache = PreflightCache(manifest)
+
+    first = cache.check([str(pages)])
+    assert (first.checked, first.compiled) == (2, 2)
+    assert [Path(err.path).name for err in first.errors] == ["bad.py"]
+
+    second = cache.check([str(pages)])
+    assert second.compiled == 0
+    assert second.errors == first.errors
+
+    _write(pages / "bad.py", "def fixed():\n    return 1\n")
+    os.utime(pages / "good.py")  # touched but identical content
+    third = cache.check([str(pages)])
+    assert third.ok and third.compiled == 1
+
+
+def test_manifest_warms_a_new_process(tmp_path: Path) -> None:
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    for idx in range(3):
+        _write(pages / f"page_{idx}.py", f"VALUE = {idx}\n")
+    manifest = tmp_path / "preflight.json"
+    PreflightCache(manifest).check([str(pages)])
+
+    restarted = PreflightCache(manifest).check([str(pages)])
+    assert (restarted.checked, restarted.compiled) == (3, 0)
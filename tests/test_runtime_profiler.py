@@ -0,0 +1,72 @@
+"""Span profiler records only when enabled and keeps bounded buffers."""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import threading
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.runtime import profiler
+
+
+@profiler.profiled("helper")
+def _helper(value: int) -> int:
+    return value * 2
+
+
+def test_spans_record_only_on_profiled_threads() -> None:
+    profiler.reset()
+    profiler.begin_rerun(False)
+    assert _helper(2) == 4
+    assert profiler.summary() == []
+
+    profiler.begin_rerun(True)
+    try:
+        for value in range(10):
+            _helper(value)
+        with profiler.span("block"):
+            pass
+        other = threading.Thread(target=_helper, args=(1,))  # not a profiled rerun
+        other.start()
+        other.join()
+    finally:
+        profiler.begin_rerun(False)
+
+    rows = {row["span"]: row for row in profiler.summary()}
+    assert rows["helper"]["calls"] == 10
+    assert rows["block"]["calls"] == 1
+    assert rows["helper"]["p50_ms"] <= rows["helper"]["p95_ms"]
+    assert _helper.__name__ == "_helper"
+
+
+def test_buffers_are_bounded_and_profiles_sampled(monkeypatch) -> None:
+    profiler.reset()
+    monkeypatch.setattr(profiler, "MAX_SPANS", 3)
+    monkeypatch.setattr(profiler, "SAMPLE_EVERY", 2)
+    profiler.begin_rerun(True)
+    try:
+        for _ in range(profiler.RING_SIZE + 10):
+            profiler.record("a", 1.0)
+        for name in ("b", "c", "d", "e"):
+            profiler.record(name, 1.0)
+        for _ in range(4):
+            with profiler.sampled_profile("page"):
+                _helper(3)
+    finally:
+        profiler.begin_rerun(False)
+
+    rows = {row["span"]: row for row in profiler.summary()}
+    assert rows["a"]["calls"] == profiler.RING_SIZE
+    assert set(rows) == {"a", "b", "c"}
+    captures = profiler.profiles()
+    assert [c.rerun for c in captures] == [2, 4]
+    assert "function calls" in captures[-1].stats
+    profiler.reset()
+
+
+def test_percentile_is_nearest_rank() -> None:
+    ordered = [float(v) for v in range(1, 101)]
+    assert profiler._percentile(ordered, 50) == 50.0
+    assert profiler._percentile(ordered, 95) == 95.0
+    assert profiler._percentile([7.0], 95) == 7.0
@@ -0,0 +1,59 @@
+"""Page registry resolves INTENDED once and finds each page's imports."""
+from __future__ import annotations
+
+from pathlib import Path
+import os
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.runtime.registry import page_imports, page_registry
+
+
+def _touch(path: Path, text: str = "x = 1\n") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+INTENDED = [
+    ("pages/welcome.py", "Welcome", "👋", True),
+    ("pages/missing.py", "Missing", "❓", False),
+    ("pages/hub.py", "Hub", "🏠", True),
+]
+
+
+def test_registry_drops_missing_pages_and_keeps_one_default(tmp_path: Path) -> None:
+    _touch(tmp_path / "pages" / "welcome.py")
+    _touch(tmp_path / "pages" / "hub.py")
+
+    registry = page_registry(INTENDED, tmp_path)
+    assert [spec.path for spec in registry.specs] == ["pages/welcome.py", "pages/hub.py"]
+    assert registry.missing == ("pages/missing.py",)
+    assert registry.default is not None and registry.default.path == "pages/welcome.py"
+    assert [spec.default for spec in registry.specs] == [True, False]
+    assert page_registry(INTENDED, tmp_path) is registry
+
+    _touch(tmp_path / "pages" / "missing.py")
+    pages_dir = tmp_path / "pages"
+    stat = pages_dir.stat()
+    os.utime(pages_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    rebuilt = page_registry(INTENDED, tmp_path)
+    assert rebuilt is not registry
+    assert rebuilt.missing == ()
+
+
+def test_page_imports_are_module_level_only(tmp_path: Path) -> None:
+    page = tmp_path / "page.py"
+    _touch(page, "\n".join([
+        "from __future__ import annotations",
+        "import streamlit as st",
+        "try:",
+        "    from ui.cost_planner_template import apply_cost_planner_theme",
+        "except Exception:",
+        "    import ui.fallback",
+        "from . import sibling",
+        "def main():",
+        "    from cost_planner_v2.cp_state import derive",
+        "",
+    ]))
+    assert page_imports(page) == ("streamlit", "ui.cost_planner_template", "ui.fallback")
@@ -0,0 +1,121 @@
+"""Session store round-trips planner state through the binary codec and sqlite."""
+from __future__ import annotations
+
+from pathlib import Path
+import datetime as dt
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from senior_nav.runtime import sessions
+from senior_nav.runtime.packing import SymbolTable, pack, unpack
+from senior_nav.runtime.sessions import SessionStore
+
+
+def _state() -> dict:
+    return {
+        "audiencing": {"entry": "self", "qualifiers": {"is_veteran": True, "has_partner": False}},
+        "gcp_answers": {"medicaid_status": "no", "chronic_conditions": ["diabetes", "copd"]},
+        "cost_planner": {
+            "mode": "estimate",
+            "inputs": {"rent": 3100.0, "meds": 42.5, "ratio": 0.1, "count": -3, "big": 2**40},
+            "runway_months": None,
+            "note": "Call Mom's doctor 🩺",
+            "_subtotals_synced": 7,
+            "snapshot_for_crm": {"inputs": {}},
+        },
+        "cp": {"ui": {"progress": 2, "suggestions_shown": {"b", "a"}}, "blob": b"\x00\x01", "_shaped": True},
+        "pfma": {"due": dt.date(2026, 1, 31), "at": dt.datetime(2026, 1, 31, 9, 30)},
+        "unrelated": object(),
+    }
+
+
+def test_codec_round_trips_and_codes_enums() -> None:
+    symbols = SymbolTable()
+    symbols.seed(["self", "diabetes"])
+    data = sessions.snapshot(_state())
+    blob = pack(data, symbols)
+
+    assert "unrelated" not in data
+    assert "_subtotals_synced" not in data["cost_planner"]
+    assert "_shaped" not in data["cp"]  # restored blocks are plain dicts; cp_ensure reshapes them
+    restored = unpack(blob, SymbolTable(symbols.text(i) for i in range(len(symbols))))
+    assert restored == data
+    assert isinstance(restored["cost_planner"]["inputs"]["rent"], float)
+    assert b"diabetes" not in blob and b"self" not in blob      # seeded enums -> codes
+    assert b"inputs" not in blob                                 # keys are learned
+    assert b"copd" in blob                                       # other values stay text
+
+
+def test_store_skips_unchanged_and_coalesces(tmp_path: Path) -> None:
+    store = SessionStore(tmp_path / "s.sqlite3", background=False)
+    state = sessions.snapshot(_state())
+
+    assert store.save("tok", state) is True
+    assert store.save("tok", state) is False
+    state["gcp_answers"]["medicaid_status"] = "yes"
+    assert store.save("tok", state) is True
+    assert store.load("tok")["gcp_answers"]["medicaid_status"] == "yes"  # served from the queue
+
+    assert store.flush() == 1
+    stats = store.stats.as_dict()
+    assert (stats["saves"], stats["unchanged"], stats["coalesced"]) == (3, 1, 1)
+    assert (stats["rows_written"], stats["transactions"]) == (1, 1)
+    store.close()
+
+
+def test_restore_after_reopen_rebuilds_derived_entries(tmp_path: Path) -> None:
+    path = tmp_path / "s.sqlite3"
+    store = SessionStore(path, vocabulary=["self"], background=False)
+    store.save("tok", sessions.snapshot(_state()))
+    store.close()
+
+    reopened = SessionStore(path, vocabulary=["self", "brand_new_enum"], background=False)
+    target: dict = {}
+    sessions.restore(target, reopened.load("tok"))
+    reopened.close()
+
+    assert target["cp"]["ui"]["suggestions_shown"] == {"a", "b"}
+    assert target["cost_planner"]["snapshot_for_crm"] == {}
+    assert "_subtotals_synced" not in target["cost_planner"]
+    assert target["pfma"]["at"] == dt.datetime(2026, 1, 31, 9, 30)
+
+
+def test_stores_sharing_a_database_agree_on_codes(tmp_path: Path) -> None:
+    path = tmp_path / "s.sqlite3"
+    first = SessionStore(path, background=False)
+    second = SessionStore(path, background=False)
+    first.save("a", {"cp": {"only_in_first": 1}})
+    second.save("b", {"cp": {"only_in_second": 2}})
+    first.flush()
+    second.flush()
+
+    assert first.symbols.code("only_in_second", True) == second.symbols.code("only_in_second", True)
+    assert first.symbols.code("only_in_first", True) != first.symbols.code("only_in_second", True)
+    assert first.load("b") == {"cp": {"only_in_second": 2}}   # code learned from the database
+    assert second.load("a") == {"cp": {"only_in_first": 1}}
+    first.close()
+    second.close()
+
+
+def test_digest_memo_is_bounded(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(sessions, "MAX_DIGESTS", 8)
+    store = SessionStore(tmp_path / "s.sqlite3", background=False)
+    for i in range(20):
+        store.save(f"tok{i}", {"cp": {"n": i}})
+    assert len(store._digests) == 8
+    assert store.save("tok19", {"cp": {"n": 19}}) is False
+    assert store.save("tok0", {"cp": {"n": 0}}) is True     # evicted: written again
+    store.close()
+
+
+def test_default_store_is_opt_in(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(sessions, "_STORE", None)
+    monkeypatch.setattr(sessions, "_UNAVAILABLE", False)
+    monkeypatch.delenv("SN_SESSION_DB", raising=False)
+    assert sessions.default_store() is None
+
+    monkeypatch.setenv("SN_SESSION_DB", str(tmp_path / "opted.sqlite3"))
+    store = sessions.default_store()
+    assert store is not None and store.path == tmp_path / "opted.sqlite3"
+    store.close()
@@ -0,0 +1,62 @@
+"""Frozen snapshots share unchanged blocks and compare by content hash."""
+from __future__ import annotations
+
+from pathlib import Path
+import copy
+import json
+import pickle
+import sys
+
+import pytest
+import streamlit as st
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import audiencing
+from senior_nav.runtime.snapshots import FrozenMap, freeze, thaw
+
+
+def test_freeze_reuses_unchanged_blocks() -> None:
+    first = freeze({"route": {"next": "pfma", "meta": {"reasons": ["urgent_case"]}}, "people": {"name": "Pat"}})
+    same = freeze({"route": {"next": "pfma", "meta": {"reasons": ["urgent_case"]}}, "people": {"name": "Pat"}}, first)
+    changed = freeze({"route": {"next": "hub", "meta": {"reasons": ["urgent_case"]}}, "people": {"name": "Pat"}}, first)
+
+    assert same is first
+    assert changed is not first and changed != first
+    assert changed["people"] is first["people"]
+    assert changed["route"]["meta"] is first["route"]["meta"]
+    assert first["route"]["meta"]["reasons"] == ("urgent_case",)
+
+
+def test_frozen_map_is_hashable_read_only_and_dict_compatible() -> None:
+    snap = freeze({"entry": "self", "flags": {"urgent": True}, "tags": {"a"}})
+    twin = freeze({"entry": "self", "flags": {"urgent": True}, "tags": {"a"}})
+
+    assert snap == twin and hash(snap) == hash(twin)
+    assert {snap: 1}[twin] == 1
+    assert snap == {"entry": "self", "flags": {"urgent": True}, "tags": frozenset({"a"})}
+    with pytest.raises(TypeError):
+        snap["entry"] = "proxy"
+    with pytest.raises(TypeError):
+        snap["flags"].update(urgent=False)
+    assert copy.deepcopy(snap) is snap
+    assert pickle.loads(pickle.dumps(snap)) == snap
+    assert json.loads(json.dumps({"flags": snap["flags"]})) == {"flags": {"urgent": True}}
+    assert snap.replace(entry="proxy")["flags"] is snap["flags"]
+    thawed = thaw(snap)
+    thawed["flags"]["urgent"] = False
+    assert type(thawed["flags"]) is dict and snap["flags"]["urgent"] is True
+
+
+def test_snapshot_audiencing_returns_previous_snapshot_when_unchanged() -> None:
+    st.session_state.clear()
+    state = audiencing.ensure_audiencing_state()
+    first = audiencing.snapshot_audiencing(state)
+    st.session_state["audiencing_snapshot"] = first
+
+    assert audiencing.snapshot_audiencing(state) is first
+    state["qualifiers"]["urgent"] = True
+    second = audiencing.snapshot_audiencing(state)
+    assert second["flags"]["urgent"] is True
+    assert second["people"] is first["people"] and second["visibility"] is first["visibility"]
+    assert first["flags"]["urgent"] is False
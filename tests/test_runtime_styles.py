@@ -0,0 +1,64 @@
+"""Stylesheet cache minifies safely and emits each block once per rerun."""
+from __future__ import annotations
+
+from pathlib import Path
+import logging
+import os
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+import streamlit as st
+
+from senior_nav.runtime import styles
+
+for _name in list(logging.root.manager.loggerDict):
+    if _name.startswith("streamlit"):
+        logging.getLogger(_name).setLevel(logging.ERROR)
+
+
+def test_minify_keeps_significant_spaces() -> None:
+    css = """
+    <style>
+      /* comment */
+      .card  a :hover { color : red ; }
+      .box { width: calc(100% - 2rem); }
+    </style>
+    """
+    out = styles.minify_css(css)
+    assert out == ".card a :hover{color :red}.box{width:calc(100% - 2rem)}"
+
+
+def test_bundle_members_are_not_emitted_again(monkeypatch) -> None:
+    emitted = []
+    monkeypatch.setattr(styles.st, "markdown", lambda body, **_: emitted.append(body))
+    theme = ".block-container{max-width:1160px}"
+
+    styles.begin_rerun()
+    styles.inject_stylesheet(styles.global_bundle([theme]))
+    styles.inject_css(theme)
+    styles.inject_css(".chip{border-radius:999px}")
+    styles.inject_css(".chip { border-radius: 999px; }")  # same after minifying
+    assert len(emitted) == 2
+    stats = styles.rerun_stats()
+    assert stats["blocks"] == 2 and stats["skipped"] == 2
+    assert stats["saved_bytes"] > 0
+
+    styles.begin_rerun()  # a new rerun must emit everything again
+    styles.inject_css(theme)
+    assert len(emitted) == 3
+    st.session_state.clear()
+
+
+def test_file_stylesheet_reloads_on_mtime_change(tmp_path: Path) -> None:
+    path = tmp_path / "a.css"
+    path.write_text("a { color: red; }", encoding="utf-8")
+    first = styles.file_stylesheet(path)
+    assert first is not None and first.css == "a{color:red}"
+    assert styles.file_stylesheet(path) is first
+
+    path.write_text("a { color: blue; }", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert styles.file_stylesheet(path).css == "a{color:blue}"
+    assert styles.file_stylesheet(tmp_path / "missing.css") is None
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+bench_app_journey.py - cold-visit and warm-rerun latency of the user
+journey (welcome -> contextual welcome -> GCP sections -> recommendation ->
+Cost Planner drawers -> PFMA), driven through app.py with Streamlit's
+AppTest. Every step runs app.py and the page it navigates to, as under
+``streamlit run``. No server, browser or network is involved.
+
+pages/audiencing.py and pages/pfma_summary.py are not measured: app.py does
+not register them with st.navigation, so no user can reach them in the app.
+They are listed under "not_measured" in the JSON (see NOT_MEASURED).
+
+Per page it records:
+  cold_ms      first visit in this process (page imports included)
+  warm_ms      median of --reruns reruns on the same page (+ min)
+  peak_kib     tracemalloc peak of one extra rerun
+  delta_bytes  serialized size of the delta messages one rerun emits
+  exceptions   uncaught page exceptions (the step is still timed)
+
+Page output (prints, streamlit's tracebacks) is discarded while the journey
+runs; exceptions are kept in the JSON.
+
+Results are written as JSON; --compare prints per-page changes against an
+earlier result file.
+
+    python3 tools/bench_app_journey.py [--reruns 5] [--out FILE] [--compare OLD.json]
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import pathlib
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+# Design mode skips the first-load bounce to Welcome; no usage stats.
+os.environ.setdefault("SN_DEV", "1")
+os.environ.setdefault("STREAMLIT_BROWSER_GATHER_USAGE_STATS", "false")
+os.environ.setdefault("STREAMLIT_LOGGER_LEVEL", "critical")
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+from streamlit.runtime.pages_manager import PagesManager
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+JOURNEY = (
+    "pages/welcome.py",
+    "pages/contextual_welcome_self.py",
+    "pages/gcp.py",
+    "pages/gcp_daily_life.py",
+    "pages/gcp_health_safety.py",
+    "pages/gcp_context_prefs.py",
+    "pages/gcp_recommendation.py",
+    "pages/cost_planner_modules.py",
+    "pages/cost_planner_home_care.py",
+    "pages/cost_planner_daily_aids.py",
+    "pages/cost_planner_housing.py",
+    "pages/cost_planner_benefits.py",
+    "pages/cost_planner_mods.py",
+    "pages/pfma.py",
+)
+
+# Journey pages that cannot be driven through app.py, with the reason.
+NOT_MEASURED: Dict[str, str] = {
+    "pages/audiencing.py": "not registered in app.py's navigation",
+    "pages/pfma_summary.py": "not registered in app.py's navigation",
+}
+
+# Delta bytes of the most recent script run (see _capture_deltas).
+_LAST_RUN: Dict[str, int] = {}
+
+
+def _capture_deltas() -> None:
+    """Record the serialized delta size of every AppTest script run."""
+    original = LocalScriptRunner.run
+
+    def run(self, *args, **kwargs):
+        tree = original(self, *args, **kwargs)
+        deltas = [m for m in self.forward_msgs() if m.WhichOneof("type") == "delta"]
+        _LAST_RUN["delta_bytes"] = sum(m.ByteSize() for m in deltas)
+        _LAST_RUN["deltas"] = len(deltas)
+        return tree
+
+    LocalScriptRunner.run = run
+
+
+def _route_through_app() -> None:
+    """Run every page via app.py's st.navigation, as ``streamlit run`` does.
+
+    AppTest resets Streamlit's pages-directory detection before each run, and
+    with a ``pages/`` folder next to app.py it would otherwise execute the
+    page scripts directly (pages-directory mode), skipping app.py entirely.
+    """
+    original = PagesManager.__init__
+
+    def init(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        PagesManager.uses_pages_directory = False
+
+    PagesManager.__init__ = init
+
+
+def _timed(at: AppTest) -> float:
+    start = time.perf_counter()
+    at.run()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def _exceptions(at: AppTest) -> List[str]:
+    return [str(exc.value)[:200] for exc in at.exception]
+
+
+def measure_page(at: AppTest, page: str, reruns: int) -> Dict[str, object]:
+    at.switch_page(page)
+    cold_ms = _timed(at)
+    warm = [_timed(at) for _ in range(reruns)]
+    delta = dict(_LAST_RUN)
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        at.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "page": page,
+        "cold_ms": round(cold_ms, 2),
+        "warm_ms": round(statistics.median(warm), 2),
+        "warm_min_ms": round(min(warm), 2),
+        "peak_kib": round(peak / 1024, 1),
+        "delta_bytes": delta.get("delta_bytes", 0),
+        "deltas": delta.get("deltas", 0),
+        "exceptions": _exceptions(at),
+    }
+
+
+def run_journey(reruns: int, timeout: float) -> Dict[str, object]:
+    _capture_deltas()
+    _route_through_app()
+    start = time.perf_counter()
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+    at.run()
+    boot_ms = (time.perf_counter() - start) * 1000.0
+    boot = {"cold_ms": round(boot_ms, 2), **_LAST_RUN, "exceptions": _exceptions(at)}
+
+    steps = []
+    for page in JOURNEY:
+        try:
+            steps.append(measure_page(at, page, reruns))
+        except ValueError:  # missing, or no longer registered in app.py's INTENDED
+            steps.append({"page": page, "skipped": "not a navigation page"})
+    timed = [s for s in steps if "skipped" not in s]
+    return {
+        "meta": {
+            "commit": _commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "platform": platform.platform(),
+            "reruns": reruns,
+        },
+        "boot": boot,
+        "steps": steps,
+        "not_measured": [{"page": page, "reason": reason} for page, reason in NOT_MEASURED.items()],
+        "totals": {
+            "cold_ms": round(sum(s["cold_ms"] for s in timed), 2),
+            "warm_ms": round(sum(s["warm_ms"] for s in timed), 2),
+            "delta_bytes": sum(s["delta_bytes"] for s in timed),
+            "exceptions": sum(len(s["exceptions"]) for s in timed),
+        },
+    }
+
+
+def _commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def print_table(result: Dict[str, object]) -> None:
+    boot = result["boot"]
+    print(f"boot (app.py, first run): {boot['cold_ms']:.0f} ms, {boot.get('delta_bytes', 0):,} delta bytes")
+    print(f"{'page':<50} {'cold ms':>8} {'warm ms':>8} {'peak KiB':>9} {'delta B':>9}  exc")
+    for step in result["steps"]:
+        if "skipped" in step:
+            print(f"{step['page']:<50} skipped: {step['skipped']}")
+            continue
+        print(f"{step['page']:<50} {step['cold_ms']:8.1f} {step['warm_ms']:8.1f} "
+              f"{step['peak_kib']:9.0f} {step['delta_bytes']:9,}  {len(step['exceptions'])}")
+    totals = result["totals"]
+    print(f"{'total':<50} {totals['cold_ms']:8.1f} {totals['warm_ms']:8.1f} "
+          f"{'':>9} {totals['delta_bytes']:9,}  {totals['exceptions']}")
+    for item in result.get("not_measured", ()):
+        print(f"not measured: {item['page']} ({item['reason']})")
+
+
+def print_comparison(old: Dict[str, object], new: Dict[str, object]) -> None:
+    before = {s["page"]: s for s in old["steps"] if "skipped" not in s}
+    print(f"\nvs {old['meta'].get('commit')} ({old['meta'].get('timestamp')}):")
+    print(f"{'page':<50} {'warm ms':>16} {'delta B':>20}")
+    for step in new["steps"]:
+        prev = before.get(step["page"])
+        if prev is None or "skipped" in step:
+            continue
+        warm = step["warm_ms"] - prev["warm_ms"]
+        pct = 100.0 * warm / prev["warm_ms"] if prev["warm_ms"] else 0.0
+        delta = step["delta_bytes"] - prev["delta_bytes"]
+        print(f"{step['page']:<50} {warm:+8.1f} ({pct:+5.0f}%) {delta:+12,}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--reruns", type=int, default=5, help="warm reruns per page")
+    ap.add_argument("--timeout", type=float, default=60.0, help="per-run AppTest timeout (s)")
+    ap.add_argument("--out", type=pathlib.Path, help="JSON output (default: .sn_cache/journey-<commit>.json)")
+    ap.add_argument("--compare", type=pathlib.Path, help="earlier JSON result to diff against")
+    args = ap.parse_args()
+
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.CRITICAL)
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    os.chdir(ROOT)  # app.py resolves pages/ and static/ from the working directory
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink), contextlib.redirect_stderr(sink):
+        result = run_journey(max(1, args.reruns), args.timeout)
+    out = args.out or ROOT / ".sn_cache" / f"journey-{result['meta']['commit'] or 'local'}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, indent=2), encoding="utf-8")
+
+    print_table(result)
+    if baseline is not None:
+        print_comparison(baseline, result)
+    print(f"\nwrote {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+bench_cohort.py - cohort pipeline throughput on a synthetic referral export
+of --rows rows, in-process and with 1, 2 and 4 workers.
+
+    python3 tools/bench_cohort.py [--rows 100000] [--chunk-size 5000]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import pathlib
+import random
+import sys
+import tempfile
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from senior_nav.core.audiencing import AUDIENCING_QUALIFIER_KEYS
+from guided_care_plan import QUESTION_ORDER, get_question_meta
+from senior_nav.cohort import run_cohort
+
+COST_COLUMNS = ("income_total", "benefits_total", "assets_total_effective")
+
+
+def write_cohort(path: pathlib.Path, rows: int, seed: int = 11) -> None:
+    rng = random.Random(seed)
+    meta = {qid: get_question_meta(qid) for qid in QUESTION_ORDER}
+    options = {qid: [opt["value"] for opt in meta[qid]["options"]] for qid in QUESTION_ORDER}
+    fields = ["id", "entry", *AUDIENCING_QUALIFIER_KEYS, *QUESTION_ORDER, *COST_COLUMNS]
+    with path.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fields)
+        writer.writeheader()
+        for i in range(rows):
+            row = {"id": f"r{i}", "entry": rng.choice(("self", "proxy"))}
+            row.update({key: rng.choice(("yes", "no")) for key in AUDIENCING_QUALIFIER_KEYS})
+            for qid in QUESTION_ORDER:
+                if meta[qid].get("multi"):
+                    row[qid] = "|".join(rng.sample(options[qid], rng.randint(0, min(2, len(options[qid])))))
+                else:
+                    row[qid] = rng.choice(options[qid])
+            row.update(income_total=rng.randint(0, 4000), benefits_total=rng.randint(0, 1500),
+                       assets_total_effective=rng.randint(0, 400_000))
+            writer.writerow(row)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--chunk-size", type=int, default=5000)
+    args = ap.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        source = pathlib.Path(tmp) / "cohort.csv"
+        write_cohort(source, args.rows)
+        for workers in (0, 1, 2, 4):
+            stats = run_cohort(source, pathlib.Path(tmp) / "scored.jsonl",
+                               workers=workers, chunk_size=args.chunk_size)
+            cores = max(workers, 1)
+            print(f"workers={workers}  {stats.wall_s:6.2f}s  {stats.rows_per_s:9.0f} rows/s  "
+                  f"{stats.rows_per_s / cores:9.0f} rows/s/core (wall)  "
+                  f"{stats.rows_per_core_s:9.0f} rows/s/core (cpu)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
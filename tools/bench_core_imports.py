@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+bench_core_imports.py - import time and allocated memory of the
+Streamlit-free cores (and, for comparison, their Streamlit adapters), each
+measured in a fresh interpreter as the median of --runs. Exits 1 when a core
+takes more than 20 ms, allocates more than 2 MB, or loads Streamlit.
+
+    python3 tools/bench_core_imports.py [--runs 5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+CORES = (
+    "senior_nav.core.audiencing", "senior_nav.core.gcp", "senior_nav.core.cost_planner", "senior_nav.core.cp_derive",
+)
+ADAPTERS = ("audiencing", "guided_care_plan.session", "cost_planner_shared", "cost_planner_v2.cp_state")
+BUDGET_MS = 20.0
+BUDGET_BYTES = 2 * 1024 * 1024
+
+PROBE = """
+import importlib, json, sys, time, tracemalloc
+sys.path.insert(0, {root!r})
+if {trace}:
+    tracemalloc.start()
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = time.perf_counter() - start
+allocated = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+print(json.dumps({{"ms": elapsed * 1e3, "bytes": allocated, "streamlit": "streamlit" in sys.modules}}))
+"""
+
+
+def measure(module: str, runs: int) -> dict:
+    def probe(trace: bool) -> dict:
+        code = PROBE.format(root=str(ROOT), module=module, trace=trace)
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT)
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+    # tracemalloc slows imports several-fold, so time and memory are separate runs.
+    traced = probe(True)
+    return {
+        "ms": statistics.median(probe(False)["ms"] for _ in range(runs)),
+        "bytes": traced["bytes"],
+        "streamlit": traced["streamlit"],
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+    failed = False
+    print(f"{'module':<32} {'import ms':>10} {'alloc KiB':>10}  streamlit")
+    for module in CORES + ADAPTERS:
+        result = measure(module, args.runs)
+        core = module in CORES
+        over = core and (result["ms"] > BUDGET_MS or result["bytes"] > BUDGET_BYTES or result["streamlit"])
+        failed = failed or over
+        print(f"{module:<32} {result['ms']:10.1f} {result['bytes'] / 1024:10.0f}  "
+              f"{'yes' if result['streamlit'] else 'no':<9}{'  OVER BUDGET' if over else ''}")
+    print(f"budget per core: {BUDGET_MS:.0f} ms, {BUDGET_BYTES // 1024} KiB, no streamlit")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
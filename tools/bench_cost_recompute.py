@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+bench_cost_recompute.py - 10k Cost Planner input edits per session: the
+previous full recompute_costs() after every edit vs. incremental set_numeric.
+
+    python3 tools/bench_cost_recompute.py
+"""
+from __future__ import annotations
+
+import logging
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import streamlit as st
+
+import cost_planner_shared as shared
+
+EDITS = 10_000
+
+
+def legacy_recompute(cp: dict, mapping: dict) -> None:
+    """recompute_costs() as it was before the dependency graph: one scan of
+    the field map per subtotal and a fresh CRM snapshot on every call."""
+
+    def total(*normalized: str) -> float:
+        total_value = 0.0
+        for fid, norm in mapping.items():
+            if norm in normalized:
+                total_value += float(cp["inputs"].get(fid, 0) or 0)
+        return total_value
+
+    for name, keys in shared.SUBTOTAL_KEYS.items():
+        cp["subtotals"][name] = total(*keys)
+    cp["monthly_total"] = sum(v for k, v in cp["subtotals"].items() if k != "offsets")
+    cp["net_out_of_pocket"] = max(0.0, cp["monthly_total"] - cp["subtotals"]["offsets"])
+    assets_value = float(cp["inputs"].get("assets_total", 0) or 0)
+    cp["assets"] = assets_value
+    cp["runway_months"] = assets_value / cp["net_out_of_pocket"] if cp["net_out_of_pocket"] > 0 else None
+    cp["snapshot_for_crm"] = {
+        "audiencing": st.session_state.get("audiencing_snapshot") or st.session_state.get("audiencing"),
+        "gcp": st.session_state.get("gcp"),
+        "inputs": cp["inputs"],
+        "subtotals": cp["subtotals"],
+        "monthly_total": cp["monthly_total"],
+        "net_out_of_pocket": cp["net_out_of_pocket"],
+        "assets": cp["assets"],
+        "runway_months": cp["runway_months"],
+        "decision_log": cp["decision_log"],
+        "expert_flags": cp["expert_flags"],
+        "custom_line_items": cp.get("custom_line_items", []),
+        "notes": cp.get("notes", ""),
+    }
+
+
+def _session() -> dict:
+    st.session_state.clear()
+    shared.ensure_core_state()
+    cp = st.session_state["cost_planner"]
+    cp["mode"] = "planning"
+    shared.recompute_costs()
+    return cp
+
+
+def main() -> int:
+    # Outside `streamlit run` every session_state access logs a warning,
+    # which would dominate both timings.
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    rng = random.Random(7)
+    field_ids = list(shared.load_field_map()) + ["assets_total"]
+    edits = [(rng.choice(field_ids), rng.uniform(0, 5000)) for _ in range(EDITS)]
+
+    mapping = shared.load_field_map()
+
+    # Graph work only: edits applied straight to the cost_planner block.
+    cp = _session()
+    start = time.perf_counter()
+    for field_id, value in edits:
+        cp["inputs"][field_id] = float(value)
+        legacy_recompute(cp, mapping)
+    full = time.perf_counter() - start
+    expected = dict(cp["subtotals"]), cp["net_out_of_pocket"]
+
+    cp = _session()
+    start = time.perf_counter()
+    for field_id, value in edits:
+        shared.apply_input(cp, field_id, value)
+    incremental = time.perf_counter() - start
+
+    # What a page does per edit: set_numeric() then recompute_costs(), each
+    # of which also runs ensure_core_state() against st.session_state.
+    _session()
+    start = time.perf_counter()
+    for field_id, value in edits:
+        shared.set_numeric(field_id, value)
+        shared.recompute_costs()
+    page_path = time.perf_counter() - start
+    cp = st.session_state["cost_planner"]
+
+    same = all(abs(cp["subtotals"][k] - v) < 1e-6 for k, v in expected[0].items())
+    print(f"edits per session:     {EDITS:,}")
+    print(f"full recompute:        {full * 1e3:8.1f} ms ({full / EDITS * 1e6:.1f} us/edit)")
+    print(f"incremental:           {incremental * 1e3:8.1f} ms ({incremental / EDITS * 1e6:.1f} us/edit)")
+    print(f"speedup:               {full / incremental:.1f}x")
+    print(f"page path (+ state):   {page_path * 1e3:8.1f} ms ({page_path / EDITS * 1e6:.1f} us/edit)")
+    print(f"results agree:         {same and abs(cp['net_out_of_pocket'] - expected[1]) < 1e-6}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+bench_cp_projection.py - per-call cost of the 360-month Cost Planner projection.
+
+    python3 tools/bench_cp_projection.py
+"""
+from __future__ import annotations
+
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from cost_planner_v2.projection import project
+
+VALUES = {
+    "monthly_cost": 6200.0,
+    "caregiver_cost": 400.0,
+    "other_monthly_total": 850.0,
+    "mods_monthly_total": 120.0,
+    "income_total": 3100.0,
+    "benefits_total": 900.0,
+    "rm_monthly": 0.0,
+    "rent_income_monthly": 0.0,
+    "assets_total_effective": 240000.0,
+    "liquidity_total": 35000.0,
+    "sale_price_one_time": 310000.0,
+}
+
+
+def main() -> int:
+    number = 5_000
+    per_call = min(timeit.repeat(lambda: project(VALUES, sale_month=18), number=number, repeat=5)) / number
+    p = project(VALUES, sale_month=18)
+    print(f"horizon:         {p.months} months")
+    print(f"depletion month: {p.depletion_month}")
+    print(f"per projection:  {per_call * 1e6:.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
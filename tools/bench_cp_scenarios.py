@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+bench_cp_scenarios.py - comparing 50 Cost Planner v2 scenarios: copy-on-write
+ScenarioSet vs. deep-copying the namespace and running compute_derived per copy.
+
+    python3 tools/bench_cp_scenarios.py
+"""
+from __future__ import annotations
+
+import copy
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from cost_planner_v2.cp_state import DERIVE_INPUTS, _split, _to_num, compute_derived
+from cost_planner_v2.scenarios import ScenarioSet, fork
+
+BASE = {
+    "qualifiers": {"planner_mode": "Plan", "has_partner": "none", "owns_home": True,
+                   "is_veteran": False, "care_setting": "Assisted Living", "partner_maintaining_home": False},
+    "setting_cost": {"monthly_cost": 5200},
+    "income": {"income_total": 2400},
+    "expenses": {"other_monthly_total": 650},
+    "caregiver": {"caregiver_cost": 0},
+    "benefits": {"benefits_total": 800},
+    "home": {"reverse_mortgage_monthly": 0, "home_monthly_total": 0, "sale_price": 180000},
+    "liquidity": {"liquidity_total": 20000, "keeping_car": True},
+    "home_mods": {"mods_monthly_total": 0},
+    "assets": {"assets_total_effective": 95000},
+    "derived": {},
+}
+SCENARIOS = {
+    f"scenario {i}": {"setting_cost.monthly_cost": 3000 + 100 * i, "income.income_total": 2000 + 20 * i}
+    for i in range(50)
+}
+
+
+def deep_copy_compare() -> list:
+    rows = []
+    for name, overrides in SCENARIOS.items():
+        ns = copy.deepcopy(BASE)
+        for path, value in overrides.items():
+            module, key = _split(path)
+            ns[module][key] = value
+        values = {}
+        for input_name, path in DERIVE_INPUTS.items():
+            module, key = _split(path)
+            values[input_name] = _to_num(ns.get(module, {}).get(key, 0))
+        rows.append(dict(compute_derived(values), scenario=name))
+    return rows
+
+
+def scenario_set_compare() -> list:
+    scenarios = ScenarioSet(BASE)
+    for name, overrides in SCENARIOS.items():
+        scenarios.add(name, overrides)
+    return scenarios.compare()
+
+
+def main() -> int:
+    number = 200
+    before = min(timeit.repeat(deep_copy_compare, number=number, repeat=5)) / number
+    after = min(timeit.repeat(scenario_set_compare, number=number, repeat=5)) / number
+    forks = min(timeit.repeat(lambda: [fork(BASE, o) for o in SCENARIOS.values()], number=number, repeat=5)) / number
+    same = all(
+        {k: a[k] for k in ("gap", "monthly_all_in", "runway_months")}
+        == {k: b[k] for k in ("gap", "monthly_all_in", "runway_months")}
+        for a, b in zip(deep_copy_compare(), scenario_set_compare())
+    )
+    print(f"scenarios:             {len(SCENARIOS)}")
+    print(f"deepcopy + derive:     {before * 1e3:.2f} ms")
+    print(f"ScenarioSet.compare(): {after * 1e3:.2f} ms ({before / after:.1f}x)")
+    print(f"50 copy-on-write forks:{forks * 1e3:6.2f} ms")
+    print(f"results agree:         {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+bench_cp_simulation.py - wall time of a 10,000-path, 360-month runway simulation.
+
+    python3 tools/bench_cp_simulation.py [--paths N] [--workers N]
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from cost_planner_v2.simulation import simulate
+
+VALUES = {
+    "monthly_cost": 6200.0,
+    "caregiver_cost": 400.0,
+    "other_monthly_total": 850.0,
+    "mods_monthly_total": 120.0,
+    "income_total": 3100.0,
+    "benefits_total": 900.0,
+    "rm_monthly": 0.0,
+    "rent_income_monthly": 0.0,
+    "assets_total_effective": 240000.0,
+    "liquidity_total": 35000.0,
+    "sale_price_one_time": 310000.0,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        result = simulate(VALUES, paths=args.paths, sale_month=18, seed=7, workers=args.workers)
+        best = min(best, time.perf_counter() - start)
+    bands = ", ".join(f"p{p}={v:.0f}" for p, v in result.percentiles.items())
+    print(f"paths x months:  {result.paths:,} x {result.months}")
+    print(f"runway months:   {bands}")
+    print(f"P(lasts 10 yrs): {result.probability_lasts(10):.1%}")
+    print(f"per simulation:  {best * 1e3:.1f} ms (workers={args.workers})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
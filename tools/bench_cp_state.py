@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+bench_cp_state.py - derive() cost and per-session memory of the Cost Planner
+v2 namespace: plain nested dicts read through the string-splitting cp_get()
+vs. the typed contract modules with precompiled input paths.
+
+    python3 tools/bench_cp_state.py
+"""
+from __future__ import annotations
+
+import logging
+import pathlib
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+import streamlit as st
+
+from cost_planner_v2 import cp_state
+
+VALUES = {
+    "setting_cost.monthly_cost": "$6,200",
+    "income.income_total": 3100,
+    "expenses.other_monthly_total": 850,
+    "caregiver.caregiver_cost": 400,
+    "benefits.benefits_total": 900,
+    "assets.assets_total_effective": 240000,
+    "liquidity.liquidity_total": 35000,
+    "home.sale_price": 310000,
+}
+
+
+def _plain_namespace() -> dict:
+    cp = {
+        "qualifiers": {"planner_mode": "Plan", "has_partner": "none", "owns_home": False, "is_veteran": False,
+                       "care_setting": "Assisted Living", "partner_maintaining_home": False},
+        "setting_cost": {"monthly_cost": 4200},
+        "income": {"income_total": 0},
+        "expenses": {"other_monthly_total": 0},
+        "caregiver": {"caregiver_cost": 0},
+        "benefits": {"benefits_total": 0},
+        "home": {"reverse_mortgage_monthly": 0, "home_monthly_total": 0, "sale_price": 0},
+        "liquidity": {"liquidity_total": 0, "keeping_car": True},
+        "home_mods": {"mods_monthly_total": 0},
+        "assets": {"assets_total_effective": 0},
+        "derived": {},
+    }
+    for path, value in VALUES.items():
+        module, key = path.split(".")
+        cp[module][key] = value
+    return cp
+
+
+def _typed_namespace() -> dict:
+    cp = {module: cp_state.typed_module(module, block) for module, block in _plain_namespace().items()}
+    cp["derived"] = {}
+    return cp
+
+
+def legacy_ensure() -> dict:
+    """cp_ensure() before typed modules (dict blocks, setdefault per module)."""
+    cp = st.session_state.setdefault("cp", {})
+    cp.setdefault("qualifiers", {})
+    for module, key in (("setting_cost", "monthly_cost"), ("income", "income_total"),
+                        ("expenses", "other_monthly_total"), ("caregiver", "caregiver_cost"),
+                        ("benefits", "benefits_total"), ("home", "sale_price"),
+                        ("liquidity", "liquidity_total"), ("home_mods", "mods_monthly_total"),
+                        ("assets", "assets_total_effective")):
+        cp.setdefault(module, {key: 0})
+    cp.setdefault("derived", {})
+    return cp
+
+
+def legacy_derive() -> dict:
+    """derive() before typed modules: every input re-split and walked via cp_get,
+    each cp_get/cp_set re-running cp_ensure()."""
+
+    def split(path: str) -> tuple:
+        return tuple([p for p in path.replace("[", ".").replace("]", "").split(".") if p])
+
+    def get(path: str, default=None):
+        cur = legacy_ensure()
+        for part in split(path):
+            if isinstance(cur, dict) and part in cur:
+                cur = cur[part]
+            else:
+                return default
+        return cur
+
+    legacy_ensure()
+    derived = cp_state.compute_derived(
+        {name: cp_state._to_num(get(path, 0)) for name, path in cp_state.DERIVE_INPUTS.items()}
+    )
+    legacy_ensure()["derived"] = derived
+    return derived
+
+
+def _allocated(factory, count: int = 1000) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sessions
+    return (after - before) / count
+
+
+def main() -> int:
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+    number = 20_000
+    st.session_state["cp"] = _plain_namespace()
+    before = min(timeit.repeat(legacy_derive, number=number, repeat=5)) / number
+    expected = legacy_derive()
+
+    st.session_state["cp"] = _typed_namespace()
+    after = min(timeit.repeat(cp_state.derive, number=number, repeat=5)) / number
+    same = expected == cp_state.derive()
+
+    plain_bytes = _allocated(_plain_namespace)
+    typed_bytes = _allocated(_typed_namespace)
+    print(f"derive(), dict + cp_get:        {before * 1e6:6.1f} us")
+    print(f"derive(), typed modules:        {after * 1e6:6.1f} us ({before / after:.1f}x)")
+    print(f"namespace, plain dicts:         {plain_bytes:8.0f} bytes/session")
+    print(f"namespace, typed modules:       {typed_bytes:8.0f} bytes/session")
+    print(f"results agree:                  {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+bench_cp_wizard.py - first-visit load time of each cost planner step module,
+cold vs after the background preloader warmed it. Each measurement runs in a
+fresh interpreter that has already imported what app.py imports
+(registry.BASELINE_IMPORTS); the page body runs in Streamlit bare mode.
+
+    python3 tools/bench_cp_wizard.py [--runs 3]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from senior_nav.cost_planner.wizard import STEPS
+from senior_nav.runtime.registry import BASELINE_IMPORTS
+
+PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+for name in {baseline!r}:
+    __import__(name)
+import streamlit as st
+st.empty()  # bare mode's one-time "is this a REPL?" stack walk, not paid by the app
+from senior_nav.cost_planner import wizard
+step = wizard.STEPS[{index}]
+if {preload}:
+    wizard.PRELOADER.schedule({index} - 1)
+    wizard.PRELOADER.wait()
+start = time.perf_counter()
+try:
+    wizard.load_step_module(step)
+except Exception:
+    pass
+print(json.dumps((time.perf_counter() - start) * 1e3))
+"""
+
+
+def first_load_ms(index: int, preload: bool, runs: int) -> float:
+    code = PROBE.format(root=str(ROOT), baseline=BASELINE_IMPORTS, index=index, preload=preload)
+    env = dict(os.environ, STREAMLIT_LOGGER_LEVEL="critical", SN_SESSION_DB="off")
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=ROOT, env=env)
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+    print(f"{'step':<20} {'module':<40} {'cold ms':>8} {'preloaded ms':>13}")
+    seen = set()
+    for index, step in enumerate(STEPS):
+        if index == 0 or step.path in seen:
+            continue  # the first step has nothing before it; repeated paths are cache hits
+        seen.add(step.path)
+        cold = first_load_ms(index, False, args.runs)
+        warm = first_load_ms(index, True, args.runs)
+        print(f"{step.key:<20} {step.path:<40} {cold:8.1f} {warm:13.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
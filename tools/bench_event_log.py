@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+bench_event_log.py - memory and append time of --events audiencing_set
+events in one session: the previous list of deep-copied snapshots vs the
+bounded, delta-encoded EventLog.
+
+    python3 tools/bench_event_log.py [--events 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import random
+import sys
+import time
+import tracemalloc
+from copy import deepcopy
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from senior_nav.runtime.events import EventLog
+
+KEYS = ("is_veteran", "has_partner", "owns_home", "on_medicaid", "urgent")
+
+
+def snapshots(n: int, seed: int = 3):
+    rng = random.Random(seed)
+    quals = {key: False for key in KEYS}
+    for i in range(n):
+        quals[rng.choice(KEYS)] = rng.random() < 0.5
+        yield {
+            "entry": "self",
+            "qualifiers": dict(quals),
+            "route": {"next": "pfma" if quals["urgent"] else "contextual_welcome",
+                      "meta": {"reasons": ["urgent_case" if quals["urgent"] else "entry_self"],
+                               "urgent_feature_enabled": True}},
+            "people": {"recipient_name": "Pat", "proxy_name": "Sam"},
+            "sanitized": {},
+            "visibility": {"partner": quals["has_partner"], "home": quals["owns_home"], "veteran": quals["is_veteran"]},
+            "flags": {"medicaid": quals["on_medicaid"], "urgent": quals["urgent"]},
+        }
+
+
+def measure(label: str, append, n: int) -> None:
+    data = list(snapshots(n))
+    start = time.perf_counter()
+    append(data)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    holder = append(data)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed * 1e6 / n:7.1f} us/append   {retained / 1024:9.0f} KiB retained")
+    del holder
+
+
+def legacy(data):
+    log = []
+    for snap in data:
+        log.append({"event": "audiencing_set", "snapshot": deepcopy(snap)})
+    return log
+
+
+def ring(data):
+    log = EventLog()
+    for snap in data:
+        log.append("audiencing_set", snap)
+    return log
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--events", type=int, default=10_000)
+    args = ap.parse_args()
+    measure("list + deepcopy (before)", legacy, args.events)
+    measure(f"EventLog ring ({EventLog().capacity})", ring, args.events)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
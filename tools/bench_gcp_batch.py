@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+bench_gcp_batch.py - throughput of evaluate_guided_care_batch vs a per-record loop.
+
+The loop is timed on a sample (default 100k records) and extrapolated, since
+looping over 1M records takes a while. "batch" includes encoding the raw
+answer strings; "batch (codes)" re-scores columns already stored as codes
+(the output of encode_batch), which is the nightly re-scoring path.
+
+    python3 tools/bench_gcp_batch.py --records 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from guided_care_plan.batch import SCORED_QUESTIONS, encode_batch
+from guided_care_plan import QUESTION_ORDER, evaluate_guided_care, evaluate_guided_care_batch, get_question_meta
+
+
+def _columns(count: int, seed: int) -> dict[str, list[object]]:
+    rng = random.Random(seed)
+    columns: dict[str, list[object]] = {}
+    for question_id in QUESTION_ORDER:
+        meta = get_question_meta(question_id)
+        values = [opt["value"] for opt in meta["options"]]
+        if meta.get("multi"):
+            choices = [[v for v in values if rng.random() < 0.3] for _ in range(256)]
+        else:
+            choices = values
+        columns[question_id] = [rng.choice(choices) for _ in range(count)]
+    return columns
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--loop-records", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    columns = _columns(args.records, args.seed)
+    audiencing = {"qualifiers": {"on_medicaid": False}}
+
+    loop_n = min(args.loop_records, args.records)
+    start = time.perf_counter()
+    for row in range(loop_n):
+        evaluate_guided_care({q: columns[q][row] for q in QUESTION_ORDER}, audiencing)
+    loop_rate = loop_n / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    evaluate_guided_care_batch(columns, audiencing)
+    batch_elapsed = time.perf_counter() - start
+    batch_rate = args.records / batch_elapsed
+
+    encoded = encode_batch(columns)
+    encoded = {question_id: encoded[question_id] for question_id in SCORED_QUESTIONS}
+    start = time.perf_counter()
+    evaluate_guided_care_batch(encoded, audiencing)
+    codes_rate = args.records / (time.perf_counter() - start)
+
+    print(f"records:       {args.records:,}")
+    print(f"loop:          {loop_rate:,.0f} records/s (sampled {loop_n:,})")
+    print(f"batch:         {batch_rate:,.0f} records/s ({batch_elapsed:.2f}s)")
+    print(f"batch (codes): {codes_rate:,.0f} records/s")
+    print(f"speedup:       {batch_rate / loop_rate:.1f}x raw, {codes_rate / loop_rate:.1f}x codes")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+bench_gcp_rules.py - per-call cost of GCP scoring before/after rule compilation.
+
+"before" is a verbatim copy of the dict-literal scorers that preceded
+guided_care_plan.rules; "after" is the compiled table lookup now used by the
+engine. Both are checked for identical results before timing.
+
+    python3 tools/bench_gcp_rules.py
+"""
+from __future__ import annotations
+
+import itertools
+import pathlib
+import sys
+import timeit
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from guided_care_plan import evaluate_guided_care
+from guided_care_plan.engine import _score_daily_life, _score_health_safety
+from guided_care_plan.state import labels
+
+
+def legacy_score_daily_life(answers):
+    score = 0
+    score_map = {
+        "adl_help": {"0-1": 0, "2-3": 1, "4-5": 2, "6+": 3},
+        "med_mgmt": {"simple": 0, "several": 1, "complex": 3},
+        "caregiver_support": {"24_7": 0, "most_days": 1, "few_days_week": 2, "none": 3},
+    }
+    for key, mapping in score_map.items():
+        score += mapping.get(answers.get(key, ""), 0)
+    return score
+
+
+def legacy_score_health_safety(answers):
+    score = 0
+    flags = []
+    falls = answers.get("falls", "none")
+    if falls == "recurrent":
+        score += 3
+        flags.append("falls")
+    elif falls == "one":
+        score += 1
+        flags.append("falls")
+    cognition_score = {"normal": 0, "mild": 1, "moderate": 2, "severe": 3}.get(answers.get("cognition", "normal"), 0)
+    score += cognition_score
+    if cognition_score >= 2:
+        flags.append("cognition")
+    raw_behaviors = answers.get("behavior_risks") or []
+    if isinstance(raw_behaviors, str):
+        raw_behaviors = [raw_behaviors]
+    behaviors = {item for item in raw_behaviors if item and item != "none"}
+    if not behaviors:
+        behavior_score = 0
+    elif {"wandering", "exit_seeking"} & behaviors:
+        behavior_score = 3
+    else:
+        behavior_score = 2
+    score += behavior_score
+    if behavior_score >= 2:
+        flags.append("behavior")
+    supervision_score = {"always": 0, "sometimes": 1, "rarely": 2, "never": 3}.get(
+        answers.get("supervision", "always"), 0
+    )
+    score += supervision_score
+    if supervision_score >= 2:
+        flags.append("supervision")
+    return score, flags
+
+
+SAMPLE = {
+    "caregiver_support": "few_days_week",
+    "adl_help": "4-5",
+    "cognition": "moderate",
+    "behavior_risks": ["agitation"],
+    "falls": "one",
+    "med_mgmt": "several",
+    "supervision": "rarely",
+    "chronic": ["diabetes"],
+}
+
+
+def _check_equivalence() -> None:
+    grid = {
+        "caregiver_support": ["none", "few_days_week", "most_days", "24_7", None],
+        "adl_help": ["0-1", "2-3", "4-5", "6+", None],
+        "cognition": ["normal", "mild", "moderate", "severe", None],
+        "behavior_risks": [[], ["none"], ["agitation"], ["wandering", "agitation"], ["exit_seeking"]],
+        "falls": ["none", "one", "recurrent", None],
+        "med_mgmt": ["simple", "several", "complex", None],
+        "supervision": ["always", "sometimes", "rarely", "never", None],
+    }
+    for combo in itertools.product(*grid.values()):
+        answers = dict(zip(grid, combo))
+        assert _score_daily_life(answers) == legacy_score_daily_life(answers), answers
+        new_score, new_flags = _score_health_safety(answers)
+        old_score, old_flags = legacy_score_health_safety(answers)
+        assert new_score == old_score and sorted(new_flags) == sorted(old_flags), answers
+
+
+def _per_call_us(stmt, number: int = 200_000) -> float:
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> int:
+    _check_equivalence()
+    before = _per_call_us(lambda: (legacy_score_daily_life(SAMPLE), legacy_score_health_safety(SAMPLE)))
+    # The engine reads the rule tables from one labels snapshot per evaluation.
+    current = labels()
+    daily, safety = current.daily_life_rules, current.health_safety_rules
+    after = _per_call_us(lambda: (_score_daily_life(SAMPLE, daily), _score_health_safety(SAMPLE, safety)))
+    full = _per_call_us(lambda: evaluate_guided_care(SAMPLE), number=50_000)
+    print(f"scoring before (dict literals): {before:.2f} us/call")
+    print(f"scoring after (compiled rules): {after:.2f} us/call")
+    print(f"evaluate_guided_care (after):   {full:.2f} us/call")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+bench_layout.py - per-rerun cost of app.py's pages guard and page lookups:
+the old recursive **/pages glob + Path.exists() vs. the cached layout index.
+
+    python3 tools/bench_layout.py
+"""
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+import timeit
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from senior_nav.runtime.layout import build_layout, project_layout
+
+
+def legacy_guard(page_paths: list) -> int:
+    roots = []
+    for d in pathlib.Path(".").glob("**/pages"):
+        sd = str(d.resolve()).replace("\\", "/").lower()
+        if not d.is_dir():
+            continue
+        if ("_graveyard" in sd) or ("/.venv/" in sd) or ("/.git/" in sd):
+            continue
+        if not any(d.rglob("*.py")):
+            continue
+        roots.append(d)
+    return len(roots) + sum(pathlib.Path(p).exists() for p in page_paths)
+
+
+def indexed_guard(page_paths: list) -> int:
+    layout = project_layout()
+    return len(layout.pages_dirs) + sum(layout.has_page(p) for p in page_paths)
+
+
+def main() -> int:
+    os.chdir(ROOT)
+    page_paths = sorted(build_layout(ROOT).page_files)[:40]
+    number = 50
+    legacy = min(timeit.repeat(lambda: legacy_guard(page_paths), number=number, repeat=3)) / number
+    build = min(timeit.repeat(lambda: build_layout(ROOT), number=number, repeat=3)) / number
+    indexed = min(timeit.repeat(lambda: indexed_guard(page_paths), number=number, repeat=3)) / number
+    print(f"glob + exists per rerun:   {legacy * 1e3:7.2f} ms")
+    print(f"index build (startup):     {build * 1e3:7.2f} ms")
+    print(f"index per rerun:           {indexed * 1e3:7.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+bench_preflight.py - per-rerun cost of the pages/ syntax preflight: compiling
+every file (the old _syntax_preflight) vs. the cached PreflightCache.
+
+    python3 tools/bench_preflight.py
+"""
+from __future__ import annotations
+
+import os
+import pathlib
+import sys
+import tempfile
+import timeit
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from senior_nav.runtime.preflight import PreflightCache
+
+
+def compile_all() -> int:
+    errors = 0
+    for path in pathlib.Path("pages").rglob("*.py"):
+        try:
+            compile(path.read_text(encoding="utf-8"), str(path), "exec", dont_inherit=True)
+        except SyntaxError:
+            errors += 1
+    return errors
+
+
+def main() -> int:
+    os.chdir(ROOT)
+    number = 20
+    full = min(timeit.repeat(compile_all, number=number, repeat=3)) / number
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = pathlib.Path(tmp) / "preflight.json"
+        cold_report = PreflightCache(manifest).check()
+        cache = PreflightCache(manifest)
+        warm = min(timeit.repeat(cache.check, number=number, repeat=3)) / number
+        report = cache.check()
+    print(f"page files:           {report.checked}")
+    print(f"compile every rerun:  {full * 1e3:7.2f} ms")
+    print(f"cached (cold start):  {cold_report.elapsed_ms:7.2f} ms ({cold_report.compiled} compiled)")
+    print(f"cached (warm rerun):  {warm * 1e3:7.2f} ms ({report.compiled} compiled)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+bench_sessions.py - session persistence load test: --sessions synthetic
+planner sessions (GCP answers, Cost Planner inputs, audiencing, PFMA) each
+click through --clicks reruns. Clicks arrive in short per-user bursts
+interleaved across sessions, and some reruns change nothing, as with
+navigation. Every rerun calls SessionStore.save(), as app.py does.
+
+Reports bytes per session (binary codec vs JSON vs pickle), encode/decode
+time, and write amplification: sqlite rows and bytes written per
+state-changing click under write-behind batching, compared with one row
+per click for write-through.
+
+    python3 tools/bench_sessions.py [--sessions 1000] [--clicks 20] [--seed 7]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import pathlib
+import pickle
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import cost_planner_shared as shared
+from senior_nav.runtime import sessions
+from senior_nav.runtime.content import load_json
+from senior_nav.runtime.packing import pack
+
+
+def _questions() -> Dict[str, List[str]]:
+    questions = load_json(sessions.LABELS_PATH)["questions"]
+    return {qid: [o["value"] for o in meta.get("options", ())] for qid, meta in questions.items()}
+
+
+def new_session(rng: random.Random, questions: Dict[str, List[str]], fields: List[str]) -> dict:
+    return {
+        "audiencing": {
+            "entry": rng.choice(["self", "loved_one"]),
+            "qualifiers": {
+                k: rng.random() < 0.3 for k in ("is_veteran", "has_partner", "owns_home", "on_medicaid", "urgent")
+            },
+        },
+        "gcp_answers": {},
+        "gcp": {},
+        "cost_planner": {
+            "mode": "estimate", "household": "single", "inputs": {},
+            "subtotals": {k: 0.0 for k in shared.SUBTOTAL_KEYS},
+            "monthly_total": 0.0, "net_out_of_pocket": 0.0, "assets": 0.0, "runway_months": None,
+            "decision_log": [], "expert_flags": [], "custom_line_items": [], "notes": "",
+            "_subtotals_synced": 1, "snapshot_for_crm": {},
+        },
+        "cp": {"mode": "exploring", "drawer_status": {}, "ui": {"progress": 0, "suggestions_shown": set()}},
+        "pfma": {"name": "", "phone": "", "best_time": "morning", "confirmed": {}},
+        "care_context": {"person_name": rng.choice(["Mom", "Dad", "Pat", "my aunt"]), "care_flags": {}},
+    }
+
+
+def click(rng: random.Random, state: dict, questions: Dict[str, List[str]], fields: List[str]) -> None:
+    roll = rng.random()
+    if roll < 0.35:
+        return  # navigation / re-render only
+    if roll < 0.65:
+        qid = rng.choice(list(questions))
+        options = questions[qid] or ["yes", "no"]
+        state["gcp_answers"][qid] = rng.choice(options)
+        state["gcp"] = {"recommended_setting": rng.choice(["home", "assisted", "memory"]),
+                        "intensity": rng.choice(["low", "med", "high"]), "scores": {"daily_life": rng.randint(0, 12)}}
+    elif roll < 0.9:
+        cp = state["cost_planner"]
+        amount = float(rng.choice([0, 45, 120, 250, 980, 3100, 5400])) + rng.choice([0.0, 0.5])
+        cp["inputs"][rng.choice(fields)] = amount
+        cp["monthly_total"] = sum(cp["inputs"].values())
+        cp["net_out_of_pocket"] = cp["monthly_total"]
+    else:
+        state["cp"]["ui"]["progress"] += 1
+        state["cp"]["drawer_status"][rng.choice(["housing", "care", "medical"])] = rng.choice(["in_progress", "done"])
+
+
+def _json_bytes(data: dict) -> int:
+    return len(json.dumps(data, default=lambda v: sorted(v) if isinstance(v, set) else str(v)).encode("utf-8"))
+
+
+def run(n_sessions: int, clicks: int, seed: int) -> None:
+    rng = random.Random(seed)
+    questions = _questions()
+    fields = list(shared.load_field_specs())
+    vocabulary = sessions.NAMESPACES + sessions.label_vocabulary() + sessions.EXTRA_VOCABULARY
+
+    states = {f"sid{n:05d}": new_session(rng, questions, fields) for n in range(n_sessions)}
+    # Interleaved bursts of 1-5 clicks per user.
+    schedule: List[str] = []
+    remaining = {token: clicks for token in states}
+    while remaining:
+        token = rng.choice(list(remaining))
+        burst = min(remaining[token], rng.randint(1, 5))
+        schedule.extend([token] * burst)
+        remaining[token] -= burst
+        if not remaining[token]:
+            del remaining[token]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = pathlib.Path(tmp) / "sessions.sqlite3"
+        store = sessions.SessionStore(db, vocabulary=vocabulary, background=False)
+        encode_us: List[float] = []
+        start = time.perf_counter()
+        for token in schedule:
+            state = states[token]
+            click(rng, state, questions, fields)
+            t0 = time.perf_counter()
+            data = sessions.snapshot(state)
+            store.save(token, data)
+            encode_us.append((time.perf_counter() - t0) * 1e6)
+        store.flush()
+        elapsed = time.perf_counter() - start
+        stats = store.stats
+
+        packed = [len(pack(sessions.snapshot(s), store.symbols)) for s in states.values()]
+        as_json = [_json_bytes(sessions.snapshot(s)) for s in states.values()]
+        pickled = [len(pickle.dumps(sessions.snapshot(s), protocol=pickle.HIGHEST_PROTOCOL)) for s in states.values()]
+        t0 = time.perf_counter()
+        for token in list(states)[:200]:
+            store.load(token)
+        decode_us = (time.perf_counter() - t0) * 1e6 / min(200, n_sessions)
+        store.close()
+        db_bytes = sum(p.stat().st_size for p in db.parent.glob("sessions.sqlite3*"))
+
+    changed = stats.saves - stats.unchanged - stats.failed
+    print(f"{n_sessions} sessions x {clicks} clicks = {stats.saves:,} saves in {elapsed:.2f} s")
+    print(f"bytes/session  binary {statistics.mean(packed):7.0f} (p95 {sorted(packed)[int(0.95 * len(packed))]:,})"
+          f"   json {statistics.mean(as_json):7.0f}   pickle {statistics.mean(pickled):7.0f}"
+          f"   -> {statistics.mean(as_json) / statistics.mean(packed):.1f}x smaller than JSON")
+    print(f"save (snapshot+encode+digest) p50 {statistics.median(encode_us):.0f} us, "
+          f"p95 {sorted(encode_us)[int(0.95 * len(encode_us))]:.0f} us; load {decode_us:.0f} us")
+    print(f"saves: {stats.unchanged:,} unchanged (skipped), {changed:,} changed, "
+          f"{stats.coalesced:,} coalesced in queue")
+    print(f"write-through: {changed:,} rows, {stats.queued_bytes:,} bytes")
+    print(f"write-behind:  {stats.rows_written:,} rows in {stats.transactions:,} transactions, "
+          f"{stats.bytes_written:,} bytes "
+          f"({stats.rows_written / max(1, changed):.2f} rows per changed save, "
+          f"{stats.bytes_written / max(1, stats.saves):.0f} bytes per click)")
+    print(f"database on disk: {db_bytes:,} bytes for {sum(packed):,} bytes of live session blobs")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessions", type=int, default=1000)
+    ap.add_argument("--clicks", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    logging.getLogger("streamlit").setLevel(logging.CRITICAL)
+    run(args.sessions, args.clicks, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
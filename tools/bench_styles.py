@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+bench_styles.py - CSS bytes sent per rerun for a typical page (app.py's
+global style.css + theme, the page re-calling inject_theme(), and the Cost
+Planner page theme): raw <style> blocks every time vs. the cached, minified,
+de-duplicated stylesheets.
+
+    python3 tools/bench_styles.py
+"""
+from __future__ import annotations
+
+import logging
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import streamlit as st
+
+from senior_nav.runtime import styles
+from ui.theme import theme_css
+
+import ui.cost_planner_template as cost_planner_template
+
+CAPTURED: list = []
+st.markdown = lambda body, **_: CAPTURED.append(body)  # count bytes, render nothing
+
+
+def page_css() -> str:
+    """The raw <style> block apply_cost_planner_theme() hands to inject_css()."""
+    raw: list = []
+    inject = cost_planner_template.inject_css
+    cost_planner_template.inject_css = raw.append
+    try:
+        cost_planner_template.apply_cost_planner_theme()
+    finally:
+        cost_planner_template.inject_css = inject
+    return raw[-1]
+
+
+def legacy_rerun(page: str) -> int:
+    global_css = (ROOT / "static" / "style.css").read_text(encoding="utf-8").strip()
+    blocks = [f"<style>{global_css}</style>", theme_css(), theme_css(), page]
+    return sum(len(b.encode("utf-8")) for b in blocks)
+
+
+def cached_rerun(page_raw: str) -> int:
+    CAPTURED.clear()
+    styles.begin_rerun()
+    styles.inject_stylesheet(styles.global_bundle([theme_css()]))
+    styles.inject_css(theme_css())
+    styles.inject_css(page_raw)
+    return sum(len(b.encode("utf-8")) for b in CAPTURED)
+
+
+def main() -> int:
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    page = page_css()
+    legacy_bytes = legacy_rerun(page)
+    cached_bytes = cached_rerun(page)
+    print(f"bytes per rerun: legacy {legacy_bytes:,}  cached {cached_bytes:,}  "
+          f"({100 * (1 - cached_bytes / legacy_bytes):.0f}% smaller)")
+    print(f"blocks per rerun: legacy 4  cached {len(CAPTURED)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
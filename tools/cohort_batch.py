@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+cohort_batch.py - score a referral export (CSV or JSONL) offline: audiencing
+route, Guided Care Plan outcome and Cost Planner gap per row, streamed to
+CSV or JSONL (by extension) without Streamlit. Input columns are listed in
+senior_nav/cohort.py.
+
+    python3 tools/cohort_batch.py referrals.csv scored.jsonl \
+        [--workers N] [--chunk-size 5000] [--setting-cost assisted=5200 ...]
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from senior_nav.cohort import CHUNK_SIZE, default_workers, run_cohort
+
+
+def setting_cost(text: str) -> tuple:
+    setting, _, amount = text.partition("=")
+    try:
+        return setting.strip(), float(amount)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected setting=amount, got {text!r}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("source", type=pathlib.Path)
+    ap.add_argument("dest", type=pathlib.Path)
+    ap.add_argument("--workers", type=int, default=default_workers(), help="0 scores in this process")
+    ap.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    ap.add_argument("--in-format", choices=("csv", "jsonl"))
+    ap.add_argument("--out-format", choices=("csv", "jsonl"))
+    ap.add_argument("--setting-cost", type=setting_cost, action="append", default=[],
+                    help="monthly cost for rows without monthly_cost, per recommended setting")
+    args = ap.parse_args()
+
+    stats = run_cohort(
+        args.source, args.dest,
+        workers=args.workers, chunk_size=args.chunk_size,
+        in_format=args.in_format, out_format=args.out_format,
+        setting_costs=dict(args.setting_cost),
+    )
+    cores = max(stats.workers, 1)
+    print(f"{stats.rows} rows in {stats.chunks} chunks, {stats.wall_s:.2f}s wall, {cores} core(s)")
+    print(f"  {stats.rows_per_s:10.0f} rows/s overall")
+    print(f"  {stats.rows_per_s / cores:10.0f} rows/s per core (wall)")
+    print(f"  {stats.rows_per_core_s:10.0f} rows/s per core (scoring CPU time)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+page_import_report.py - per-page first-visit import cost for the pages
+registered in app.py's INTENDED table. Each page's module-level imports are
+timed in a fresh interpreter (python -X importtime) on top of what app.py
+itself imports, slowest first.
+
+    python3 tools/page_import_report.py [--top N] [--json]
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from senior_nav.runtime.registry import import_costs, page_registry
+
+
+def intended_from_app(app_path: pathlib.Path) -> list:
+    """INTENDED from app.py without executing it."""
+    tree = ast.parse(app_path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "INTENDED" for t in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise SystemExit(f"INTENDED not found in {app_path}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--top", type=int, default=3, help="slowest imports listed per page")
+    ap.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = ap.parse_args()
+
+    registry = page_registry(intended_from_app(ROOT / "app.py"), ROOT)
+    costs = import_costs(registry)
+    if args.json:
+        print(json.dumps([
+            {"path": c.path, "total_ms": c.total_ms, "modules": dict(c.modules)} for c in costs
+        ], indent=2))
+        return 0
+    for cost in costs:
+        slowest = ", ".join(f"{name} {ms:.1f}" for name, ms in cost.modules[:args.top])
+        print(f"{cost.total_ms:8.1f} ms  {cost.path:<52} {slowest}")
+    if registry.missing:
+        print(f"\nmissing (not registered): {', '.join(registry.missing)}")
+    print(f"\n{len(costs)} pages, {sum(c.total_ms for c in costs):.0f} ms of imports if every page were visited cold")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
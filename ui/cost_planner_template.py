@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import Iterable, Optional, Tuple, Dict, Any
 import streamlit as st
 from ui.theme import inject_theme as _inject_base
+from senior_nav.runtime.styles import inject_css
 
 
 # -------------------------------------------------------------------
@@ -14,7 +15,7 @@ def apply_cost_planner_theme(
     ink: str = "var(--ink, #111418)",
     ink_muted: str = "var(--ink-muted, #6b7280)",
 ) -> None:
-    st.markdown(
+    inject_css(
         f"""
         <style>
           :root {{
@@ -57,8 +58,7 @@ def apply_cost_planner_theme(
           .sn-btn.primary {{ background: var(--brand); color: white; border: none; }}
           .sn-btn.ghost   {{ background: transparent; }}
         </style>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
 # -------------------------------------------------------------------
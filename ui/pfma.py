@@ -4,6 +4,8 @@ from typing import Any, Dict, Iterable, Optional, Callable
 
 import streamlit as st
 from ui.theme import inject_theme as _inject_base
+from senior_nav.core.flows import PFMA_FLOW, Flow
+from senior_nav.runtime.styles import inject_css
 
 
 # -----------------------------
@@ -15,7 +17,7 @@ def apply_pfma_theme(
     ink: str = "var(--ink, #111418)",
     ink_muted: str = "var(--ink-muted, #6b7280)",
 ) -> None:
-    st.markdown(
+    inject_css(
         f"""
         <style>
           :root {{
@@ -42,8 +44,7 @@ def apply_pfma_theme(
             margin:.25rem 0 0 0;
           }}
         </style>
-        """,
-        unsafe_allow_html=True,
+        """
     )
 
 # -----------------------------
@@ -63,16 +64,7 @@ DEFAULT_PFMA: Dict[str, Any] = {
 }
 
 # Default step order used by progress widget and go_to_step
-PFMA_STEPS = [
-    "personal_info",
-    "household_legal",
-    "benefits",
-    "care_needs",
-    "care_prefs",
-    "cost_plan",
-    "care_plan",
-    "booking",
-]
+PFMA_STEPS = list(PFMA_FLOW.keys)
 
 def ensure_pfma_state() -> Dict[str, Any]:
     """Ensure st.session_state['pfma'] exists and return it."""
@@ -119,36 +111,25 @@ def render_progress(
 ) -> None:
     """
     Accepts either an int step index or a string step key (e.g., "booking").
-    If 'steps' not provided, uses PFMA_STEPS.
+    If 'steps' not provided, uses the PFMA flow; keys outside it (e.g. the
+    "summary" page) count as past the last step.
     """
-    labels = list(steps) if steps is not None else list(PFMA_STEPS)
+    flow = PFMA_FLOW if steps is None else Flow("pfma_custom", [(key, key) for key in steps])
+    idx = flow.position(current)
 
-    # map current -> index
-    if isinstance(current, str):
-        try:
-            idx = labels.index(current)
-        except ValueError:
-            labels.append(current)
-            idx = len(labels) - 1
-    else:
-        try:
-            idx = int(current)
-        except Exception:
-            idx = 0
-
-    # total defaults to number of labels
     if total is None:
-        total = len(labels)
-
+        ratio = flow.progress(idx)
+        total = len(flow)
+    else:
+        ratio = max(0, min(idx, max(0, total))) / max(1, total)
     idx_clamped = max(0, min(idx, max(0, total)))
-    ratio = idx_clamped / max(1, total)
     st.progress(ratio)
 
     # label rail under the bar (bold up to idx)
     try:
         st.caption(" · ".join(
             [f"**{lbl}**" if i <= idx_clamped else str(lbl)
-             for i, lbl in enumerate(labels[:total])]
+             for i, lbl in enumerate(flow.titles[:total])]
         ))
     except Exception:
         pass
@@ -1,5 +1,8 @@
 import streamlit as st
 
+from senior_nav.runtime.profiler import profiled
+from senior_nav.runtime.styles import inject_css
+
 TOKENS = {
     "brand": "#0B5CD8",
     "paper": "#ffffff",
@@ -9,8 +12,8 @@ TOKENS = {
     "radius": "16px",
 }
 
-def inject_theme() -> None:
-    css = f"""
+def theme_css() -> str:
+    return f"""
     <style>
       :root {{
         --brand: {TOKENS["brand"]};
@@ -42,4 +45,9 @@ def inject_theme() -> None:
       .sn-hero p, .pfma-header p {{ color: var(--ink-muted); margin: 0; }}
     </style>
     """
-    st.markdown(css, unsafe_allow_html=True)
+
+
+@profiled()
+def inject_theme() -> None:
+    # Emitted once per rerun; a no-op when app.py's bundle already carries it.
+    inject_css(theme_css())